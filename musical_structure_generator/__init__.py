@@ -0,0 +1,117 @@
+"""
+Musical Structure Generator: notes, intervals and scales in Western 12-tone music, spelled enharmonically
+correctly, for generating things like hyperdiatonic tetrachord-based systems and mirror structures.
+
+Importing the package does no work. Every public name below is loaded from its module the first time
+we ask for it, so
+
+    import musical_structure_generator as msg
+    msg.interval('p4+')
+
+only imports tones_and_intervals, and NumPy only gets imported once we touch something that needs it,
+like msg.IntervalArray. See import_budget.py for how we keep an eye on this.
+"""
+
+
+import importlib
+
+
+# Public name -> the module (inside this package) it lives in
+_lazy_names = {
+    # tones_and_intervals
+    'geninterval': 'tones_and_intervals',
+    'diatonic_prototype': 'tones_and_intervals',
+    'major_scale_prototype': 'tones_and_intervals',
+    'use_diatonic_prototype': 'tones_and_intervals',
+    'interval': 'tones_and_intervals',
+    'sorted_interval_collection': 'tones_and_intervals',
+    'semitones_to_diasteps': 'tones_and_intervals',
+    'dereference_diasteps_output': 'tones_and_intervals',
+    'dereference_semitones': 'tones_and_intervals',
+    'degree_to_interval_number': 'tones_and_intervals',
+    'scale': 'tones_and_intervals',
+    'periodic_scale': 'tones_and_intervals',
+    'scale_rope': 'tones_and_intervals',
+    'pitch': 'tones_and_intervals',
+    'get_attrs': 'tones_and_intervals',
+    'harmonica_hole': 'tones_and_intervals',
+    'harmonica': 'tones_and_intervals',
+
+    # interval_arrays
+    'IntervalArray': 'interval_arrays',
+    'GenIntervalArray': 'interval_arrays',
+
+    # interval_parser
+    'interval_library': 'interval_parser',
+    'parse_interval_text': 'interval_parser',
+    'parse_interval_json': 'interval_parser',
+    'parse_interval_file': 'interval_parser',
+
+    # catalog
+    'scale_catalog': 'catalog',
+    'pitch_class_densities': 'catalog',
+
+    # scale_statistics
+    'step_statistics': 'scale_statistics',
+    'sliding_extreme': 'scale_statistics',
+
+    # tetrachords
+    'major_tetrachord': 'tetrachords',
+    'tetrachord_scale': 'tetrachords',
+    'tetrachord_stack': 'tetrachords',
+    'stack_tetrachords': 'tetrachords',
+
+    # tetrachord_search
+    'search_tetrachord_space': 'tetrachord_search',
+    'load_tetrachord_search': 'tetrachord_search',
+
+    # mirrors
+    'unnameable_pitch_error': 'mirrors',
+    'pitch_names': 'mirrors',
+    'pitches_from_names': 'mirrors',
+    'reflect': 'mirrors',
+    'mirror_chunks': 'mirrors',
+    'mirror_voices': 'mirrors',
+    'scale_pitches': 'mirrors',
+    'mirror_scale_voices': 'mirrors',
+
+    # exercises
+    'exercise_patterns': 'exercises',
+    'exercise': 'exercises',
+    'make_exercise': 'exercises',
+    'exercise_book': 'exercises',
+
+    # slonimsky
+    'equal_divisions': 'slonimsky',
+    'division_table': 'slonimsky',
+    'slonimsky_scale': 'slonimsky',
+    'slonimsky_pattern': 'slonimsky',
+    'thesaurus': 'slonimsky',
+
+    # enumeration
+    'scale_constraints': 'enumeration',
+    'enumerate_scales': 'enumeration',
+    'enumerate_scales_parallel': 'enumeration',
+}
+
+# Submodules we can also get at as attributes, like musical_structure_generator.instrumentation
+_lazy_modules = {'tones_and_intervals', 'interval_arrays', 'interval_parser', 'catalog', 'scale_statistics', 'enumeration', 'tetrachords', 'tetrachord_search', 'mirrors', 'exercises', 'slonimsky', 'instrumentation', 'import_budget'}
+
+__all__ = sorted(_lazy_names)
+
+
+def __getattr__(name):
+    if name in _lazy_names:
+        value = getattr(importlib.import_module('.' + _lazy_names[name], __name__), name)
+    elif name in _lazy_modules:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(name))
+
+    # Remember it, so we only come through here once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | _lazy_modules)
@@ -0,0 +1,237 @@
+"""
+Enumerate every scale that satisfies a set of constraints: which steps we may use, how wide a step may be,
+how many notes, how wide the scale may get, whether it has to keep going up, and what period it repeats at.
+
+We build scales one step at a time with a depth-first search, carrying along just a few integers about the
+partial scale (where we are in semitones and degrees, the lowest and highest notes so far, and a pitch class
+bit mask), so we can throw away a partial scale as soon as it can't lead anywhere. Only the scales that make it
+all the way get turned into scale objects, straight from their step codes.
+
+The search splits into shards deterministically: we number the partial scales at a fixed depth in the order the
+search meets them, and shard i of n only continues from the ones whose number is i mod n. So the shards don't
+overlap, together they cover everything, and enumerate_scales_parallel hands them out to a process pool.
+"""
+
+
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from . import tones_and_intervals
+from .tones_and_intervals import interval, scale, interval_string_to_step_code, root_step_code
+
+
+class scale_constraints:
+    """
+    The constraints for an enumeration, with the step alphabet worked out into plain integers once up front.
+    
+    step_alphabet           the steps we may use between consecutive notes (and as the continuation offset),
+                            as shorthand strings or intervals
+    min_notes, max_notes    how many notes the scale has (counting the root)
+    period                  if given, the continuation offset has to bring us from the last note to exactly this interval
+                            above the root, like 'p8+' for scales that repeat at the octave. Otherwise any step from the
+                            alphabet can be the continuation offset
+    max_step                no step (or continuation offset) wider than this, ignoring direction
+    max_span                no more than this many semitones (or this interval) between the lowest and highest notes.
+                            For a scale that only goes up, that's its scale_span
+    monotonic               every step has to go up
+    distinct_pitch_classes  no two notes of a scale in the same pitch class
+    spellable               every note has to have a name measured from the root (see absolute_scale_repr). We don't have
+                            doubly diminished or augmented intervals, so for example C Db Ebb is out
+    
+    All the scales we generate are rooted: the first interval is 'p1+', with degree 1.
+    """
+    
+    def __init__(self, step_alphabet, min_notes=1, max_notes=7, period=None, max_step=None, max_span=None,
+                 monotonic=True, distinct_pitch_classes=True, spellable=True):
+        
+        if min_notes < 1 or max_notes < min_notes:
+            raise ValueError('need 1 <= min_notes <= max_notes')
+        
+        self.min_notes = min_notes
+        self.max_notes = max_notes
+        self.monotonic = monotonic
+        self.distinct_pitch_classes = distinct_pitch_classes
+        self.spellable = spellable
+        self.block_size = tones_and_intervals.diatonic_prototype_to_use.compile()._block_size
+        
+        max_step_semitones = None if max_step is None else abs(semitones_and_degrees(max_step)[0])
+        self.max_span = None if max_span is None else abs(max_span if isinstance(max_span, int) else semitones_and_degrees(max_span)[0])
+        
+        # Each step as (code, semitones, degree change), in sort order so the enumeration always comes out the same way
+        steps = []
+        # (intervals compare and hash by width, so we dedupe the spellings as strings)
+        for step in sorted({interval(str(step))._interval: interval(str(step)) for step in step_alphabet}.values(), key=interval.sort_key):
+            num_semitones, degree_change = semitones_and_degrees(step)
+            if max_step_semitones is not None and abs(num_semitones) > max_step_semitones:
+                continue
+            steps.append((interval_string_to_step_code(str(step)), num_semitones, degree_change))
+        
+        # The continuation offset can be any step (it also has to obey max_step and monotonic)
+        self.continuation_steps = [step for step in steps if not monotonic or step[1] > 0]
+        self.continuation_by_size = {(num_semitones, degree_change): code for code, num_semitones, degree_change in self.continuation_steps}
+        
+        # Steps between notes also can't land on the same pitch class if we want distinct pitch classes
+        self.steps = [step for step in self.continuation_steps
+                      if not (distinct_pitch_classes and step[1] % self.block_size == 0)]
+        
+        if period is None:
+            self.period = None
+        else:
+            self.period = semitones_and_degrees(period)
+        
+        # The smallest continuation offset, in semitones and degrees, for pruning scales that only go up and have a period
+        self.smallest_continuation = min((step[1] for step in self.continuation_steps), default=0)
+        self.smallest_continuation_degrees = min((step[2] for step in self.continuation_steps), default=0)
+        
+        # Which (semitones, degree) positions above the root have names, filled in as we go
+        self._nameable_positions = {}
+    
+    
+    def nameable(self, num_semitones, degree):
+        """
+        Whether a note num_semitones above the root with the given degree has a name
+        """
+        
+        position = (num_semitones, degree)
+        if position not in self._nameable_positions:
+            try:
+                tones_and_intervals.dereference_semitones(num_semitones, tones_and_intervals.degree_to_interval_number(degree))
+                self._nameable_positions[position] = True
+            except ValueError:
+                self._nameable_positions[position] = False
+        
+        return self._nameable_positions[position]
+
+
+def semitones_and_degrees(some_interval):
+    """
+    The signed number of semitones and the signed number of degrees an interval (or shorthand string) moves us,
+    so 'p3+' is (4, 2) and 'd2-' is (-1, -1)
+    """
+    
+    if isinstance(some_interval, str):
+        some_interval = interval(some_interval)
+    sign = some_interval._interval_sign
+    return sign*len(some_interval), sign*(some_interval._interval_number - 1)
+
+
+def enumerate_scales(step_alphabet, min_notes=1, max_notes=7, period=None, max_step=None, max_span=None,
+                     monotonic=True, distinct_pitch_classes=True, spellable=True, shard=(0, 1), shard_depth=3):
+    """
+    Yield every rooted scale with the given constraints (see scale_constraints), one at a time, as scale objects
+    with their degree lists worked out from the steps. For example, every spelled heptatonic scale that repeats
+    at the octave, with steps no wider than a minor third:
+    
+        enumerate_scales(['d2+', 'p2+', 'a2+', 'd3+'], 7, 7, period='p8+')
+    
+    shard = (i, n) only yields the i-th of n disjoint pieces of the search (see the top of this file). shard_depth is
+    how many notes the partial scales we split on have.
+    """
+    
+    constraints = scale_constraints(step_alphabet, min_notes, max_notes, period, max_step, max_span,
+                                    monotonic, distinct_pitch_classes, spellable)
+    shard_index, shard_count = shard
+    if not 0 <= shard_index < shard_count:
+        raise ValueError('shard must be (index, count) with 0 <= index < count')
+    
+    # Partial scales at shard_depth notes get numbered in this counter
+    partial_scale_count = [0]
+    
+    def finished_scales(codes, degrees, num_semitones, degree):
+        """
+        Every way to finish the partial scale with a continuation offset
+        """
+        
+        if constraints.period is None:
+            for code, step_semitones, degree_change in constraints.continuation_steps:
+                yield scale._from_codes(codes, code, degrees + [degree + degree_change])
+            return
+        
+        # With a period, there's exactly one continuation offset that works, if it's in the alphabet
+        period_semitones, period_degrees = constraints.period
+        code = constraints.continuation_by_size.get((period_semitones - num_semitones, period_degrees - (degree - 1)))
+        if code is not None:
+            yield scale._from_codes(codes, code, degrees + [1 + period_degrees])
+    
+    def search(codes, degrees, num_semitones, degree, mask, low, high):
+        num_notes = len(codes)
+        
+        # Split the search into shards here. Scales with fewer notes than that only come out of the first shard,
+        # so we don't repeat them
+        if num_notes == shard_depth:
+            partial_scale_count[0] += 1
+            if (partial_scale_count[0] - 1) % shard_count != shard_index:
+                return
+        
+        if constraints.min_notes <= num_notes and (num_notes >= shard_depth or shard_index == 0):
+            yield from finished_scales(codes, degrees, num_semitones, degree)
+        
+        if num_notes == constraints.max_notes:
+            return
+        
+        for code, step_semitones, degree_change in constraints.steps:
+            new_semitones = num_semitones + step_semitones
+            new_degree = degree + degree_change
+            
+            # A scale that only goes up has to leave room to get to the period with the continuation offset
+            if constraints.monotonic and constraints.period is not None:
+                period_semitones, period_degrees = constraints.period
+                if (period_semitones - new_semitones < constraints.smallest_continuation
+                        or period_degrees - (new_degree - 1) < constraints.smallest_continuation_degrees):
+                    continue
+            
+            new_low = min(low, new_semitones)
+            new_high = max(high, new_semitones)
+            if constraints.max_span is not None and new_high - new_low > constraints.max_span:
+                continue
+            
+            pitch_class_bit = 1 << (new_semitones % constraints.block_size)
+            if constraints.distinct_pitch_classes and mask & pitch_class_bit:
+                continue
+            
+            if constraints.spellable and not constraints.nameable(new_semitones, new_degree):
+                continue
+            
+            yield from search(codes + [code], degrees + [new_degree], new_semitones, new_degree, mask | pitch_class_bit, new_low, new_high)
+    
+    yield from search([root_step_code], [1], 0, 1, 1, 0, 0)
+
+
+def _enumerate_shard(arguments):
+    keyword_arguments, shard = arguments
+    return list(enumerate_scales(shard=shard, **keyword_arguments))
+
+
+def enumerate_scales_parallel(step_alphabet, min_notes=1, max_notes=7, period=None, max_step=None, max_span=None,
+                              monotonic=True, distinct_pitch_classes=True, spellable=True, processes=None, shard_count=None,
+                              shard_depth=3):
+    """
+    Same as enumerate_scales, but split into shard_count shards (four per process by default) that run in a pool of
+    processes. We yield the scales of shard 0, then shard 1 and so on, so the order is always the same for the same
+    shard_count, though it isn't the order enumerate_scales uses. Each worker sends its shard back as one list, and we
+    only keep two shards per process in flight at once (submitted, running or finished but waiting for their turn), so
+    only that many shards are ever held in memory.
+    """
+    
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if shard_count is None:
+        shard_count = 4*processes
+    
+    keyword_arguments = dict(step_alphabet=[str(step) for step in step_alphabet], min_notes=min_notes, max_notes=max_notes,
+                             period=None if period is None else str(period), max_step=None if max_step is None else str(max_step),
+                             max_span=max_span if max_span is None or isinstance(max_span, int) else str(max_span),
+                             monotonic=monotonic, distinct_pitch_classes=distinct_pitch_classes, spellable=spellable,
+                             shard_depth=shard_depth)
+    
+    max_in_flight = 2*processes
+    
+    with ProcessPoolExecutor(processes) as executor:
+        in_flight = collections.deque()
+        next_shard = 0
+        while next_shard < shard_count or in_flight:
+            while next_shard < shard_count and len(in_flight) < max_in_flight:
+                in_flight.append(executor.submit(_enumerate_shard, (keyword_arguments, (next_shard, shard_count))))
+                next_shard += 1
+            yield from in_flight.popleft().result()
@@ -0,0 +1,183 @@
+"""
+Exercise books: run patterns like diatonic thirds, 1-2-3-1 or enclosures through every mode of a scale in every
+key, and hand them out one exercise at a time.
+
+A pattern is a list of notes to play from each note of the scale, counted in scale steps from it. So thirds are
+(0, 2), fourths (0, 3) and 1-2-3-1 is (0, 1, 2, 0). A note can also be a pair (scale steps, semitones), for a
+chromatic note that takes its letter name from the scale note that many steps away, but sits that many semitones
+from the note we started on. So the enclosure (1, (-1, -1), 0) plays the scale note above, then a half step below,
+then the note itself: E C# D on D in C major, and C A# B on B. Each pattern has an ascending and a descending version,
+since going down we usually play thirds as (0, -2) rather than (0, 2).
+
+exercise_book is a generator that builds each exercise when we ask for it, so a book of every mode in every key
+with every pattern (hundreds of thousands of bars) never sits in memory all at once, and a MIDI or LilyPond
+writer can pull bars out of it as it goes. We work out the notes of each exercise with array operations (see
+mirrors.scale_pitches), and name them like mirrors.pitch_names does.
+"""
+
+
+import numbers
+
+import numpy as np
+
+from .interval_arrays import IntervalArray
+from .mirrors import as_pitches, pitch_names, scale_pitches, unnameable_pitch_error
+
+
+# Pattern name -> (ascending version, descending version)
+exercise_patterns = {
+    'scale': ((0,), (0,)),
+    'thirds': ((0, 2), (0, -2)),
+    'fourths': ((0, 3), (0, -3)),
+    'triads': ((0, 2, 4), (0, -2, -4)),
+    '1-2-3-1': ((0, 1, 2, 0), (0, -1, -2, 0)),
+    '1-2-3-5': ((0, 1, 2, 4), (0, -1, -2, -4)),
+    'diatonic enclosures': ((1, -1, 0), (1, -1, 0)),
+    'enclosures': ((1, (-1, -1), 0), (1, (-1, -1), 0)),
+}
+
+# One tonic in each key, around middle C
+twelve_keys = ["c'", "des'", "d'", "ees'", "e'", "f'", "ges'", "g'", "aes'", "a'", "bes'", "b'"]
+
+
+def normalize_pattern(pattern):
+    """
+    The notes of a pattern as (scale steps, semitones) pairs, with semitones None for plain scale notes. Any kind of
+    integer will do (so NumPy integers are fine), and normalizing twice changes nothing. Raise ValueError for
+    anything else.
+    """
+    
+    normalized = []
+    for note in pattern:
+        if isinstance(note, numbers.Integral):
+            normalized.append((int(note), None))
+        elif (isinstance(note, (tuple, list)) and len(note) == 2 and isinstance(note[0], numbers.Integral)
+              and (note[1] is None or isinstance(note[1], numbers.Integral))):
+            normalized.append((int(note[0]), None if note[1] is None else int(note[1])))
+        else:
+            raise ValueError('a pattern note must be a number of scale steps, or a pair (scale steps, semitones), not '
+                             + repr(note))
+    
+    if not normalized:
+        raise ValueError('a pattern needs at least one note')
+    
+    return tuple(normalized)
+
+
+def pattern_pitches(scale, pattern, starts):
+    """
+    Play pattern from each of the scale's notes with the given indices (numbered like in scale.absolute_position),
+    one after the other. Return the notes as an IntervalArray measured from the root.
+    """
+    
+    pattern = normalize_pattern(pattern)
+    starts = np.asarray(starts, dtype=np.int64)
+    scale_steps = np.array([steps for steps, semitones in pattern])
+    is_chromatic = np.array([semitones is not None for steps, semitones in pattern])
+    chromatic_semitones = np.array([semitones or 0 for steps, semitones in pattern])
+    
+    notes = scale_pitches(scale, (starts[:, None] + scale_steps).ravel())
+    if not is_chromatic.any():
+        return notes
+    
+    # Chromatic notes keep the letter name of their scale note, but get their semitones from the note we started on
+    start_semitones = np.repeat(scale_pitches(scale, starts).semitones, len(pattern))
+    semitones = np.where(np.tile(is_chromatic, len(starts)), start_semitones + np.tile(chromatic_semitones, len(starts)),
+                         notes.semitones)
+    return IntervalArray(notes.steps, semitones)
+
+
+class exercise:
+    """
+    One exercise: a pattern played up num_octaves octaves of a mode (from its tonic) and back down.
+    
+    scale           the mode
+    mode_number     which mode of the scale we started with it is (see scale.get_mode)
+    tonic           the LilyPond name of the tonic
+    pattern_name    the name of the pattern (a key of exercise_patterns, or whatever we called it)
+    notes           the LilyPond names of the notes
+    """
+    
+    def __init__(self, scale, mode_number, tonic, pattern_name, notes):
+        self.scale = scale
+        self.mode_number = mode_number
+        self.tonic = tonic
+        self.pattern_name = pattern_name
+        self.notes = notes
+    
+    
+    def __repr__(self):
+        return ('exercise(' + repr(self.pattern_name) + ', mode ' + str(self.mode_number) + ' on ' + self.tonic
+                + ', ' + str(len(self.notes)) + ' notes)')
+    
+    
+    def bars(self, notes_per_bar=8):
+        """
+        Yield the notes notes_per_bar at a time. The last bar can be short.
+        """
+        for i in range(0, len(self.notes), notes_per_bar):
+            yield self.notes[i:i + notes_per_bar]
+
+
+def make_exercise(scale, tonic, pattern_name, pattern=None, num_octaves=1, mode_number=1):
+    """
+    Play a pattern (by default exercise_patterns[pattern_name]) up the scale from tonic and back down. On the way up
+    we start the pattern from every note that keeps it within num_octaves octaves (well, periods of the scale) above
+    the tonic, and on the way down from every note that keeps it from going below the tonic. Raise ValueError if some
+    note needs more than two sharps or flats (an unnameable_pitch_error), if the pattern isn't one, or if it reaches
+    further than num_octaves octaves, so that there's nowhere to start it from.
+    """
+    
+    ascending, descending = exercise_patterns[pattern_name] if pattern is None else pattern
+    ascending = normalize_pattern(ascending)
+    descending = normalize_pattern(descending)
+    highest = max(steps for steps, semitones in ascending)
+    lowest = min(steps for steps, semitones in descending)
+    
+    top = len(scale)*num_octaves
+    if highest > top or -lowest > top:
+        raise ValueError('pattern %s reaches %d scale steps up and %d down, which doesn\'t fit in %d octave(s) of a %d note '
+                         'scale' % (pattern_name, max(highest, 0), max(-lowest, 0), num_octaves, len(scale)))
+    starts_up = range(top - max(highest, 0) + 1)
+    starts_down = range(top, max(-lowest, 0) - 1, -1)
+    # Don't play the turn twice, like the top note of a plain scale
+    if ascending == descending and starts_up and starts_down and starts_up[-1] == starts_down[0]:
+        starts_down = starts_down[1:]
+    
+    tonic_pitch = as_pitches(tonic)
+    notes = (pitch_names(tonic_pitch + pattern_pitches(scale, ascending, starts_up))
+             + pitch_names(tonic_pitch + pattern_pitches(scale, descending, starts_down)))
+    
+    return exercise(scale, mode_number, tonic, pattern_name, notes)
+
+
+def exercise_book(scales, tonics=twelve_keys, patterns=None, num_octaves=1):
+    """
+    Yield an exercise for every mode of every scale in scales, in every key in tonics, with every pattern (by default
+    every one in exercise_patterns): first all the patterns on mode 1 in the first key, then mode 1 in the next key and
+    so on. scales can be any iterable of scales, generators included, or just one scale (anything with a get_mode, so
+    periodic_scales and scale_ropes too). Exercises that have a note we can't name (more than two sharps or flats, like
+    some modes of harmonic minor on gis') get left out, but a bad pattern still raises its ValueError. Nothing is
+    worked out until we ask for it, so
+    
+        for exercise in exercise_book(c_ionian):
+            for bar in exercise.bars():
+                ...
+    
+    only ever holds one exercise.
+    """
+    
+    if hasattr(scales, 'get_mode'):
+        scales = [scales]
+    if patterns is None:
+        patterns = exercise_patterns
+    
+    for scale in scales:
+        for mode_number in range(1, len(scale) + 1):
+            mode = scale.get_mode(mode_number)
+            for tonic in tonics:
+                for pattern_name, pattern in patterns.items():
+                    try:
+                        yield make_exercise(mode, tonic, pattern_name, pattern, num_octaves, mode_number)
+                    except unnameable_pitch_error:
+                        continue
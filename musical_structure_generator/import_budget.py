@@ -0,0 +1,82 @@
+"""
+Measure how long it takes to import the package, and check it against our budget.
+
+Worker processes and command line tools import this package every time they start, so importing it has
+to stay cheap: no work at import time, and no heavy dependencies like NumPy until something needs them.
+Run
+
+    python -m musical_structure_generator.import_budget
+
+to measure it. It imports each module in a fresh interpreter (so nothing is already cached), reports the
+time, and exits with an error if anything goes over budget or pulls in a heavy dependency it shouldn't.
+"""
+
+
+import subprocess
+import sys
+
+
+# How long each import may take, in seconds, measured in a fresh interpreter
+IMPORT_TIME_BUDGET_SECONDS = {
+    'musical_structure_generator': 0.02,
+    'musical_structure_generator.tones_and_intervals': 0.05,
+}
+
+# Modules that importing the above must not drag in
+HEAVY_DEPENDENCIES = ('numpy', 'pandas')
+
+
+# What we run in the fresh interpreter. It prints the import time and any heavy dependencies that got loaded.
+_measurement_script = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(' '.join(name for name in {heavy_dependencies!r} if name in sys.modules))
+'''
+
+
+def measure_import_time(module, repeats=5):
+    """
+    Import module in a fresh interpreter repeats times. Return the fastest time in seconds, and the list
+    of heavy dependencies that the import loaded.
+    """
+
+    times = []
+    for repeat in range(repeats):
+        output = subprocess.run([sys.executable, '-c', _measurement_script.format(module=module, heavy_dependencies=HEAVY_DEPENDENCIES)],
+                                capture_output=True, text=True, check=True).stdout.splitlines()
+        times.append(float(output[0]))
+        loaded_dependencies = output[1].split() if len(output) > 1 else []
+
+    return min(times), loaded_dependencies
+
+
+def check_import_budget(repeats=5):
+    """
+    Measure every module in IMPORT_TIME_BUDGET_SECONDS. Return a list of problems (empty if everything is fine),
+    along with a report of what we measured.
+    """
+
+    problems = []
+    report = []
+
+    for module, budget in IMPORT_TIME_BUDGET_SECONDS.items():
+        elapsed, loaded_dependencies = measure_import_time(module, repeats)
+        report.append(module + ': ' + str(round(elapsed*1000, 2)) + ' ms (budget ' + str(round(budget*1000, 2)) + ' ms)')
+
+        if elapsed > budget:
+            problems.append(module + ' took ' + str(round(elapsed*1000, 2)) + ' ms to import, over its budget of ' + str(round(budget*1000, 2)) + ' ms')
+        if loaded_dependencies:
+            problems.append(module + ' imports ' + ', '.join(loaded_dependencies) + ' at import time')
+
+    return problems, report
+
+
+if __name__ == '__main__':
+    problems, report = check_import_budget()
+    print('\n'.join(report))
+    if problems:
+        print('\n'.join(problems), file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,151 @@
+"""
+Opt-in counters and timers for the hot paths in tones_and_intervals.py (interval construction, interval
+addition, dereferencing, scale building and the caches behind them).
+
+Everything is off by default. The hot paths check the enabled flag before doing any bookkeeping, so when
+instrumentation is off, all it costs is that one check:
+
+    from musical_structure_generator import instrumentation
+    instrumentation.enable()
+    ... build a bunch of scales ...
+    instrumentation.snapshot()
+    instrumentation.dump_json('stats.json')
+
+Caches count their hits and misses as counters named 'something.hits' and 'something.misses', and the snapshot
+works out the hit rate for each of them.
+
+The old debug prints (the steps of absolute_scale_repr, the pitches of each harmonica hole) go through
+debug_print, which only prints when verbose is turned on.
+"""
+
+
+import functools
+import time
+
+
+# Whether to record counters and timers
+enabled = False
+
+# Whether to print debugging output
+verbose = False
+
+# Counter name -> count
+counters = {}
+
+# Timer name -> [number of calls, total seconds]
+timers = {}
+
+
+def enable(with_debug_output=False):
+    """
+    Start recording. If with_debug_output is True, also turn on the debugging prints.
+    """
+
+    global enabled, verbose
+    enabled = True
+    verbose = with_debug_output
+
+
+def disable():
+    """
+    Stop recording and printing. What we've recorded so far stays around until reset().
+    """
+
+    global enabled, verbose
+    enabled = False
+    verbose = False
+
+
+def reset():
+    """
+    Throw away everything recorded so far
+    """
+
+    counters.clear()
+    timers.clear()
+
+
+def count(name, amount=1):
+    """
+    Add to a counter. Callers on hot paths should check instrumentation.enabled first, so they don't even
+    pay for the function call when we're not recording.
+    """
+
+    counters[name] = counters.get(name, 0) + amount
+
+
+def timed(name):
+    """
+    Decorator that records the number of calls and total time of a function under the given timer name,
+    but only while instrumentation is enabled.
+    """
+
+    def decorator(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timer = timers.setdefault(name, [0, 0.0])
+                timer[0] += 1
+                timer[1] += time.perf_counter() - start
+
+        return wrapper
+
+    return decorator
+
+
+def debug_print(*args):
+    """
+    print(), but only when verbose is on
+    """
+
+    if verbose:
+        print(*args)
+
+
+def snapshot():
+    """
+    Return everything recorded so far as a plain dictionary:
+
+        {'counters': {'interval.additions': 1200, ...},
+         'timers': {'scale.build': {'calls': 40, 'total_seconds': 0.002, 'mean_seconds': 0.00005}, ...},
+         'cache_hit_rates': {'interval_intern': 0.98, ...}}
+    """
+
+    timer_stats = {}
+    for name, (calls, total_seconds) in sorted(timers.items()):
+        timer_stats[name] = {'calls': calls, 'total_seconds': total_seconds, 'mean_seconds': total_seconds/calls if calls else 0.0}
+
+    cache_names = sorted({name.rsplit('.', 1)[0] for name in counters if name.endswith(('.hits', '.misses'))})
+    cache_hit_rates = {}
+    for cache_name in cache_names:
+        hits = counters.get(cache_name + '.hits', 0)
+        misses = counters.get(cache_name + '.misses', 0)
+        cache_hit_rates[cache_name] = hits/(hits + misses)
+
+    return {'counters': dict(sorted(counters.items())), 'timers': timer_stats, 'cache_hit_rates': cache_hit_rates}
+
+
+def dump_json(destination=None):
+    """
+    Write the snapshot as JSON to a file path or an open file. With no destination, return the JSON string.
+    """
+
+    # json is only needed here, so we don't pay for importing it until someone asks for a dump
+    import json
+
+    text = json.dumps(snapshot(), indent=2)
+
+    if destination is None:
+        return text
+    if hasattr(destination, 'write'):
+        destination.write(text)
+    else:
+        with open(destination, 'w') as destination_file:
+            destination_file.write(text)
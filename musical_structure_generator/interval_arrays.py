@@ -0,0 +1,520 @@
+"""
+Vectorized versions of the interval classes in tones_and_intervals.py, for when we need to push
+millions of intervals through at once (transposing or analyzing a whole corpus, say).
+
+The interval and geninterval classes do their arithmetic one object at a time. Here we store whole
+arrays of intervals as pairs of integer NumPy arrays and do everything with array operations instead.
+"""
+
+
+import numpy as np
+
+from . import tones_and_intervals
+from .tones_and_intervals import geninterval, interval
+
+# Interval type letters indexed by chromatic adjustment + 1 (so -1 is 'd', 0 is 'p' and 1 is 'a')
+interval_types_by_adjustment = np.array(['d', 'p', 'a'])
+
+
+class IntervalArray:
+    """
+    An array of intervals on the (diatonic steps, semitones) lattice.
+
+    Every interval is a pair of signed integers: how many diatonic steps it moves (letter names), and
+    how many semi-tones it moves. So
+
+        p1+ = (0, 0)    p4+ = (3, 5)    a5- = (-4, -8)    d8+ = (7, 11)    p9+ = (8, 14)
+
+    The step count carries the spelling, which is the whole point. Adding p2+ to p2+ is (1, 2) + (1, 2) = (2, 4),
+    which can only be a p3+, never a d4+. So unlike interval.__add__, addition here is unambiguous and we never
+    need semitones_to_diasteps to disambiguate anything. It's just adding integer arrays.
+
+    The direction of an interval is the sign of its step count, or the sign of its semi-tone count for unisons
+    (so a1- is (0, -1)). That means p1- and p1+ are the same point on the lattice, and we write it as p1+.
+
+    Names come from the active diatonic prototype (see use_diatonic_prototype), just like for the interval class.
+    Throughout the examples here we use the major scale prototype, with 7 steps and 12 semi-tones to the octave.
+
+    Not every point on the lattice has a name in our system. For example, d2+ + d2+ = (2, 2) is a doubly
+    diminished third. Arithmetic works fine on these, but to_strings() and to_intervals() raise a ValueError if
+    asked to name them. Use is_nameable() to find them first.
+    """
+
+
+    def __init__(self, steps, semitones):
+        """
+        steps and semitones are equal-length integer arrays (or anything NumPy can turn into one) giving the
+        signed number of diatonic steps and signed number of semi-tones in each interval.
+        """
+
+        steps = np.asarray(steps, dtype=np.int64)
+        semitones = np.asarray(semitones, dtype=np.int64)
+
+        if steps.shape != semitones.shape:
+            raise ValueError('steps and semitones must have the same shape')
+
+        self._steps = steps
+        self._semitones = semitones
+
+
+    @classmethod
+    def from_intervals(cls, intervals):
+        """
+        Build an IntervalArray from a list of interval objects or shorthand strings, like ['p4+', 'a5-'].
+
+        Each distinct value only gets converted once, so this is fast on the long, repetitive lists that
+        come out of real music.
+        """
+
+        values = np.asarray([str(i) for i in intervals])
+        if values.size == 0:
+            return cls([], [])
+
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        unique_steps = np.empty(len(unique_values), dtype=np.int64)
+        unique_semitones = np.empty(len(unique_values), dtype=np.int64)
+
+        for i, value in enumerate(unique_values):
+            unique_interval = interval(str(value))
+            unique_steps[i] = unique_interval._interval_sign*(unique_interval._interval_number - 1)
+            unique_semitones[i] = unique_interval._interval_sign*len(unique_interval)
+
+        return cls(unique_steps[inverse], unique_semitones[inverse])
+
+
+    @classmethod
+    def _coerce(cls, other):
+        """
+        Let us mix IntervalArrays with single intervals and shorthand strings in arithmetic and comparisons.
+        A single interval becomes a one-element array that broadcasts against the other side.
+        """
+
+        if isinstance(other, cls):
+            return other
+        if isinstance(other, (interval, str)):
+            return cls.from_intervals([other])
+        return NotImplemented
+
+
+    def __len__(self):
+        """
+        The number of intervals in the array (not a number of semi-tones like interval.__len__)
+        """
+        return len(self._steps)
+
+
+    def __getitem__(self, index):
+        """
+        Integer indices give back a single interval object. Slices, masks and index arrays give back an IntervalArray.
+        """
+
+        if isinstance(index, (int, np.integer)):
+            return IntervalArray(self._steps[[index]], self._semitones[[index]]).to_intervals()[0]
+        return IntervalArray(self._steps[index], self._semitones[index])
+
+
+    def __iter__(self):
+        return iter(self.to_intervals())
+
+
+    def __repr__(self):
+        if self.is_nameable().all():
+            return 'IntervalArray([' + ', '.join(self.to_strings()) + '])'
+        return 'IntervalArray(steps=' + str(self._steps.tolist()) + ', semitones=' + str(self._semitones.tolist()) + ')'
+
+
+    @property
+    def steps(self):
+        return self._steps
+
+
+    @property
+    def semitones(self):
+        return self._semitones
+
+
+    def width(self):
+        """
+        The signed width of each interval in semi-tones. This is what the comparison operators below use,
+        just like interval.__eq__ and friends, so a4+ == d5+ but a4+ != a4-.
+        """
+        return self._semitones
+
+
+    def direction(self):
+        """
+        The direction of each interval as +1 or -1. Unisons go up unless they're chromatically lowered.
+        """
+        return np.where((self._steps < 0) | ((self._steps == 0) & (self._semitones < 0)), -1, 1)
+
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return IntervalArray(self._steps + other._steps, self._semitones + other._semitones)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return IntervalArray(self._steps - other._steps, self._semitones - other._semitones)
+
+
+    def __rsub__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return other - self
+
+
+    def __neg__(self):
+        return IntervalArray(-self._steps, -self._semitones)
+
+
+    def reverse_direction(self):
+        """
+        Reverse the direction of every interval, like interval.reverse_direction
+        """
+        return -self
+
+
+    def __abs__(self):
+        """
+        |p4+| == |p4-| == p4+, and so on.
+        """
+        sign = self.direction()
+        return IntervalArray(sign*self._steps, sign*self._semitones)
+
+
+    def invert(self, wrt='p8+'):
+        """
+        Invert every interval with respect to (wrt) an octave up by default, or any other interval we specify,
+        like interval.invert. So a p3+ inverts to a d6+.
+        """
+        return self._coerce(wrt) - self
+
+
+    def reduce(self):
+        """
+        Reduce every interval to within an octave, keeping its direction, like interval.reduce.
+
+        As in the interval class, diminished octaves reduce to d8, not to a nonexistent d1.
+        """
+
+        prototype = tones_and_intervals.diatonic_prototype_to_use
+        diatonic_scale_size = prototype._diatonic_scale_size
+        block_size = prototype._block_size
+
+        sign = self.direction()
+        abs_steps = sign*self._steps
+        abs_semitones = sign*self._semitones
+
+        # Take out as many octaves as there are in the step count, then put one back for diminished octaves,
+        # which are the only intervals that would end up with negative width
+        octaves = abs_steps // diatonic_scale_size
+        octaves -= (abs_semitones - block_size*octaves < 0) & (octaves > 0)
+
+        return IntervalArray(sign*(abs_steps - diatonic_scale_size*octaves), sign*(abs_semitones - block_size*octaves))
+
+
+    def _adjustments(self):
+        """
+        How far each interval is from the pure interval with the same number of steps (-1 for diminished,
+        0 for pure, 1 for augmented, anything else for intervals we can't name), along with the direction.
+        """
+
+        prototype = tones_and_intervals.diatonic_prototype_to_use
+        diatonic_scale_size = prototype._diatonic_scale_size
+
+        # Number of semi-tones in the pure interval for each reduced number of diatonic steps
+        # (0 steps is a p1, 1 step is a p2, ..., 6 steps is a p7)
+        pure_semitones_by_steps = np.asarray(prototype._absolute_representation)
+
+        sign = self.direction()
+        abs_steps = sign*self._steps
+        abs_semitones = sign*self._semitones
+        pure_semitones = pure_semitones_by_steps[abs_steps % diatonic_scale_size] + prototype._block_size*(abs_steps // diatonic_scale_size)
+        return abs_semitones - pure_semitones, sign
+
+
+    def is_nameable(self):
+        """
+        Boolean mask of the intervals that have a name in our system (no double augmentations,
+        no augmented sevenths and so on)
+        """
+
+        adjustments, sign = self._adjustments()
+        diatonic_scale_size = tones_and_intervals.diatonic_prototype_to_use._diatonic_scale_size
+        augmented_seventh = (adjustments == 1) & ((sign*self._steps) % diatonic_scale_size == diatonic_scale_size - 1)
+        return (np.abs(adjustments) <= 1) & ~augmented_seventh
+
+
+    def to_strings(self):
+        """
+        Convert back to shorthand strings like 'p4+' and 'a5-', as a NumPy array of strings
+        """
+
+        if not self.is_nameable().all():
+            raise ValueError('Some of these intervals have no name in this system')
+
+        adjustments, sign = self._adjustments()
+        types = interval_types_by_adjustment[adjustments + 1]
+        numbers = (sign*self._steps + 1).astype(str)
+        directions = np.where(sign > 0, '+', '-')
+        return np.char.add(np.char.add(types, numbers), directions)
+
+
+    def to_intervals(self):
+        """
+        Convert back to a list of (interned) interval objects
+        """
+        return [interval(str(i)) for i in self.to_strings()]
+
+
+    def _compare(self, other, comparison):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return comparison(self._semitones, other._semitones)
+
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    __hash__ = None
+
+
+
+class GenIntervalArray:
+    """
+    An array of generalized intervals, the vectorized version of geninterval.
+
+    Each interval is a (distance, adjustment) pair of integers, so we store two integer arrays. Just like geninterval,
+    these form an abelian group under addition, and nothing here assumes that an "octave" is 12 semi-tones: reduce()
+    takes whatever equivalence length we want, which is what we need for xenharmonic systems.
+
+    The arrays can be any shape, and arithmetic broadcasts the way NumPy does. So adding a column of n intervals to
+    a row of m intervals gives an n by m table of all the sums.
+    """
+
+
+    def __init__(self, distance, adjustment):
+        """
+        distance and adjustment are integer arrays (or anything NumPy can turn into one) that broadcast against each other
+        """
+
+        distance = np.asarray(distance)
+        adjustment = np.asarray(adjustment)
+
+        # The distance and adjustment have to be integer numbers of semi-tones
+        if distance.size and not np.issubdtype(distance.dtype, np.integer):
+            raise ValueError('Interval distance must be an integer number of semi-tones')
+
+        if adjustment.size and not np.issubdtype(adjustment.dtype, np.integer):
+            raise ValueError('Interval adjustment must be an integer number of semi-tones')
+
+        distance, adjustment = np.broadcast_arrays(distance.astype(np.int64), adjustment.astype(np.int64))
+
+        self._distance = distance
+        self._adjustment = adjustment
+
+
+    @classmethod
+    def from_genintervals(cls, genintervals):
+        """
+        Build a GenIntervalArray from a list of geninterval objects
+        """
+        return cls([i._distance for i in genintervals], [i._adjustment for i in genintervals])
+
+
+    def to_genintervals(self):
+        """
+        Convert back to a flat list of geninterval objects
+        """
+        return [geninterval(distance, adjustment) for distance, adjustment in zip(self._distance.ravel().tolist(), self._adjustment.ravel().tolist())]
+
+
+    @classmethod
+    def _coerce(cls, other):
+        """
+        Let us mix GenIntervalArrays with single genintervals in arithmetic and comparisons
+        """
+
+        if isinstance(other, cls):
+            return other
+        if isinstance(other, geninterval):
+            return cls(other._distance, other._adjustment)
+        return NotImplemented
+
+
+    @property
+    def distance(self):
+        return self._distance
+
+
+    @property
+    def adjustment(self):
+        return self._adjustment
+
+
+    @property
+    def shape(self):
+        return self._distance.shape
+
+
+    def __len__(self):
+        """
+        The number of intervals along the first axis (not a size in semi-tones like geninterval.__len__)
+        """
+
+        if self._distance.ndim == 0:
+            raise TypeError('len() of a 0-d GenIntervalArray (a single interval)')
+        return len(self._distance)
+
+
+    def __getitem__(self, index):
+        return GenIntervalArray(self._distance[index], self._adjustment[index])
+
+
+    def __repr__(self):
+        return 'GenIntervalArray(' + str(self._distance.tolist()) + ', ' + str(self._adjustment.tolist()) + ')'
+
+
+    def size(self):
+        """
+        The total number of semi-tones in each interval, including the adjustment
+        """
+        return self._distance + self._adjustment
+
+
+    def direction(self):
+        """
+        The sign of each interval's size: -1, 0 or 1, corresponding to geninterval's '-', 'u' and '+'
+        """
+        return np.sign(self.size())
+
+
+    def __invert__(self):
+        # Switch the direction of every interval
+        return GenIntervalArray(-self._distance, -self._adjustment)
+
+
+    def __neg__(self):
+        return ~self
+
+
+    def __add__(self, other):
+        # Add intervals by adding the components
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return GenIntervalArray(self._distance + other._distance, self._adjustment + other._adjustment)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other):
+        # Subtract by adding the inverse
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return self + ~other
+
+
+    def __rsub__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return other + ~self
+
+
+    def __abs__(self):
+        # Return the equivalent ascending intervals
+        sign = np.where(self.size() < 0, -1, 1)
+        return GenIntervalArray(sign*self._distance, sign*self._adjustment)
+
+
+    def reduce(self, equiv_length):
+        """
+        Reduce every distance modulo equiv_length, keeping the adjustments, like geninterval.reduce.
+        equiv_length can be a single positive integer or an array of them that broadcasts against this one,
+        so we can reduce the same intervals with respect to several equivalence lengths at once.
+        """
+
+        equiv_length = np.asarray(equiv_length)
+        if not np.issubdtype(equiv_length.dtype, np.integer) or (equiv_length <= 0).any():
+            raise ValueError('Equivalence length must be a positive integer')
+        return GenIntervalArray(self._distance % equiv_length, self._adjustment)
+
+
+    def transpose(self, transposition):
+        # Transpose every interval by the specified transposition (a single integer or a broadcastable array)
+        transposition = np.asarray(transposition)
+        if not np.issubdtype(transposition.dtype, np.integer):
+            raise ValueError('Transposition must be an integer number of semi-tones')
+        return GenIntervalArray(self._distance + transposition, self._adjustment)
+
+
+    def adjust(self, additional_adjustment):
+        # Diminish or augment every interval the specified number of times
+        additional_adjustment = np.asarray(additional_adjustment)
+        if not np.issubdtype(additional_adjustment.dtype, np.integer):
+            raise ValueError('Adjustment must be an integer number of semi-tones')
+        return GenIntervalArray(self._distance, self._adjustment + additional_adjustment)
+
+
+    def enharm_eq(self, other):
+        """
+        Elementwise theoretical equality, where the distance and adjustment both have to be equal
+        (the comparison operators below only look at size, like geninterval's do)
+        """
+
+        other = self._coerce(other)
+        return (self._distance == other._distance) & (self._adjustment == other._adjustment)
+
+
+    def _compare(self, other, comparison):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return comparison(self.size(), other.size())
+
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    __hash__ = None
@@ -0,0 +1,256 @@
+"""
+Bulk parsing of interval shorthand, for loading whole libraries of scales and lines at once.
+
+A library is a plain text file with one scale or line per line, written as whitespace-separated
+interval shorthand:
+
+    p1+ p2+ p2+ d2+ p2+ p2+ p2+
+    p2+ d2+ a4- p3-
+
+or a JSON file holding a list of records, or a dictionary of named records, where each record is either
+a string like the lines above or a list of such strings:
+
+    {"ionian": "p1+ p2+ p2+ d2+ p2+ p2+ p2+", "line_1": ["p2+", "d2+", "a4-"]}
+
+We go through the whole buffer in one pass. Each distinct token is validated exactly once, with the same rules
+as interval() (so no d1s, no a7s and so on), and every occurrence of a bad token gets reported with its line
+and column, rather than stopping at the first one.
+"""
+
+
+import bisect
+import json
+import re
+
+import numpy as np
+
+from .tones_and_intervals import interval, interval_string_pattern
+from .interval_arrays import IntervalArray
+
+
+class interval_library:
+    """
+    The result of parsing a library. We store it compactly: a vocabulary of the distinct (interned) intervals
+    we saw, one small integer code per token pointing into that vocabulary, and the offsets where each record
+    starts in the list of codes.
+
+    Errors found during parsing are in the errors attribute, as a list of (line, column, token, message)
+    tuples with 1-based line and column numbers. Bad tokens are left out of their records.
+    """
+
+    def __init__(self, vocabulary, codes, record_offsets, record_names, errors):
+        self._vocabulary = vocabulary
+        self._codes = codes
+        self._record_offsets = record_offsets
+        self._record_names = record_names
+        self.errors = errors
+
+        # Step and semi-tone counts for the vocabulary, so we can turn codes into an IntervalArray with one gather
+        vocabulary_array = IntervalArray.from_intervals(vocabulary)
+        self._vocabulary_steps = vocabulary_array.steps
+        self._vocabulary_semitones = vocabulary_array.semitones
+
+    def __len__(self):
+        """
+        The number of records (scales or lines) in the library
+        """
+        return len(self._record_offsets) - 1
+
+    def __getitem__(self, index):
+        """
+        The intervals in the given record, as a list of interval objects
+        """
+
+        codes = self._codes[self._record_offsets[index]:self._record_offsets[index + 1]]
+        return [self._vocabulary[code] for code in codes.tolist()]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return 'interval_library(' + str(len(self)) + ' records, ' + str(len(self._codes)) + ' intervals, ' + str(len(self.errors)) + ' errors)'
+
+    @property
+    def names(self):
+        """
+        Record names for libraries loaded from a JSON dictionary, otherwise None
+        """
+        return self._record_names
+
+    @property
+    def vocabulary(self):
+        return self._vocabulary
+
+    @property
+    def codes(self):
+        return self._codes
+
+    @property
+    def record_offsets(self):
+        return self._record_offsets
+
+    def interval_array(self, index=None):
+        """
+        The intervals in the given record as an IntervalArray, or every interval in the library if
+        index is None
+        """
+
+        if index is None:
+            codes = self._codes
+        else:
+            codes = self._codes[self._record_offsets[index]:self._record_offsets[index + 1]]
+        return IntervalArray(self._vocabulary_steps[codes], self._vocabulary_semitones[codes])
+
+
+def _parse_records(records, record_names, strict):
+    """
+    Do the actual parsing. Each record is a list of chunks of text, and each chunk is a tuple
+    (text, locate), where locate(i) gives the (line number, column number) that character i of the text
+    came from, so we can locate errors.
+    """
+
+    # Each distinct token maps to its code in the vocabulary, or to an error message if it's invalid
+    token_codes = {}
+    vocabulary = []
+
+    codes = []
+    record_offsets = [0]
+    errors = []
+
+    for record in records:
+        for text, locate in record:
+            found_error = False
+
+            for token in text.split():
+                code = token_codes.get(token)
+
+                if code is None:
+                    try:
+                        if not interval_string_pattern.fullmatch(token):
+                            raise ValueError('Interval name must be [adp] followed by a number > 1 followed by a + or -')
+                        vocabulary.append(interval(token))
+                        code = len(vocabulary) - 1
+                    except (ValueError, KeyError) as error:
+                        code = str(error)
+                    token_codes[token] = code
+
+                if type(code) == int:
+                    codes.append(code)
+                else:
+                    found_error = True
+
+            # Going back over the chunk for positions is only worth it if something went wrong
+            if found_error:
+                for match in re.finditer(r'\S+', text):
+                    message = token_codes[match.group()]
+                    if type(message) != int:
+                        errors.append(locate(match.start()) + (match.group(), message))
+
+        record_offsets.append(len(codes))
+
+    if strict and errors:
+        raise ValueError('Invalid intervals in library:\n' + '\n'.join(
+            'line ' + str(line) + ', column ' + str(column) + ': ' + repr(token) + ': ' + message
+            for line, column, token, message in errors))
+
+    return interval_library(vocabulary, np.array(codes, dtype=np.int32), np.array(record_offsets, dtype=np.int64),
+                            record_names, errors)
+
+
+def _line_locator(line_number):
+    return lambda index: (line_number, index + 1)
+
+
+def parse_interval_text(text, strict=False):
+    """
+    Parse a plain text library with one record per line. Blank lines are skipped.
+
+    If strict is True, raise a single ValueError listing every error instead of returning them.
+    """
+
+    records = [[(line, _line_locator(line_number))] for line_number, line in enumerate(text.splitlines(), 1) if line.strip()]
+    return _parse_records(records, None, strict)
+
+
+# A JSON string literal, optionally followed by a colon (which makes it a dictionary key)
+json_string_pattern = re.compile(r'"((?:[^"\\]|\\.)*)"(\s*:)?')
+
+# One character of a JSON string literal as it's written: an escape like \t or \u00e9, or a plain character
+json_character_pattern = re.compile(r'\\u[0-9a-fA-F]{4}|\\.|.', re.DOTALL)
+
+
+def _json_literal_locator(text, literal, decoded, line_starts):
+    """
+    A locate function (see _parse_records) for the decoded string of a JSON string literal: character i of the
+    decoded string maps back to where its (possibly escaped) character starts in text
+    """
+
+    offsets = []
+    for character in json_character_pattern.finditer(literal.group(1)):
+        offsets.extend([literal.start(1) + character.start()]*len(json.loads('"' + character.group() + '"')))
+
+    # Surrogate pairs decode to one character from two escapes, so if the counts don't match we just point at the literal
+    if len(offsets) != len(decoded):
+        offsets = [literal.start(1)]*len(decoded)
+
+    def locate(index):
+        offset = offsets[index]
+        line_index = bisect.bisect_right(line_starts, offset) - 1
+        return line_index + 1, offset - line_starts[line_index] + 1
+
+    return locate
+
+
+def parse_interval_json(text, strict=False):
+    """
+    Parse a JSON library: a list of records or a dictionary of named records, where each record is a string
+    of whitespace-separated intervals or a list of such strings.
+
+    The json module doesn't tell us where anything is, so to report line and column numbers we also scan the
+    text for string literals. The JSON values come out in document order, and so do the literals that
+    aren't dictionary keys, so we can pair them up. We parse the decoded strings (so "p1+\\tp2+" is two
+    intervals), and only use the literals to find where each character came from.
+    """
+
+    library = json.loads(text)
+
+    if isinstance(library, dict):
+        record_names = list(library.keys())
+        raw_records = list(library.values())
+    elif isinstance(library, list):
+        record_names = None
+        raw_records = library
+    else:
+        raise ValueError('A JSON interval library must be a list or a dictionary of records')
+
+    line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+    literals = iter(match for match in json_string_pattern.finditer(text) if match.group(2) is None)
+
+    records = []
+    for raw_record in raw_records:
+        if isinstance(raw_record, str):
+            raw_record = [raw_record]
+        if not isinstance(raw_record, list) or not all(isinstance(chunk, str) for chunk in raw_record):
+            raise ValueError('Each record in a JSON interval library must be a string or a list of strings')
+
+        record = []
+        for chunk in raw_record:
+            literal = next(literals)
+            record.append((chunk, _json_literal_locator(text, literal, chunk, line_starts)))
+        records.append(record)
+
+    return _parse_records(records, record_names, strict)
+
+
+def parse_interval_file(path, strict=False):
+    """
+    Parse a library file, as JSON if the file name ends in .json and as plain text otherwise
+    """
+
+    with open(path) as library_file:
+        text = library_file.read()
+
+    if str(path).endswith('.json'):
+        return parse_interval_json(text, strict)
+    return parse_interval_text(text, strict)
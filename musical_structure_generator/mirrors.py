@@ -0,0 +1,176 @@
+"""
+Vardan Ovsepian-style mirror structures: take a line, reflect every note of it around an axis, and play the
+original and the reflection together, one in each hand.
+
+We measure pitches as intervals from middle C (c'), kept in an IntervalArray, so a pitch is a point on the
+(diatonic steps, semitones) lattice and its spelling comes along with it: e' is (2, 4), fes' is (3, 4) and
+bes is (-1, -2). Reflecting pitch p around an axis pitch a is 2a - p, and around an axis pair (a, b), halfway
+between them, it's a + b - p. That's plain integer arithmetic on both coordinates, so spelling comes out right
+without us having to guess sharps or flats. Around d', C major mirrors to itself: c' and e' swap, f' and b swap,
+g' and a swap, and d' stays put. Around the pair (c', ees'), c' and ees' swap, d' and des' swap, and so on.
+
+A whole chunk of notes gets reflected with a couple of array operations. mirror_voices streams through a line
+of any length (even an endless one, like scale.iter_absolute) a chunk at a time, so we can write out long
+mirror exercises in every key without holding them in memory.
+
+We name pitches LilyPond-style, like base_lilypond_octaves: c is the octave below middle C, c' is middle C,
+and sharps and flats are is and es (so ees', not es').
+"""
+
+
+import itertools
+import re
+
+import numpy as np
+
+from .interval_arrays import IntervalArray
+
+
+# Semitones from C up to each letter name, in the major scale prototype
+letter_names = np.array(['c', 'd', 'e', 'f', 'g', 'a', 'b'])
+letter_semitones = np.array([0, 2, 4, 5, 7, 9, 11])
+
+pitch_name_format = re.compile(r"^([a-g])((?:is|es)*)([',]*)$")
+
+
+class unnameable_pitch_error(ValueError):
+    """
+    A pitch that needs more than two sharps or flats, which LilyPond (and we) have no name for
+    """
+
+
+def pitch_names(pitches):
+    """
+    The LilyPond name of each pitch in an IntervalArray of pitches measured from middle C. Raise
+    unnameable_pitch_error (a ValueError) for pitches that need more than two sharps or flats.
+    """
+    
+    letters, octaves = np.divmod(pitches.steps, 7)[::-1]
+    alterations = pitches.semitones - letter_semitones[letters] - 12*octaves
+    
+    if np.any(np.abs(alterations) > 2):
+        raise unnameable_pitch_error('no name for a pitch with more than two sharps or flats')
+    
+    return [letter_names[letter] + ('is'*alteration if alteration > 0 else 'es'*-alteration)
+            + ("'"*(octave + 1) if octave >= 0 else ','*(-octave - 1))
+            for letter, alteration, octave in zip(letters.tolist(), alterations.tolist(), octaves.tolist())]
+
+
+def pitches_from_names(names):
+    """
+    The pitches (as an IntervalArray measured from middle C) for a list of LilyPond names like ["c'", 'bes', "fis''"]
+    """
+    
+    steps = []
+    semitones = []
+    for name in names:
+        match = pitch_name_format.match(name)
+        if match is None:
+            raise ValueError("can't read the pitch name " + repr(name))
+        letter, alterations, octave_marks = match.groups()
+        octave = octave_marks.count("'") - octave_marks.count(',') - 1
+        letter_index = 'cdefgab'.index(letter)
+        steps.append(letter_index + 7*octave)
+        semitones.append(letter_semitones[letter_index] + 12*octave + alterations.count('is') - alterations.count('es'))
+    
+    return IntervalArray(steps, semitones)
+
+
+def as_pitches(pitches):
+    """
+    Let us give pitches as an IntervalArray, a single interval or shorthand string (measured from middle C), or a
+    LilyPond name
+    """
+    
+    if isinstance(pitches, IntervalArray):
+        return pitches
+    if isinstance(pitches, str) and pitch_name_format.match(pitches):
+        return pitches_from_names([pitches])
+    return IntervalArray.from_intervals([pitches])
+
+
+def reflect(pitches, axis, second_axis=None):
+    """
+    Reflect every pitch in an IntervalArray around axis, or around the pair of pitches (axis, second_axis) if we give
+    second_axis. The axis pitches can be IntervalArrays, intervals or shorthand strings measured from middle C, or
+    LilyPond names.
+    """
+    
+    axis = as_pitches(axis)
+    second_axis = axis if second_axis is None else as_pitches(second_axis)
+    return (axis + second_axis) - pitches
+
+
+def mirror_chunks(line, axis, second_axis=None, reference='p1+', chunk_size=4096):
+    """
+    Go through line (any iterable of intervals or shorthand strings, measured from the reference pitch, which is middle
+    C unless we say otherwise) chunk_size notes at a time, and yield each chunk and its reflection as a pair of
+    IntervalArrays of pitches measured from middle C. The line can also be (interval, degree) pairs, like the ones
+    scale.iter_absolute gives us, and then we just use the intervals.
+    """
+    
+    reference = as_pitches(reference)
+    line = iter(line)
+    while True:
+        chunk = list(itertools.islice(line, chunk_size))
+        if not chunk:
+            return
+        chunk = [note[0] if isinstance(note, tuple) else note for note in chunk]
+        pitches = reference + IntervalArray.from_intervals(chunk)
+        yield pitches, reflect(pitches, axis, second_axis)
+
+
+def mirror_voices(line, axis, second_axis=None, reference='p1+', chunk_size=4096):
+    """
+    Yield the notes of line together with their reflections around axis (or the axis pair), as pairs of LilyPond
+    names. line can be endless.
+    """
+    
+    for pitches, mirrored in mirror_chunks(line, axis, second_axis, reference, chunk_size):
+        yield from zip(pitch_names(pitches), pitch_names(mirrored))
+
+
+def scale_pitches(scale, indices):
+    """
+    The notes of a scale with the given indices (an integer array, numbered like in scale.absolute_position, so
+    index len(scale) is the first note of the next period and -1 the last note of the one below), as an IntervalArray
+    measured from the root. This does the work of scale.absolute_interval for the whole array at once.
+    """
+    
+    note_semitones, period_semitones, note_degrees, period_degrees = scale._absolute_tables()
+    note_semitones = np.frombuffer(note_semitones, dtype=np.int64)
+    note_degrees = np.asarray(note_degrees, dtype=np.int64)
+    
+    periods, indices = np.divmod(np.asarray(indices, dtype=np.int64), len(note_semitones))
+    
+    # Degree 1 is the root, so a note's degree is one more than the number of diatonic steps up to it
+    return IntervalArray(note_degrees[indices] + periods*period_degrees - 1, note_semitones[indices] + periods*period_semitones)
+
+
+def mirror_scale_voices(scale, tonic='p1+', axis='p1+', second_axis=None, num_notes=None, direction='up', chunk_size=4096):
+    """
+    Play a scale (like scale.iter_absolute does) from tonic against its mirror image, for num_notes notes or forever.
+    Here the axis (and second_axis) are intervals measured from the tonic rather than from middle C, so the same call
+    in another key gives the same exercise transposed. For example, for C ionian
+    
+        mirror_scale_voices(c_ionian, "ees'", axis='p2+', num_notes=8)
+    
+    mirrors E flat major around F, giving ("ees'", "g'"), ("f'", "f'"), ("g'", "ees'"), ("aes'", "d'") and so on.
+    We work out the notes straight from the scale's tables a chunk at a time, rather than building interval objects.
+    """
+    
+    if direction not in ('up', 'down'):
+        raise ValueError("direction must be 'up' or 'down'")
+    
+    tonic = as_pitches(tonic)
+    axis = tonic + as_pitches(axis)
+    second_axis = None if second_axis is None else tonic + as_pitches(second_axis)
+    index_step = 1 if direction == 'up' else -1
+    
+    for chunk_start in itertools.count(0, chunk_size):
+        chunk_end = chunk_start + chunk_size if num_notes is None else min(chunk_start + chunk_size, num_notes)
+        if chunk_end <= chunk_start:
+            return
+        
+        pitches = tonic + scale_pitches(scale, index_step*np.arange(chunk_start, chunk_end))
+        yield from zip(pitch_names(pitches), pitch_names(reflect(pitches, axis, second_axis)))
@@ -0,0 +1,185 @@
+"""
+Statistics about the steps of a scale, for long non-monotonic and hyperdiatonic scales: spans of every window of
+consecutive notes, sliding maxima and minima of the steps, and step histograms, all from NumPy arrays in one pass.
+
+Everything comes from the scale's cached semitones above the root (see scale._absolute_tables). Those are running
+sums of the steps, so the span between any two notes is one subtraction. We keep the running sums of the step sizes
+(ignoring direction) too, for cumulative spans.
+"""
+
+
+import numpy as np
+
+from .tones_and_intervals import scale, spell_span
+
+
+def sliding_extreme(values, window_size, ufunc):
+    """
+    ufunc (np.maximum or np.minimum) over every window of window_size consecutive values, in O(n) no matter how
+    big the windows are. We cut the values into blocks of window_size, and take running extremes forwards and
+    backwards within each block. Every window covers the end of one block and the start of the next, so its extreme is
+    the backward running extreme where it starts combined with the forward running extreme where it ends.
+    """
+    
+    num_windows = len(values) - window_size + 1
+    if window_size < 1 or num_windows < 1:
+        raise ValueError('window_size must be between 1 and the number of values')
+    
+    # Pad to a whole number of blocks with copies of the last value, which can't change any extreme
+    num_blocks = -(-len(values) // window_size)
+    padded = np.empty(num_blocks*window_size, dtype=values.dtype)
+    padded[:len(values)] = values
+    padded[len(values):] = values[-1]
+    blocks = padded.reshape(num_blocks, window_size)
+    
+    forward = ufunc.accumulate(blocks, axis=1).ravel()
+    backward = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    
+    return ufunc(backward[:num_windows], forward[window_size - 1:window_size - 1 + num_windows])
+
+
+class step_statistics:
+    """
+    Step and span statistics for one scale. Notes are numbered from 0 like the scale's intervals, and step i is the
+    step from note i to note i + 1 (so there are len(scale) - 1 steps; like scale_span, we leave out the first interval,
+    which just places the first note relative to the root, and the continuation offset).
+    
+        stats = step_statistics(c_ionian)
+        stats.span(2, 5)            semitones from note 2 to note 5 (E to A), O(1)
+        stats.window_spans(3)       the semitones spanned by every run of 3 consecutive notes
+        stats.sliding_max(4)        the widest of every 4 consecutive steps
+    """
+    
+    def __init__(self, some_scale):
+        if not isinstance(some_scale, scale):
+            some_scale = some_scale.materialize()
+        
+        note_semitones, period_semitones, note_degrees, period_degrees = some_scale._absolute_tables()
+        
+        # The cached tables are 64-bit integer arrays, so NumPy can use them as they are
+        self._scale = some_scale
+        self._positions = np.frombuffer(note_semitones, dtype=np.int64)
+        self._degrees = np.asarray(note_degrees, dtype=np.int64)
+        self._steps = np.diff(self._positions)
+        self._cum_positions = np.concatenate(([0], np.cumsum(np.abs(self._steps))))
+    
+    
+    def __len__(self):
+        """
+        The number of notes
+        """
+        return len(self._positions)
+    
+    
+    @property
+    def positions(self):
+        """
+        Semitones from the root to each note
+        """
+        return self._positions
+    
+    @property
+    def steps(self):
+        """
+        Signed semitones of each step
+        """
+        return self._steps
+    
+    
+    def span(self, start=0, stop=None):
+        """
+        Signed semitones from note start to note stop (the last note by default), so span() is the size of scale_span
+        """
+        
+        if stop is None:
+            stop = len(self) - 1
+        return int(self._positions[stop] - self._positions[start])
+    
+    
+    def cum_span(self, start=0, stop=None):
+        """
+        Semitones covered going from note start to note stop, ignoring direction, so cum_span() is the size of scale_cum_span
+        """
+        
+        if stop is None:
+            stop = len(self) - 1
+        return int(self._cum_positions[stop] - self._cum_positions[start])
+    
+    
+    def span_interval(self, start=0, stop=None):
+        """
+        Like span, but as an interval, spelled by how many degrees apart the two notes are
+        """
+        
+        if stop is None:
+            stop = len(self) - 1
+        return spell_span(self.span(start, stop), int(self._degrees[stop] - self._degrees[start]))
+    
+    
+    def window_spans(self, window_size):
+        """
+        The signed span of every run of window_size consecutive notes, as an array with len(self) - window_size + 1 entries
+        """
+        
+        if not 1 <= window_size <= len(self):
+            raise ValueError('window_size must be between 1 and the number of notes')
+        return self._positions[window_size - 1:] - self._positions[:len(self) - window_size + 1]
+    
+    
+    def window_cum_spans(self, window_size):
+        """
+        Like window_spans, but ignoring direction
+        """
+        
+        if not 1 <= window_size <= len(self):
+            raise ValueError('window_size must be between 1 and the number of notes')
+        return self._cum_positions[window_size - 1:] - self._cum_positions[:len(self) - window_size + 1]
+    
+    
+    def window_ranges(self, window_size):
+        """
+        The distance between the lowest and highest notes in every run of window_size consecutive notes
+        """
+        
+        return (sliding_extreme(self._positions, window_size, np.maximum)
+                - sliding_extreme(self._positions, window_size, np.minimum))
+    
+    
+    def sliding_max(self, window_size):
+        """
+        The biggest step (in signed semitones) in every run of window_size consecutive steps
+        """
+        return sliding_extreme(self._steps, window_size, np.maximum)
+    
+    
+    def sliding_min(self, window_size):
+        """
+        The smallest step (in signed semitones) in every run of window_size consecutive steps
+        """
+        return sliding_extreme(self._steps, window_size, np.minimum)
+    
+    
+    def step_histogram(self):
+        """
+        The distinct step sizes (signed semitones, in increasing order) and how many times each one comes up
+        """
+        return np.unique(self._steps, return_counts=True)
+    
+    
+    def sliding_histogram(self, window_size):
+        """
+        Step histograms of every run of window_size consecutive steps. Returns the distinct step sizes (like step_histogram)
+        and an array with one row per window and one column per step size, counting that size in that window. We take
+        running counts of each step size, so every window is one subtraction.
+        """
+        
+        num_windows = len(self._steps) - window_size + 1
+        if window_size < 1 or num_windows < 1:
+            raise ValueError('window_size must be between 1 and the number of steps')
+        
+        step_sizes, step_size_index = np.unique(self._steps, return_inverse=True)
+        running_counts = np.zeros((len(self._steps) + 1, len(step_sizes)), dtype=np.int64)
+        running_counts[np.arange(1, len(self._steps) + 1), step_size_index] = 1
+        np.cumsum(running_counts, axis=0, out=running_counts)
+        
+        return step_sizes, running_counts[window_size:] - running_counts[:num_windows]
@@ -0,0 +1,202 @@
+"""
+Slonimsky's Thesaurus of Scales and Melodic Patterns: divide some number of octaves into equal parts (the principal
+tones), and then insert notes around each principal tone.
+
+    interpolation   notes between a principal tone and the next one
+    infrapolation   notes below the principal tone
+    ultrapolation   notes above the next principal tone
+
+and the combinations of those (infra-interpolation and so on). We write a pattern as the offsets of the inserted
+notes in semitones from their principal tone, played after it in order from low to high. So dividing one octave into
+two (the tritone progression) with the interpolation (1,) gives C Db F# G, and with the infrapolation (-1,) gives
+C B F# F.
+
+Every pattern comes out as a scale that goes once round the whole cycle, from the root until the principal tones come
+back to the root some octaves up, with the continuation offset taking us there. That's the only way to spell these
+consistently: a whole-tone scale, say, can't use every letter name once per octave, so it has to be spelled over the
+octave as a whole. We spell each note by how far it is above or below the root, the way the major scale prototype
+spells it (minor second, major second, minor third, ..., augmented fourth, ..., minor seventh, major seventh), and put
+that in the degree list. Steps between notes get spelled to match where the system has a name for them, and otherwise
+the way spell_span settles for. So the tritone progression with C Db is
+scale(['p1+', 'd2+', 'a3+', 'd2+'], 'p4+', [1, 2, 4, 5, 8]), spelled C Db F# G.
+
+We work out the principal tones of each division, and the scale of each pattern, once, and keep them. thesaurus
+goes through every pattern (tens of thousands with the default settings, in a couple of seconds) and can throw
+patterns out by their steps before building anything.
+"""
+
+
+import itertools
+import math
+
+from .tones_and_intervals import scale, spell_span
+
+
+# How many letter names above the root each number of semitones (mod 12) is spelled
+pitch_class_steps = (0, 1, 1, 2, 2, 3, 3, 4, 5, 5, 6, 6)
+
+slonimsky_categories = ('principal', 'interpolation', 'infrapolation', 'ultrapolation', 'infra-interpolation',
+                        'inter-ultrapolation', 'infra-ultrapolation', 'infra-inter-ultrapolation')
+
+# (num_octaves, num_parts) -> the semitones of the principal tones, starting from 0
+division_tables = {}
+
+# (num_octaves, num_parts, insertions) -> scale
+slonimsky_scales = {}
+
+
+def spelled_steps(num_semitones):
+    """
+    How many diatonic steps above (or below, if negative) the root we spell a note num_semitones from it
+    """
+    
+    num_octaves, num_semitones = divmod(num_semitones, 12)
+    return pitch_class_steps[num_semitones] + 7*num_octaves
+
+
+def equal_divisions(max_octaves=7):
+    """
+    Every (num_octaves, num_parts) for dividing up to max_octaves octaves into equal parts of a whole number of
+    semitones. We skip divisions like 2 octaves into 4 parts, which are the same as a smaller one (1 octave into 2).
+    """
+    return [(num_octaves, num_parts) for num_octaves in range(1, max_octaves + 1) for num_parts in range(2, 12*num_octaves + 1)
+            if 12*num_octaves % num_parts == 0 and math.gcd(num_octaves, num_parts) == 1]
+
+
+def division_table(num_octaves, num_parts):
+    """
+    The principal tones for dividing num_octaves octaves into num_parts equal parts, in semitones from the root
+    """
+    
+    if (num_octaves, num_parts) not in division_tables:
+        if 12*num_octaves % num_parts != 0:
+            raise ValueError(str(num_octaves) + ' octaves do not divide into ' + str(num_parts) + ' equal parts of whole semitones')
+        principal_interval = 12*num_octaves//num_parts
+        division_tables[num_octaves, num_parts] = tuple(range(0, 12*num_octaves, principal_interval))
+    
+    return division_tables[num_octaves, num_parts]
+
+
+def insertion_category(insertions, principal_interval):
+    """
+    Which of slonimsky_categories a pattern with the given insertions (semitones from the principal tone) is in
+    """
+    
+    regions = [region for region, present in
+               (('infra', any(offset < 0 for offset in insertions)),
+                ('inter', any(0 < offset < principal_interval for offset in insertions)),
+                ('ultra', any(offset > principal_interval for offset in insertions)))
+               if present]
+    
+    if not regions:
+        return 'principal'
+    if len(regions) == 1:
+        return regions[0] + 'polation'
+    return '-'.join(regions) + 'polation'
+
+
+def note_offsets(num_octaves, num_parts, insertions=()):
+    """
+    The semitones from the root of every note of the pattern, once round the cycle
+    """
+    return [principal_tone + offset for principal_tone in division_table(num_octaves, num_parts) for offset in (0,) + tuple(insertions)]
+
+
+def slonimsky_scale(num_octaves, num_parts, insertions=()):
+    """
+    The scale for num_octaves octaves divided into num_parts equal parts, with insertions (semitones from each
+    principal tone, see the top of this file) played after each principal tone
+    """
+    
+    insertions = tuple(insertions)
+    key = (num_octaves, num_parts, insertions)
+    if key in slonimsky_scales:
+        return slonimsky_scales[key]
+    
+    offsets = note_offsets(num_octaves, num_parts, insertions)
+    steps = [spelled_steps(offset) for offset in offsets]
+    
+    interval_strings = ['p1+'] + [str(spell_span(offset - previous_offset, step - previous_step))
+                                  for previous_offset, offset, previous_step, step in zip(offsets, offsets[1:], steps, steps[1:])]
+    continuation_offset = spell_span(12*num_octaves - offsets[-1], 7*num_octaves - steps[-1])
+    
+    new_scale = scale(interval_strings, str(continuation_offset), [step + 1 for step in steps] + [7*num_octaves + 1])
+    slonimsky_scales[key] = new_scale
+    return new_scale
+
+
+class slonimsky_pattern:
+    """
+    One pattern from the thesaurus: num_octaves octaves divided into num_parts equal parts, with insertions played
+    after each principal tone. The scale gets built the first time we ask for it.
+    """
+    
+    def __init__(self, num_octaves, num_parts, insertions):
+        self.num_octaves = num_octaves
+        self.num_parts = num_parts
+        self.insertions = tuple(insertions)
+        self.principal_interval = 12*num_octaves//num_parts
+        self.category = insertion_category(self.insertions, self.principal_interval)
+    
+    
+    def __repr__(self):
+        return ('slonimsky_pattern(' + str(self.num_octaves) + ' octaves into ' + str(self.num_parts) + ' parts, '
+                + self.category + ' ' + str(list(self.insertions)) + ')')
+    
+    
+    @property
+    def scale(self):
+        return slonimsky_scale(self.num_octaves, self.num_parts, self.insertions)
+    
+    
+    def step_sizes(self):
+        """
+        The semitones of every step, counting the continuation offset, without building the scale
+        """
+        
+        offsets = note_offsets(self.num_octaves, self.num_parts, self.insertions) + [12*self.num_octaves]
+        return [offset - previous_offset for previous_offset, offset in zip(offsets, offsets[1:])]
+
+
+def thesaurus(max_octaves=7, max_inserted=3, max_reach=2, categories=None, max_notes=None, max_step=None,
+              min_step=None, allowed_steps=None, monotonic=False):
+    """
+    Yield a slonimsky_pattern for every division in equal_divisions(max_octaves), with every way of inserting up to
+    max_inserted notes: anywhere between the principal tones, or up to max_reach semitones below the principal tone
+    or above the next one. Only keep
+    
+    categories      patterns in these of slonimsky_categories (all of them by default)
+    max_notes       patterns with at most this many notes once round the cycle
+    max_step        patterns with no step wider than this many semitones (ignoring direction)
+    min_step        patterns with no step narrower than this many semitones (ignoring direction)
+    allowed_steps   patterns whose steps (ignoring direction) are all in this set of numbers of semitones
+    monotonic       patterns that only go up
+    
+    The steps count the continuation offset, and we check them before building any scales.
+    """
+    
+    for num_octaves, num_parts in equal_divisions(max_octaves):
+        principal_interval = 12*num_octaves//num_parts
+        candidates = (list(range(-max_reach, 0)) + list(range(1, principal_interval))
+                      + list(range(principal_interval + 1, principal_interval + max_reach + 1)))
+        
+        for num_inserted in range(max_inserted + 1):
+            if max_notes is not None and num_parts*(num_inserted + 1) > max_notes:
+                break
+            
+            for insertions in itertools.combinations(candidates, num_inserted):
+                pattern = slonimsky_pattern(num_octaves, num_parts, insertions)
+                if categories is not None and pattern.category not in categories:
+                    continue
+                
+                step_sizes = pattern.step_sizes()
+                if monotonic and min(step_sizes) <= 0:
+                    continue
+                if max_step is not None and max(abs(step_size) for step_size in step_sizes) > max_step:
+                    continue
+                if min_step is not None and min(abs(step_size) for step_size in step_sizes) < min_step:
+                    continue
+                if allowed_steps is not None and not all(abs(step_size) in allowed_steps for step_size in step_sizes):
+                    continue
+                
+                yield pattern
@@ -0,0 +1,198 @@
+"""
+Search the whole space of tetrachord shapes: every shape with steps from min_step to max_step semitones (like
+major_tetrachord = (2, 2, 1, 2)), stacked from every starting pitch class, with the results saved to disk.
+
+For each shape and starting pitch class we keep one row:
+
+    shape               the tetrachord shape
+    starting_pitch_class
+    num_stacks          how many tetrachords we stacked before we covered everything, or before we went round a cycle
+    full_coverage       whether we covered all 12 pitch classes
+    cycle_length        how many tetrachords it takes to start on the same pitch class again (the period)
+    density_curve       how many pitch classes we had after each tetrachord, padded with zeros after num_stacks
+    missing_mask        the pitch classes we never got to, as a bit mask (bit k is pitch class k, C = 0)
+
+Moving the starting pitch class just transposes everything, so we only stack each shape once from C, and get the
+missing pitch classes for the other 11 starts by looking them up in a table of every mask transposed every way.
+The table gets built once and handed to every worker process.
+
+The shapes get split into shards of consecutive shapes. Each worker saves its shard as a NumPy file as soon as it's
+done (under a temporary name that it renames at the end, so a file that's there is always complete), and a search
+that gets interrupted picks up where it left off: we skip the shards that already have a file. Run
+
+    python -m musical_structure_generator.tetrachord_search DIRECTORY --max-step 4
+
+to search from the command line, and use load_tetrachord_search(DIRECTORY) to read the results back as one array.
+"""
+
+
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from . import tones_and_intervals
+from .tetrachords import rotate_mask, stack_tetrachords
+
+
+# How we store one row. We never stack more than 12 tetrachords, since by then one has to start on a pitch class
+# that an earlier one started on.
+def tetrachord_search_dtype(block_size=12):
+    return np.dtype([('shape', np.int8, (4,)),
+                     ('starting_pitch_class', np.uint8),
+                     ('num_stacks', np.uint8),
+                     ('full_coverage', np.bool_),
+                     ('cycle_length', np.uint8),
+                     ('density_curve', np.uint8, (block_size,)),
+                     ('missing_mask', np.uint16)])
+
+
+def transposition_table(block_size=12):
+    """
+    Every pitch class mask transposed up by every number of semitones: table[mask, k] is rotate_mask(mask, k)
+    """
+    
+    masks = np.arange(1 << block_size, dtype=np.uint16)
+    table = np.empty((1 << block_size, block_size), dtype=np.uint16)
+    for num_semitones in range(block_size):
+        table[:, num_semitones] = [rotate_mask(int(mask), num_semitones, block_size) for mask in masks]
+    return table
+
+
+def tetrachord_shapes(min_step=1, max_step=4):
+    """
+    Every tetrachord shape with each number of semitones between min_step and max_step, in a fixed order
+    """
+    return list(itertools.product(range(min_step, max_step + 1), repeat=4))
+
+
+def search_shapes(shapes, table):
+    """
+    The rows for the given shapes, from every starting pitch class (see the top of this file), using table from
+    transposition_table
+    """
+    
+    block_size = table.shape[1]
+    full_mask = (1 << block_size) - 1
+    rows = np.zeros(len(shapes)*block_size, dtype=tetrachord_search_dtype(block_size))
+    
+    for i, shape in enumerate(shapes):
+        stack = stack_tetrachords(shape)
+        shape_rows = rows[i*block_size:(i + 1)*block_size]
+        
+        shape_rows['shape'] = shape
+        shape_rows['starting_pitch_class'] = np.arange(block_size)
+        shape_rows['num_stacks'] = stack.num_stacks
+        shape_rows['full_coverage'] = stack.full_coverage
+        shape_rows['cycle_length'] = stack.cycle_length
+        shape_rows['density_curve'][:, :stack.num_stacks] = stack.density_curve()
+        shape_rows['missing_mask'] = table[full_mask & ~stack.coverage_masks[-1]]
+    
+    return rows
+
+
+# Each worker process gets the table once, when it starts
+_worker_table = None
+
+
+def _start_worker(table):
+    global _worker_table
+    _worker_table = table
+
+
+def shard_path(directory, shard_index):
+    return os.path.join(directory, 'shard_' + str(shard_index).zfill(5) + '.npy')
+
+
+def _search_shard(shard):
+    """
+    Search one shard and save it. Runs in a worker process.
+    """
+    
+    directory, shard_index, shapes = shard
+    rows = search_shapes(shapes, _worker_table)
+    
+    path = shard_path(directory, shard_index)
+    with open(path + '.partial', 'wb') as f:
+        np.save(f, rows)
+    os.replace(path + '.partial', path)
+    return shard_index
+
+
+def search_tetrachord_space(directory, min_step=1, max_step=4, processes=None, shard_count=None):
+    """
+    Search every tetrachord shape with steps from min_step to max_step semitones, from every starting pitch class,
+    in a pool of processes, saving the results in directory. If directory already has some of the shards from an
+    earlier search with the same settings, we only do the rest. Return how many shards we searched this time.
+    """
+    
+    if min_step < 1 or max_step < min_step:
+        raise ValueError('need 1 <= min_step <= max_step')
+    
+    if processes is None:
+        processes = os.cpu_count() or 1
+    
+    shapes = tetrachord_shapes(min_step, max_step)
+    block_size = tones_and_intervals.diatonic_prototype_to_use.compile()._block_size
+    
+    # What we're searching goes in a file next to the shards, so a resumed search can check it's doing the same thing
+    os.makedirs(directory, exist_ok=True)
+    settings_path = os.path.join(directory, 'search.json')
+    if os.path.exists(settings_path):
+        with open(settings_path) as f:
+            settings = json.load(f)
+        if shard_count is None:
+            shard_count = settings['shard_count']
+        if settings != dict(min_step=min_step, max_step=max_step, block_size=block_size, shard_count=shard_count):
+            raise ValueError(directory + ' has a search with different settings: ' + str(settings))
+    else:
+        if shard_count is None:
+            shard_count = min(len(shapes), 4*processes)
+        with open(settings_path, 'w') as f:
+            json.dump(dict(min_step=min_step, max_step=max_step, block_size=block_size, shard_count=shard_count), f)
+    
+    shard_size = -(-len(shapes)//shard_count)
+    shards = [(directory, shard_index, shapes[shard_index*shard_size:(shard_index + 1)*shard_size])
+              for shard_index in range(shard_count) if not os.path.exists(shard_path(directory, shard_index))]
+    
+    if shards:
+        with ProcessPoolExecutor(processes, initializer=_start_worker, initargs=(transposition_table(block_size),)) as executor:
+            for future in as_completed([executor.submit(_search_shard, shard) for shard in shards]):
+                future.result()
+    
+    return len(shards)
+
+
+def load_tetrachord_search(directory):
+    """
+    All the rows of a finished search, in shape order. Raise ValueError if some shards are missing.
+    """
+    
+    with open(os.path.join(directory, 'search.json')) as f:
+        settings = json.load(f)
+    
+    paths = [shard_path(directory, shard_index) for shard_index in range(settings['shard_count'])]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise ValueError('the search in ' + directory + ' is missing ' + str(len(missing)) + ' shards, run it again to finish it')
+    
+    return np.concatenate([np.load(path) for path in paths])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Search every tetrachord shape from every starting pitch class.')
+    parser.add_argument('directory', help='where to save the results (and where an interrupted search left off)')
+    parser.add_argument('--min-step', type=int, default=1, help='smallest step in semitones')
+    parser.add_argument('--max-step', type=int, default=4, help='largest step in semitones')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--shard-count', type=int, default=None)
+    arguments = parser.parse_args()
+    
+    num_searched = search_tetrachord_space(arguments.directory, arguments.min_step, arguments.max_step,
+                                           arguments.processes, arguments.shard_count)
+    rows = load_tetrachord_search(arguments.directory)
+    print('searched ' + str(num_searched) + ' shards; ' + str(len(rows)) + ' rows, '
+          + str(int(rows['full_coverage'].sum())) + ' with full coverage')
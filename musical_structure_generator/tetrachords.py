@@ -0,0 +1,164 @@
+"""
+Hyperdiatonic scales from stacked tetrachords.
+
+A tetrachord shape is four numbers of semitones, like the ones in old/harmonica_relationship_calculator.py:
+
+    major_tetrachord = [2, 2, 1, 2]
+
+The first three are the steps between the four notes of the tetrachord, and the fourth is the step from the last
+note of one tetrachord to the first note of the next. So stacking major tetrachords on C gives C D E F, G A B C,
+D E F# G, A B C# D and so on, which is Jacob Collier's hyper-lydian scale: it's the lydian tetrachord scale
+scale(['p1+', 'p2+', 'p2+', 'd2+'], 'p2+', [1, 2, 3, 4, 5]) repeated, with the fourth number as its continuation offset.
+
+We stack tetrachords until all 12 pitch classes turn up, or until stacking more can't add anything new. Every
+tetrachord is the first one moved up by the same number of semitones, so which pitch classes it adds only depends on
+where it starts, mod 12. Once a tetrachord starts on a pitch class that an earlier one started on, we're going round
+in a cycle and we stop. We keep track of the pitch classes with 12-bit masks, so each stack is a rotation and an or.
+"""
+
+
+import math
+
+from . import tones_and_intervals
+from .tones_and_intervals import scale, spell_span
+
+
+major_tetrachord = (2, 2, 1, 2)
+
+# Tetrachord scales we've already built, keyed by shape
+tetrachord_scales = {}
+
+
+def rotate_mask(mask, num_semitones, block_size=12):
+    """
+    Move every pitch class in a mask up by num_semitones (mod block_size)
+    """
+    
+    num_semitones %= block_size
+    full_mask = (1 << block_size) - 1
+    return ((mask << num_semitones) | (mask >> (block_size - num_semitones))) & full_mask
+
+
+def tetrachord_scale(shape):
+    """
+    The scale for one tetrachord of the given shape, with the fourth number of the shape as its continuation offset.
+    Steps of 1, 2 and 3 semitones are spelled as seconds (d2+, p2+ and a2+), so the tetrachord covers four letter
+    names and the next one starts on the fifth. We don't have names for other sizes of seconds, so we spell those
+    however semitones_to_diasteps does first, and the degrees follow that spelling. Every step has to go up at least
+    a semitone: a step of 0 would put a second p1+ in the scale.
+    """
+    
+    shape = tuple(shape)
+    if shape in tetrachord_scales:
+        return tetrachord_scales[shape]
+    
+    if len(shape) != 4 or not all(isinstance(num_semitones, int) for num_semitones in shape):
+        raise ValueError('a tetrachord shape is four integer numbers of semitones')
+    if min(shape) < 1:
+        raise ValueError('every step of a tetrachord shape has to go up at least one semitone')
+    
+    steps = [spell_span(num_semitones, 1) for num_semitones in shape]
+    
+    degree_list = [1]
+    for step in steps:
+        degree_list.append(degree_list[-1] + step._interval_sign*(step._interval_number - 1))
+    
+    new_scale = scale(['p1+'] + [str(step) for step in steps[:3]], str(steps[3]), degree_list)
+    tetrachord_scales[shape] = new_scale
+    return new_scale
+
+
+class tetrachord_stack:
+    """
+    The result of stacking a tetrachord shape (see stack_tetrachords). Pitch classes are numbered from C = 0, and the
+    masks have bit k set for pitch class k.
+    
+    shape                   the tetrachord shape
+    starting_pitch_class    the pitch class of the first note
+    num_stacks              how many tetrachords we stacked
+    coverage_masks          the pitch classes covered after each tetrachord
+    full_coverage           whether we got all 12
+    cycle_length            how many tetrachords it takes to start on the same pitch class again
+    """
+    
+    def __init__(self, shape, starting_pitch_class, coverage_masks, cycle_length, block_size=12):
+        self.shape = shape
+        self.starting_pitch_class = starting_pitch_class
+        self.coverage_masks = coverage_masks
+        self.num_stacks = len(coverage_masks)
+        self.cycle_length = cycle_length
+        self._block_size = block_size
+        self.full_coverage = coverage_masks[-1] == (1 << block_size) - 1
+    
+    
+    def __repr__(self):
+        return ('tetrachord_stack(' + str(list(self.shape)) + ', starting_pitch_class=' + str(self.starting_pitch_class)
+                + ', num_stacks=' + str(self.num_stacks) + ', full_coverage=' + str(self.full_coverage) + ')')
+    
+    
+    @property
+    def scale(self):
+        """
+        The stacked tetrachords as a scale, measured from the first note. It's a periodic_scale, so it doesn't cost
+        anything until we look inside it.
+        """
+        return tetrachord_scale(self.shape)*self.num_stacks
+    
+    
+    def density_curve(self):
+        """
+        How many pitch classes we had after each tetrachord
+        """
+        return [mask.bit_count() for mask in self.coverage_masks]
+    
+    
+    def missing_pitch_classes(self):
+        """
+        The pitch classes the stack never gets to
+        """
+        
+        missing_mask = ~self.coverage_masks[-1]
+        return [pitch_class for pitch_class in range(self._block_size) if missing_mask >> pitch_class & 1]
+
+
+def stack_tetrachords(shape, starting_pitch_class=0):
+    """
+    Stack tetrachords of the given shape starting on starting_pitch_class (C = 0) until we've covered all 12 pitch
+    classes, or until the next tetrachord would start on a pitch class that an earlier one started on (after which
+    nothing new can happen). Return a tetrachord_stack.
+    
+    For example, stack_tetrachords(major_tetrachord) covers everything after 7 tetrachords (C D E F, G A B C, ...,
+    F# G# A# B), and stack_tetrachords([2, 2, 1, 1]) starts over on C after 2 and never gets past 8 pitch
+    classes.
+    """
+    
+    shape = tuple(shape)
+    tetrachord_scale(shape)
+    
+    block_size = tones_and_intervals.diatonic_prototype_to_use.compile()._block_size
+    full_mask = (1 << block_size) - 1
+    
+    # The pitch classes of one tetrachord starting on 0, and how far each tetrachord moves the next one
+    tetrachord_mask = 0
+    position = 0
+    for num_semitones in (0,) + shape[:3]:
+        position += num_semitones
+        tetrachord_mask |= 1 << (position % block_size)
+    move = (position + shape[3]) % block_size
+    
+    coverage_masks = []
+    mask = 0
+    start = starting_pitch_class % block_size
+    starts_seen = 0
+    
+    while not starts_seen >> start & 1:
+        starts_seen |= 1 << start
+        mask |= rotate_mask(tetrachord_mask, start, block_size)
+        coverage_masks.append(mask)
+        if mask == full_mask:
+            break
+        start = (start + move) % block_size
+    
+    cycle_length = block_size // math.gcd(move, block_size)
+    
+    return tetrachord_stack(shape, starting_pitch_class % block_size, coverage_masks, cycle_length, block_size)
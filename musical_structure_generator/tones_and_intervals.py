@@ -0,0 +1,2692 @@
+
+
+"""
+ideas for generalization
+define letter names/codes for number of pitches in a generalized octave
+everything follows from there
+
+abcdefg for ionian diatonic
+
+maybe intervals follow from "prototypical scale" like C ionian, and you have 'p2', 'p3', ... for pure/perfect
+then each interval can be augmented/diminished an arbitrary number of times
+unison is a p1. "+" is default so you can leave it out
+can have different prototypical scales. You could have melodic minor-centric western harmony where c-eb is a "p3" and c-e is an "a3"
+atonal music can be chromatic-scale centric
+figure out how to express whatever xenharmonic system. western equally tempered should fall out of this
+maybe use scala/.kbd files
+generalize chorales/voice leading/counterpoint?
+should it accomodate the WAMatthieu derivation of just intonation? So in a just intonation system, the frequencies
+are computed on the fly based on the diatonic intervals?
+
+arbitrary octave length
+some rule for assigning frequency to pitch (like 19TET or whatever)
+
+"""
+
+
+"""
+I like complex, highly structured melodies and harmonies. I also like everything to be
+spelled enharmonically correctly. 
+
+We proceed as in harmony and voice-leading
+intervals form a group
+
+So I made this package to implement a very general 
+and flexible jazz scale theory that can be used to programmatically generate many different
+pan-diatonic musical structures derived from things like
+-Basic scales
+-Jacob Collier hyper mega meta ultra lydian scale and its generalizations
+-Arbitrary chord extensions like #15 or b39
+-Dave Liebman's whole chromatic theory, including synthetic scales
+-Mick Goodrick's system of voice-leading
+-Slonimsky's scales
+-Tonino Miano's whole atonal system
+-Hindustani and Carnatic ragas (what of them fits in our Western system)
+-canonic variations
+
+Once we have these we can use them for
+-Basic diatonic structures such as scales, thirds etc
+-Generating families of lines according to certain shapes
+-Vardan Ovsepian mirror exercises
+-Randomly iterating relevant parts of the above
+-Aydin Esin high-information lines
+-Dave Liebman "use only fourths and minor seconds"
+-Dividing into pitch classes such as {[c, f, e, g], [f#, a#, b, c#], [d, eb, ab, a]}
+-Putting any of these together contrapuntally
+-Negative harmony
+-Modes of limited transposition (not just with one octave)
+-Diatonic voice leading like Mick Goodrick
+-Generate diatonic exercise books
+-Do all of this within the compass of a particular voice or instrument
+-Writing out samchillian-style riffs
+
+We incorporate rhythmic patterns such as
+-Different time signatures
+-Eric Demaine's rhythmic necklaces
+-Arbitrary accent patterns
+-Many different polyrhythms
+
+We'll be able to do cute tricks like
+-Crazy computations in quintuple flats
+-Howard Levy "the 2 of the 5 is the 3 of the 2"
+-Something dan tepfer
+    -visualize complicated chromatic structures while they play?
+    -translate pictoral or other input into structured lines, relative to some scale? (like nok)
+-Take numeric input (like from transcendental numbers) and hear it
+
+We strive for high generality here, but note that enharmonic naming conventions are relative
+to the ionian scale (white keys on the piano), so we can't treat all 12 pitches equally
+for the purposes of notation (though when we're just listening, the way the performer might spell
+the pitches is irrelevant)
+
+TODO:
+-input validation on all of these...
+-implement compute_interest and compute how diatonic something is
+-figure out why __repr__ is not working
+-do melodic minor and tetrachords
+-when we're doing scale output, we need to be able to output the chord!
+-add a class for pitch
+-then a class for note
+-then time sigunature stuff like that eric demaine essay
+-add an option to expand pitches with enclosures
+-hindustani raga stuff?
+-a rendered scale is just a starting note + a scale, then extend that over the whole piano in both directions
+-implement quartertones? F, Fh#, F#, Ghb, Gb
+-implement overtone series 7th -31 pivot?
+-mick goodrick/dan tepfer voice leading?
+-make the exercise generator an iterator?
+"""
+
+
+
+import re
+import math
+import bisect
+import itertools
+from array import array
+
+from . import instrumentation
+
+
+class geninterval:
+    """
+    This class implements the concept of a generalized musical interval in Western equally-tempered tuning.
+    We phrase everything in terms of integer numbers of semi-tones
+    A generalized musical interval is the distance between an implicit base tone and a target tone, with an adjustment.
+    The adjustment is just the number of times it's augmented or diminished, which can be arbitrary.
+    We can derive standard Western music theory by stopping off at all the points in a major scale.
+    But we can use other scales too!
+    
+    Intervals form an abelian group under addition.
+    """
+
+    
+    def __init__(self, distance, adjustment):
+        """
+        Docstring
+        """
+        
+        # The distance and adjustment have to be integer numbers of semi-tones
+        if type(distance) != int:
+            raise ValueError('Interval distance must be an integer number of semi-tones')
+            
+        if type(adjustment) != int:
+            raise ValueError('Interval adjustment must be an integer number of semi-tones')
+        
+        # Define basic parameters
+        self._distance = distance
+        self._adjustment = adjustment
+        
+        # The size is just the total number of semitones, including adjustment
+        self._size = self._distance + self._adjustment
+        
+        # Define the direction of the interval, including adjustment
+        # Note that we can have positive distance, but negative size, as in (2, -3), a triply diminished major 2nd
+        if self._size < 0:
+            self._direction = '-'
+        elif self._size == 0:
+            self._direction = 'u'
+        elif self._size > 0:
+            self._direction = '+'
+            
+    def __len__(self):
+        return self._size
+    
+    def __str__(self):
+        return 'geninterval(' + str(self._distance) + ', ' + str(self._adjustment) + ')'
+        
+    def __repr__(self):
+        return 'geninterval(' + str(self._distance) + ', ' + str(self._adjustment) + ')'
+    
+    def __invert__(self): 
+        # Switch the direction of the interval
+        return geninterval(-1*self._distance, -1*self._adjustment)
+                
+    def __add__(self, other):
+        # Add two intervals by adding the components
+        return geninterval(self._distance + other._distance, self._adjustment + other._adjustment)
+
+    def __sub__(self, other):
+        # Subtract by adding the inverse
+        return self + ~other
+    
+    def reduce(self, equiv_length):
+        # Normally a reduce method here would reduce an interval to the lowest
+        # octave, so reduce(geninterval(13, 0)) = geninterval(1, 0). But we're 
+        # not assuming that an "octave" is 12 semitones here, so we include
+        # the equiv_length parameter.
+        if not (type(equiv_length) == int and equiv_length > 0):
+            raise ValueError('Equivalence length must be a positive integer')
+        return geninterval(self._distance % equiv_length, self._adjustment)
+    
+    def transpose(self, transposition):
+        # Transpose the interval by the specified transposition
+        if type(transposition) != int:
+            raise ValueError('Transposition amount must be an integer')
+        return geninterval(self._distance + transposition, self._adjustment)
+    
+    def adjust(self, additional_adjustment):
+        # Diminish or augment an interval the specified number of times
+        if type(additional_adjustment) != int:
+            raise ValueError('Adjustment amount must be an integer')
+        return geninterval(self._distance, self._adjustment + additional_adjustment)
+    
+    def __abs__(self):
+        # Return the equivalent ascending interval
+        if self._direction in ('+', 'u'):
+            return self
+        elif self._direction == ('-'):
+            return ~self
+    
+    def __eq__(self, other):
+        # Here we use mathematical equality so we can order intervals by length
+        # We'll have a separate method for enharmonic inequality, where a 
+        # diminished 3rd isn't the same as an augmented second
+        return self._size == other._size
+    
+    def __ne__(self, other):
+        return not self == other
+    
+    def __lt__(self, other):
+        return self._size < other._size
+    
+    def __le__(self, other):
+        return self._size <= other._size
+    
+    def __gt__(self, other):
+        return self._size > other._size
+    
+    def __ge__(self, other):
+        return self._size >= other._size
+    
+    def enharm_eq(self, other):
+        # We test theoretical equality, where the distance and adjustment both have to be equal
+        # (This is not the same as enharmonic equality, where two intervals are equal if they're the same size)
+        return self._distance == other._distance and self._adjustment == other._adjustment        
+
+    #def equal_div(self):
+        # Return all equal divisions of the interval
+
+
+#%%
+class diatonic_prototype:
+    """
+    Western tonal harmony identifies intervals based on the major scale.
+    The major scale is like the "white notes" on a piano
+    
+    major_scale_prototype = diatonic_prototype([0, 2, 2, 1, 2, 2, 2], 1, ['C', 'D', 'E', 'F', 'G', 'A', 'B'], [0, 5, 7])
+    
+    The arguments are
+    -a list of semi-tone offsets forming the scale degrees
+    -a scale continuation offset
+    -a list of note letter names
+    -a list of "perfect" intervals (that behave differently than regular intervals... 
+                                    here we have perfect unisons, perfect 4ths (5 semitones), 
+                                    and perfect 5ths(7 semitones))
+    
+    But this is not the only possible choice. The diatonic prototype specifies
+    what we mean by "diatonic"
+    It looks similar to a scale (which we define later)
+    """
+    
+    def __init__(self, scale_degrees, continuation_offset, letter_names, perfect_intervals):
+        """
+        Docstring.
+        """
+        
+        # Validate input
+        # TODO
+        # This has to be monotonically non-decreasing, no repeats
+        # all absolute intervals have to be less than the octave 
+        
+        # Initialize basic parameters
+        self._scale_degrees = scale_degrees
+        self._continuation_offset = continuation_offset
+        self._letter_names = letter_names
+        self._perfect_intervals = perfect_intervals
+        
+        # Compute block_size (typically it's an octave)
+        self._block_size = sum(scale_degrees) + continuation_offset
+        
+        # Compute diatonic scale size (typically it's 7 notes)
+        self._diatonic_scale_size = len(self._letter_names)
+        
+        # Compute absolute representation
+        self._absolute_representation = [self._scale_degrees[0]]
+        for i in range(len(self._scale_degrees) - 1):
+            self._absolute_representation.append(self._scale_degrees[i+1] + self._absolute_representation[i])
+        
+        # Compute non-perfect (major/minor intervals) within the octave
+        self._maj_min_intervals = sorted(list(set(self._absolute_representation) - set(self._perfect_intervals)))
+        
+        # Lookup tables for naming intervals, which we build in compile() the first time we need them
+        self._name_to_semitones = None
+        self._semitones_to_names = None
+        
+        # Caches that belong to this prototype, since the same interval string means different things under
+        # different prototypes. The interval class and the interval arithmetic functions use the ones belonging
+        # to the active prototype (see use_diatonic_prototype).
+        self._interval_intern_table = {}
+        self._semitones_to_diasteps_table = {}
+        self._diasteps_index = {}
+        
+        # Signed semitones of each scale step code (see interval_string_to_step_code)
+        self._step_code_semitones = {}
+        
+    def __repr__(self):
+        return "diatonic_prototype(" + str(self._scale_degrees) + ", " + str(self._continuation_offset) + ", " + str(self._letter_names) + ", " + str(self._perfect_intervals) + ")"
+    
+    def compile(self):
+        """
+        Build the two lookup tables we use for naming intervals with respect to this prototype:
+            
+            -_name_to_semitones maps each reduced interval name to its number of semi-tones, like 'p3': 4
+            -_semitones_to_names is a list indexed by semi-tones within the block, where each entry is a tuple of
+             all the (interval type, reduced interval number) names for that many semi-tones, pure names first, then
+             augmented, then diminished. So for the major scale prototype, entry 4 is (('p', 3), ('d', 4)).
+        
+        The pure intervals are the scale degrees of the prototype, augmented intervals are one semi-tone wider and 
+        diminished intervals are one semi-tone narrower. As with the major scale, there's no d1 (the diminished 
+        octave is d8, or whatever one more than the diatonic scale size is), and there's no augmented version
+        of the last scale degree.
+        
+        So for a melodic minor-centric prototype, diatonic_prototype([0, 2, 1, 2, 2, 2, 2], 1, ...), c-eb is a p3 
+        and c-e is an a3.
+        
+        We only do this once per prototype. Calling it again does nothing.
+        """
+        
+        if self._name_to_semitones is not None:
+            return self
+        
+        # The absolute representation has to start at 0, strictly increase, and stay inside the block
+        for lower, upper in zip([-1] + self._absolute_representation, self._absolute_representation + [self._block_size]):
+            if lower >= upper:
+                raise ValueError('The scale degrees of a diatonic prototype must start at 0 and strictly increase within the block')
+        if self._absolute_representation[0] != 0:
+            raise ValueError('The scale degrees of a diatonic prototype must start at 0 and strictly increase within the block')
+        
+        if len(self._absolute_representation) != self._diatonic_scale_size:
+            raise ValueError('A diatonic prototype needs one letter name per scale degree')
+        
+        name_to_semitones = {}
+        semitones_to_names = [[] for num_semitones in range(self._block_size)]
+        
+        # Pure intervals first, then augmented, then diminished, so each list of names comes out in that order
+        for interval_type, chromatic_offset in (('p', 0), ('a', 1), ('d', -1)):
+            for degree_index, degree_semitones in enumerate(self._absolute_representation):
+                reduced_interval_number = degree_index + 1
+                num_semitones = degree_semitones + chromatic_offset
+                
+                if interval_type == 'a' and reduced_interval_number == self._diatonic_scale_size:
+                    continue
+                if interval_type == 'd' and reduced_interval_number == 1:
+                    reduced_interval_number = self._diatonic_scale_size + 1
+                    num_semitones = self._block_size - 1
+                
+                name_to_semitones[interval_type + str(reduced_interval_number)] = num_semitones
+                semitones_to_names[num_semitones].append((interval_type, reduced_interval_number))
+        
+        self._name_to_semitones = name_to_semitones
+        self._semitones_to_names = [tuple(names) for names in semitones_to_names]
+        
+        return self
+    
+
+
+
+
+#%%
+major_scale_prototype = diatonic_prototype([0, 2, 2, 1, 2, 2, 2], 1, ['C', 'D', 'E', 'F', 'G', 'A', 'B'], [0, 4, 5])
+
+# The diatonic prototype that interval naming uses (see use_diatonic_prototype)
+diatonic_prototype_to_use = major_scale_prototype        
+        
+#%%
+
+
+
+# Translates diatonic intervals within one octave into the corresponding number of semi-tones
+# We'll say there's no such thing as d1 (diminished unison)
+# These four dictionaries spell out by hand what major_scale_prototype.compile() computes. The interval
+# class itself uses the tables of whichever prototype is active (see use_diatonic_prototype).
+diatonic_to_num_semitones = {
+    'p1': 0,
+'a1': 1,
+'d2': 1,
+'p2': 2,
+'a2': 3,
+    'd3': 3,
+    'p3': 4,
+    'd4': 4,
+    'a3': 5,
+    'p4': 5,
+    'a4': 6,
+    'd5': 6,
+    'p5': 7,
+    'a5': 8,
+'d6': 8,
+'p6': 9,
+'a6': 10,
+'d7': 10,
+'p7': 11,
+'d8': 11}
+
+# Translates a number of semi-tones into a corresponding pure diatonic interval
+num_semitones_to_pure = {
+0: 'p1',
+2: 'p2',
+4: 'p3',
+5: 'p4',
+7: 'p5',
+9: 'p6',
+11: 'p7'}
+
+# Translates a number of semi-tones into a corresponding augmented diatonic interval
+num_semitones_to_augmented = {
+1: 'a1',
+3: 'a2',
+5: 'a3',
+6: 'a4',
+8: 'a5',
+10: 'a6'}
+
+# Translates a number of semi-tones into a corresponding diminished diatonic inteval
+num_semitones_to_diminished = {
+1: 'd2',
+3: 'd3',
+4: 'd4',
+6: 'd5',
+8: 'd6',
+10: 'd7',
+11: 'd8'}
+
+
+# Table of every possible interval name for a given signed number of semi-tones, as computed by
+# semitones_to_diasteps. Adding two reduced intervals in any pair of directions lands somewhere
+# between -22 and 22 semi-tones (for the major scale prototype), so we fill that range in when a 
+# prototype is made active with use_diatonic_prototype. Anything else (including everything for the default
+# prototype, which we don't precompute at import time) gets filled in the first time we see it. We keep the names
+# as tuples, and hand out a fresh list each time, so nothing a caller does to its list can change the table.
+# Each prototype has its own table, and this name always points at the active prototype's.
+semitones_to_diasteps_table = {}
+
+
+
+
+
+
+
+def semitones_to_diasteps(num_semitones):
+    """
+    Take an integer number of semitones and return a list of all possible diatonic intervals
+    corresponding to that number. If num_semitones < 0, return a descending interval.
+    
+    This function is not actually a method that operates on intervals, though it returns intervals,
+    so we define it here in open code, not in the interval class
+    
+    For multi-valued outputs of this function, we leave it to downstream processes to choose a unique value
+    when necessary.
+    
+    Examples:
+    semitones_to_diasteps(4) = 4 returns [p3+, d4+]
+    semitones_to_diasteps(-5) returns [p4-, a3-]
+    """
+    
+    # Make sure the input is an integer
+    if type(num_semitones) != int:
+        raise ValueError('num_semitones must be an integer')
+    
+    # If we've already done this computation, just look it up
+    if num_semitones in semitones_to_diasteps_table:
+        if instrumentation.enabled:
+            instrumentation.count('semitones_to_diasteps_table.hits')
+        return list(semitones_to_diasteps_table[num_semitones])
+    
+    if instrumentation.enabled:
+        instrumentation.count('semitones_to_diasteps_table.misses')
+    
+    # We'll do all of our arithemtic in the positive world, then return the correct direction later
+    raw_num_semitones = abs(num_semitones)
+    
+    # Get direction for final interval(s)
+    if num_semitones < 0:
+        new_direction = '-'
+    elif num_semitones >= 0:
+        new_direction = '+'
+    
+    # Account for numbers higher than one block (an octave, for the major scale prototype)
+    prototype = diatonic_prototype_to_use.compile()
+    base_num_semitones = raw_num_semitones % prototype._block_size
+    octave_offset = raw_num_semitones // prototype._block_size
+    
+    # Look up all the pure, augmented and diminished names for this many semi-tones in the prototype,
+    # then shift them up by the octave offset
+    possible_results = []
+    for interval_type, reduced_interval_number in prototype._semitones_to_names[base_num_semitones]:
+        new_interval_number = reduced_interval_number + prototype._diatonic_scale_size*octave_offset
+        possible_results.append(interval(interval_type + str(new_interval_number) + new_direction))
+
+    # Remember the result for next time
+    semitones_to_diasteps_table[num_semitones] = tuple(possible_results)
+
+    return possible_results
+
+
+def dereference_diasteps_output(list_of_ints, target_num):
+    """
+    We need to be able to dereference a multivalued list of intervals from 
+    semitones_to_diasteps. Usually we do this by choosing what degree of the
+    scale we're talking about. We implement that here via target_num
+    """
+    if instrumentation.enabled:
+        instrumentation.count('interval.dereferences')
+        
+    for i in range(len(list_of_ints)):
+        if list_of_ints[i]._interval_number == target_num:
+            return list_of_ints[i]
+        
+    # if we found nothing
+    raise ValueError("No interval with that number can be found")
+
+
+# Index of correctly spelled intervals keyed by (signed number of semi-tones, target interval number).
+# We fill it in lazily from semitones_to_diasteps, so it covers any number of octaves. Like 
+# semitones_to_diasteps_table, this always points at the active prototype's index.
+diasteps_index = {}
+
+def dereference_semitones(num_semitones, target_num):
+    """
+    This does the same job as dereference_diasteps_output(semitones_to_diasteps(num_semitones), target_num),
+    but with a single dictionary lookup once we've seen this number of semi-tones before. For example,
+    dereference_semitones(4, 3) returns interval('p3+') and dereference_semitones(4, 4) returns interval('d4+').
+    """
+    
+    if instrumentation.enabled:
+        instrumentation.count('interval.dereferences')
+        instrumentation.count('diasteps_index.hits' if (num_semitones, target_num) in diasteps_index else 'diasteps_index.misses')
+    
+    try:
+        return diasteps_index[num_semitones, target_num]
+    except KeyError:
+        pass
+    
+    # First time we've seen this number of semi-tones, so index all of its possible names
+    for possible_interval in semitones_to_diasteps(num_semitones):
+        diasteps_index[num_semitones, possible_interval._interval_number] = possible_interval
+    
+    if (num_semitones, target_num) in diasteps_index:
+        return diasteps_index[num_semitones, target_num]
+        
+    # if we found nothing
+    raise ValueError("No interval with that number can be found")
+    
+
+
+# Validation pattern for interval shorthand strings like 'p4+' or 'd12-'. We compile it once here
+# rather than on every call, since it sits on the path of every new interval.
+interval_string_pattern = re.compile(r'[adp]\d+[+-]')
+
+
+class interval:
+    """
+    This class implements the concept of a musical interval in diatonic Western music.
+    
+    Intervals are immutable flyweights. Each distinct shorthand string like 'p4+' gets parsed exactly once,
+    and the resulting object is stored in an interning table on the class. Every later interval('p4+') just
+    hands back that same object. Scales, interval addition, reduce(), abs() and reverse_direction() construct
+    intervals constantly, so this saves both the parsing time and the memory of storing the same parsed
+    attributes over and over (think hyperdiatonic scales with tens of thousands of steps).
+    
+    Since intervals are immutable, they're also hashable, so we can use them in sets and as dictionary keys.
+    """
+    
+    __slots__ = ('_interval', '_interval_name', '_interval_type', '_interval_number', '_interval_direction',
+                 '_interval_sign', '_reduced_interval_number', '_reduced_interval_name', '_base_length',
+                 '_octave_offset', '_length', '_width_key', '_sort_key')
+    
+    # The interning table, which maps each shorthand string we've seen to its unique interval object.
+    # This is the active prototype's table (see use_diatonic_prototype).
+    _intern_table = {}
+
+    
+    def __new__(cls, interval):
+        """
+        Class to implement musical intervals.
+        
+        The interval_name paramter is something like p4+, a5+ or d6- to represent
+        a pure fourth up, augmented fifth up, diminished sixth down and such like. We're going 
+        to say there are no double diminished or double augmented intervals (or such like).
+        
+        The key thing we're trying to capture is the function of the note relative to the harmonic
+        context.
+        
+        The last character of the string is either '+' or '-' depending on whether you mean
+        the interval is going up or down. The only thing below that depends on direction is
+        interval addition.
+        
+        We use '+' as the default direciton.
+        
+        Pure interval categories (fundamental plus octave shifted):
+            Unison/Octave/Fifteenth: p1+, p8+, p15+, etc. (1 + 7n for n >= 0)      
+            Second/Ninth/Sixteenth: p2+, p9+, p16+, etc. (2 + 7n for n >= 0)
+            Third/etc.: p3+, p10+, p17+, etc. (3 + 7n for n >= 0)
+            Fourth: p4+, p11+, p18+, etc. (4 + 7n for n >= 0)
+            Fifth: p5+, p12+, p19+, etc. (5 + 7n for n >= 0)
+            Sixth: p6+, p13+, p2+0, etc. (6 + 7n for n >= 0)
+            Seventh: p7+, p14+, p21+ etc. (7 + 7n for n >= 0)
+
+            General: reduced_interval_number + 7*octave_offset
+
+        Augmentable intervals: a1+, a2+, a3+, a4+, a5+, a6+ and further octave shifts
+        Diminishable intervals: d2+, d3+, d4+, d5+, d6+, d7+, d8+ and further octave shifts
+        Basically, d1+ doesn't exist, and a7+, a14+, a21+, etc. don't exist
+        
+        We do the parsing here in __new__ rather than in __init__, so that we can hand back the
+        interned object without touching it when we've already seen this string.
+        """
+        
+        # If we've seen this string before, we're done
+        existing_interval = cls._intern_table.get(interval)
+        if existing_interval is not None:
+            if instrumentation.enabled:
+                instrumentation.count('interval_intern.hits')
+            return existing_interval
+        
+        if instrumentation.enabled:
+            instrumentation.count('interval_intern.misses')
+        
+        # Otherwise parse it, build a new object from the parsed attributes, and intern it
+        new_interval = object.__new__(cls)
+        for attribute_name, attribute_value in zip(cls.__slots__, cls._parse(interval)):
+            object.__setattr__(new_interval, attribute_name, attribute_value)
+        
+        cls._intern_table[interval] = new_interval
+        return new_interval
+    
+    
+    @staticmethod
+    def _parse(interval):
+        """
+        Validate an interval shorthand string and break it up into its parts. We return the parts
+        as a tuple in the same order as __slots__.
+        """
+        
+        # Validate interval_name input
+        # Has to be a string with a, d, or p followed by an integer > 1 followed by + or -
+        # and can't be d1 or a7, a14, a21, etc
+        
+        if not interval_string_pattern.match(interval):
+            raise ValueError('Interval name must be [adp] followed by a number > 1 followed by a + or -')
+            
+        if int(interval[:-1][1:]) < 1:
+            raise ValueError('Interval number must be > 1')
+        
+        if interval[:-1] == 'd1':
+            raise ValueError("diminshed 1s don't exist in this system")
+        
+        # Everything else depends on the active diatonic prototype
+        prototype = diatonic_prototype_to_use.compile()
+        diatonic_scale_size = prototype._diatonic_scale_size
+        
+        if interval[:-1][0] == 'a' and int(interval[:-1][1:]) % diatonic_scale_size == 0:
+            raise ValueError("augmented sevenths (and octave shifts) don't exist in this system")
+        
+        # Without the direction
+        interval_name = interval[:-1]
+        
+        # interval_type and interval_number break up interval_name = 'p5' into
+        # interval_type = 'p' and interval_number = 5
+        interval_type = interval_name[0]
+        interval_number = int(interval_name[1:])
+        interval_direction = interval[-1:]
+        
+        if interval_direction == '+':
+            interval_sign = 1
+        elif interval_direction == '-':
+            interval_sign = -1
+        
+        # Compute the equivalent diatonic interval name in one octave
+        # We use mod 7 arithemtic (or mod whatever the size of the prototype's diatonic scale is)
+        # This way, we know that a pure 17th is just a pure third plus two octaves
+        reduced_interval_number = interval_number % diatonic_scale_size
+        
+        # We start pure sevenths with 7 instead of 0
+        # (since here is no diatonic 'pure 0' relationship)
+        if reduced_interval_number == 0:
+            reduced_interval_number = diatonic_scale_size
+        
+        # Similarly, there's no such thing as a d1, so diminished octaves (and their octave shifts)
+        # reduce to d8 instead
+        if interval_type == 'd' and reduced_interval_number == 1:
+            reduced_interval_number = diatonic_scale_size + 1
+        
+        # Form the diatonic name of the reduced interval
+        # Also compute the number of half steps in it as base_length
+        # So for a pure 17th, reduced_interval_name = 'p3' and base_length = 4
+        reduced_interval_name = interval_type + str(reduced_interval_number)
+        base_length = prototype._name_to_semitones[reduced_interval_name]
+            
+        # Compute how many octaves above the first that our interval lies in
+        # So for a pure 17th, octave_offset = 2
+        octave_offset = (interval_number - reduced_interval_number) // diatonic_scale_size
+        
+        # The total number of semitones, which we store since it's used everywhere
+        length = base_length + prototype._block_size*octave_offset
+        
+        # Integer keys for comparing intervals (see __eq__ below). The width key is the signed width, doubled
+        # so that a p1- comes just below a p1+. Intervals are equal exactly when their width keys are equal.
+        # The sort key breaks ties between equal intervals so that we get a total order for sorting: we
+        # put dX before pX before aX going up, and the other way around going down.
+        width_key = 2*interval_sign*length + (interval_sign + 1)//2
+        if interval_sign == 1:
+            type_rank = 'dpa'.index(interval_type)
+        else:
+            type_rank = 'apd'.index(interval_type)
+        sort_key = 4*width_key + type_rank
+        
+        return (interval, interval_name, interval_type, interval_number, interval_direction,
+                interval_sign, reduced_interval_number, reduced_interval_name, base_length,
+                octave_offset, length, width_key, sort_key)
+    
+    
+    def __setattr__(self, name, value):
+        raise AttributeError('intervals are immutable')
+    
+    def __delattr__(self, name):
+        raise AttributeError('intervals are immutable')
+    
+    def __reduce__(self):
+        # Rebuild from the shorthand string when unpickling, so we go through the interning table
+        return (interval, (self._interval,))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __hash__(self):
+        # __eq__ compares intervals by width (see below), so we hash on the width key
+        return hash(self._width_key)
+    
+    def sort_key(self):
+        """
+        An integer that sorts intervals in the order described in __eq__, with ties between equal intervals
+        broken by type, so sorted(intervals, key=interval.sort_key) always comes out the same way
+        """
+        return self._sort_key
+                     
+    def __len__(self):
+        """
+        Return the number of semitones in the given interval
+        This could also be called diasteps_to_semitones in comparison with the
+        previous function.
+        """
+        return self._length
+    
+    def __str__(self):
+        return self._interval
+        
+    def __repr__(self):
+        return 'interval(' + self._interval + ')'
+    
+    def reverse_direction(self):
+        """
+        Reverse the direction of the interval
+        """
+        if self._interval_direction == '+':
+            new_direction = '-'
+        elif self._interval_direction == '-':
+            new_direction = '+'
+            
+        return interval(self._interval_name + new_direction)
+    
+            
+    def __add__(self, other):
+        """
+        What happens when we add two intervals together, including direction? We get a result
+        that may have up to two different possible names. For this function, we return
+        a list of such names, and leave it to each downstream process to choose the right enharmonic value from
+        the list where a single value is required.
+        
+        Use this code to convince yourself that we can add any two types of intervals, and have the result be any of the two types.
+        
+        reduced_intervals = ['p1','a1','d2','p2','a2','d3','p3','d4','a3','p4','a4','d5','p5','a5','d6','p6','a6','d7','p7']
+        directions = ['+', '-']
+        
+        results = []
+        for first in reduced_intervals:
+            for second in reduced_intervals:
+                for first_direction in directions:
+                    for second_direction in directions:
+                                        
+                        addition = interval(first + first_direction) + interval(second + second_direction)
+                        
+                        if len(addition) > 1:
+                            str_to_add = ''
+                            for i in addition:
+                                str_to_add += str(i)[0]
+                                
+                            results.append(str(first)[0] + str(second)[0] + '__' + str_to_add)
+        
+        """
+        
+        if instrumentation.enabled:
+            instrumentation.count('interval.additions')
+        
+        # Add the lengths of the two intervals to get the total number of semitones
+        # in the new interval
+        new_num_semitones = self._interval_sign*len(self) + other._interval_sign*len(other)
+        
+        # Use the non-class function to compute all allowable interval representations for the number
+        # of semitones we computed. This is a lookup in semitones_to_diasteps_table after the first time.
+        return semitones_to_diasteps(new_num_semitones)
+    
+    
+    def __sub__(self, other):
+        """
+        Interval subraction is the opposite of interval addition.
+        
+        Again, we return a list of all possible results, to be disambiguated later.
+        """
+        return self + other.reverse_direction()
+    
+    def reduce(self):
+        """
+        We store the components of this as strings when we initialize an interval. Here's a way
+        to get the reduced interval form as an interval object to be used for computations.
+        """
+        
+        reduced_interval_string = self._reduced_interval_name + self._interval_direction
+        return interval(reduced_interval_string)
+    
+    
+    def invert(self, wrt):
+        """             
+        Invert an interval with respect to (wrt) an octave up, or some other
+        (positive or negative) distance that we specify.
+        """
+        return wrt - self
+    
+    def enharmonically_equal(self, other):
+        """
+        This is an equality function for two intervals that are enharmonically equivalent. In practice, this means that 
+        their interval strings are identically equal, so 'a4+' == 'a4+' but 'a4+' != 'd5-'. (We save the __eq__ method for
+        testing if the intervals have the same length on a piano keyboard, and 'a4+' == 'd5+'.)
+        """
+        
+        if self._interval == other._interval:
+            return True
+        else:
+            return False
+    
+    
+    def __eq__(self, other):
+        """
+        We need a way to order intervals. We'll do it by how wide they are, so an augmented fourth is equal to a diminished fifth.
+        Of course, enharmonically they are very different, but when comparing intervals, we'd like to be able to say things like 
+        "any interval equal to or smaller than a tritone"--that is, use the <= operator without caring about enharmonicism            
+        
+        We'll say that descending intervals have "negative width". 
+        
+            'p1+' < 'a1+' = 'd2+' < 'p2+' < 'a2+' = 'd3+' < 'p3+' = 'd4+' < 'a3+' = 'p4+' < 'a4+'= 'd5+' < 'p5+' < 'a5+' = 'd6+' < 'p6+'< 'a6+' = 'd7+' < 'p7+' < 'p8' < ...
+        
+        So:
+            -the numbers break order around the half step between the 3 and 4 in an ionian scale
+            -if the interval numbers are equal, we have dX < pX < aX
+            -if we have intervals with number x and x + 1, 
+                -a(x) = d(x+1)
+                -p3 = d4 and a3 = p4, and anything else with the numbers congruent to this mod 7
+            -if we have intervals with numbers x and y >= x + 2, y > x
+            -descending intervals are ordered in reverse of the corresponding ascending intervals (so 'p5-' < 'd5-' < ... < 'd5+' < 'p5+')
+            -p1- < p1+, even though they're both zero semi-tones wide
+        
+        All of this boils down to comparing signed widths, which we precompute as _width_key when we parse the
+        interval string, so comparisons are just integer comparisons.
+        """
+        
+        if not isinstance(other, interval):
+            return NotImplemented
+        return self._width_key == other._width_key
+        
+
+    def __lt__(self, other):
+        """
+        See the discussion of __eq__ for this.
+        """
+        
+        if not isinstance(other, interval):
+            return NotImplemented
+        return self._width_key < other._width_key
+        
+    def __le__(self, other):
+        if not isinstance(other, interval):
+            return NotImplemented
+        return self._width_key <= other._width_key
+    
+    def __ne__(self, other):
+        if not isinstance(other, interval):
+            return NotImplemented
+        return self._width_key != other._width_key
+    
+    def __gt__(self, other):
+        if not isinstance(other, interval):
+            return NotImplemented
+        return self._width_key > other._width_key
+    
+    def __ge__(self, other):
+        if not isinstance(other, interval):
+            return NotImplemented
+        return self._width_key >= other._width_key
+    
+    def __abs__(self):
+        """
+        |p4+| == |p4-| == p4+, and so on.
+        """
+        
+        if self._interval_direction == '+':
+            return self
+        elif self._interval_direction == '-':
+            corresponding_positive_interval = self._interval_name + '+'
+            return interval(corresponding_positive_interval)
+        
+
+class sorted_interval_collection:
+    """
+    A collection of intervals kept in sorted order (by interval.sort_key), so that we can answer
+    questions like "everything up to a tritone" by bisection instead of comparing against every interval.
+    
+        my_intervals = sorted_interval_collection(['p2+', 'a4+', 'd5+', 'p5+', 'p3-'])
+        my_intervals.up_to(interval('a4+')) = [interval(p3-), interval(p2+), interval(d5+), interval(a4+)]
+    
+    Range queries go by width, just like the comparison operators, so asking for everything up to an a4+
+    includes the d5+ too.
+    """
+    
+    def __init__(self, intervals=()):
+        """
+        intervals can be interval objects or shorthand strings.
+        """
+        
+        self._intervals = sorted((interval(str(i)) for i in intervals), key=interval.sort_key)
+        self._sort_keys = [i._sort_key for i in self._intervals]
+    
+    def __len__(self):
+        return len(self._intervals)
+    
+    def __iter__(self):
+        return iter(self._intervals)
+    
+    def __getitem__(self, index):
+        return self._intervals[index]
+    
+    def __repr__(self):
+        return 'sorted_interval_collection([' + ', '.join(str(i) for i in self._intervals) + '])'
+    
+    def __contains__(self, other):
+        # Membership is by width, like ==
+        low_index, high_index = self._index_range(other, other)
+        return low_index < high_index
+    
+    def add(self, new_interval):
+        """
+        Add an interval, keeping everything in order.
+        """
+        
+        new_interval = interval(str(new_interval))
+        position = bisect.bisect_right(self._sort_keys, new_interval._sort_key)
+        self._sort_keys.insert(position, new_interval._sort_key)
+        self._intervals.insert(position, new_interval)
+    
+    def _index_range(self, low, high):
+        # Every interval with the same width key as low or high shares its sort key divided by 4,
+        # so the ranges of sort keys we need are easy to write down
+        low_position = 0 if low is None else bisect.bisect_left(self._sort_keys, 4*interval(str(low))._width_key)
+        high_position = len(self._sort_keys) if high is None else bisect.bisect_right(self._sort_keys, 4*interval(str(high))._width_key + 3)
+        return low_position, max(low_position, high_position)
+    
+    def between(self, low, high):
+        """
+        Return a list of all intervals i with low <= i <= high. Either end can be None to leave it open.
+        """
+        
+        low_position, high_position = self._index_range(low, high)
+        return self._intervals[low_position:high_position]
+    
+    def count_between(self, low, high):
+        """
+        Same as len(self.between(low, high)), but without building the list
+        """
+        
+        low_position, high_position = self._index_range(low, high)
+        return high_position - low_position
+    
+    def up_to(self, high):
+        """
+        All intervals i with i <= high
+        """
+        return self.between(None, high)
+    
+    def at_least(self, low):
+        """
+        All intervals i with i >= low
+        """
+        return self.between(low, None)
+
+
+def use_diatonic_prototype(prototype):
+    """
+    Make the given diatonic prototype the one that interval() and interval arithmetic use for naming intervals.
+    For example, after
+    
+        use_diatonic_prototype(diatonic_prototype([0, 2, 1, 2, 2, 2, 2], 1, ['C', 'D', 'Eb', 'F', 'G', 'A', 'B'], [0, 4, 5]))
+    
+    len(interval('p3+')) is 3 and len(interval('a3+')) is 4.
+    
+    Each prototype compiles its lookup tables and precomputes addition of reduced intervals the first time it
+    becomes active, and keeps its own interning table and caches. So switching back and forth between prototypes
+    is just swapping which tables we point at.
+    
+    Interval objects belong to the prototype that was active when they were made, so don't mix intervals from 
+    different prototypes in the same computation.
+    """
+    
+    global diatonic_prototype_to_use, semitones_to_diasteps_table, diasteps_index
+    
+    prototype.compile()
+    
+    diatonic_prototype_to_use = prototype
+    interval._intern_table = prototype._interval_intern_table
+    semitones_to_diasteps_table = prototype._semitones_to_diasteps_table
+    diasteps_index = prototype._diasteps_index
+    
+    # Precompute interval addition for every pair of reduced intervals in every pair of directions
+    if not semitones_to_diasteps_table:
+        widest_reduced_sum = 2*(prototype._block_size - 1)
+        for num_semitones in range(-widest_reduced_sum, widest_reduced_sum + 1):
+            semitones_to_diasteps(num_semitones)
+    
+    return prototype
+
+
+# Point the interval class and the arithmetic tables at the default prototype. We don't compile it or
+# precompute anything here, so importing this module stays cheap; the tables fill in as they get used.
+interval._intern_table = major_scale_prototype._interval_intern_table
+semitones_to_diasteps_table = major_scale_prototype._semitones_to_diasteps_table
+diasteps_index = major_scale_prototype._diasteps_index
+    
+#%%
+
+# Scales store each of their intervals as a small integer code rather than as an interval object or string:
+# 6*number + 2*(0 for d, 1 for p, 2 for a) + (0 going up, 1 going down), so 'p1+' is 8, 'p2+' is 14 and 'd3-' is 19.
+# The codes only depend on the shorthand string, not on the diatonic prototype, so they mean the same thing in
+# every process and we can hash and store them. These two tables just save us redoing the conversions.
+step_codes_by_string = {}
+step_strings_by_code = {}
+
+root_step_code = 8
+
+
+def interval_string_to_step_code(interval_string):
+    """
+    The code of an interval shorthand string, like 14 for 'p2+'. We parse the string the first time we see it,
+    so invalid intervals raise a ValueError here.
+    """
+    
+    code = step_codes_by_string.get(interval_string)
+    if code is None:
+        step = interval(interval_string)
+        code = 6*step._interval_number + 2*'dpa'.index(step._interval_type) + (1 if step._interval_sign == -1 else 0)
+        step_codes_by_string[interval_string] = code
+        step_strings_by_code[code] = interval_string
+    
+    return code
+
+
+def step_code_to_interval(code):
+    """
+    The interval with the given code (see interval_string_to_step_code), like interval('p2+') for 14
+    """
+    
+    interval_string = step_strings_by_code.get(code)
+    if interval_string is None:
+        interval_number, rest = divmod(code, 6)
+        interval_string = 'dpa'[rest // 2] + str(interval_number) + '+-'[rest % 2]
+        step_strings_by_code[code] = interval_string
+        step_codes_by_string[interval_string] = code
+    
+    return interval(interval_string)
+
+
+def compact_int_array(values):
+    """
+    Store a list of integers in the smallest kind of array that holds all of them (one byte each if they're small enough)
+    """
+    
+    values = list(values)
+    low = min(values, default=0)
+    high = max(values, default=0)
+    for typecode in 'bhiq':
+        bound = 1 << (8*array(typecode).itemsize - 1)
+        if -bound <= low and high < bound:
+            return array(typecode, values)
+    
+    raise ValueError('integers too big to store')
+
+
+def spell_span(num_semitones, degree_change):
+    """
+    The interval covering num_semitones that moves degree_change degrees, so spell_span(11, 6) is p7+ and spell_span(-3, -2)
+    is d3-. If there's no such interval in our system, we settle for the first name semitones_to_diasteps gives us.
+    """
+    
+    try:
+        return dereference_semitones(num_semitones, 1 + abs(degree_change))
+    except ValueError:
+        return semitones_to_diasteps(num_semitones)[0]
+
+
+def degree_to_interval_number(degree):
+    """
+    Which interval number spells a note of the given degree, measured from the root. Degrees 1 and up are just
+    the interval number (degree 3 is a third). Going below the root, degree 0 is a second down, degree -1 a third down
+    and so on, so degree -6 is an octave down (the C below C is 8 - 7 * 2 = -6 in a scale with 7 degrees per octave).
+    """
+    
+    if degree >= 1:
+        return degree
+    return 2 - degree
+
+
+class scale:
+    """
+    A scale is an ordered list of intervals, a continuation offset, and a degree list.
+    
+    We allow for a great deal of generality. We can represent
+    -Non-monotonic scales (ones where the next pitch is not necessarily higher than the previous)
+    -Scales that don't repeat at the octave (they can have any positive integer period)
+    -Scales that don't start on the root (like playing G pentatonic over a C root)
+    
+    We do, however, limit ourselves to western equally-tempered 12-tone theory when constructing our scales.
+     
+    The list of intervals starts out with the root, which is the identity 'p1+' for rooted scales. Subsequent intervals tell how far to
+    go to get to the next note.   
+    
+    But scales can be rootless and not have a 'p1+' in their interval list. For example, we might imagine playing a G pentatonic
+    scale [D, E, G, A, B] with respect to a C root. Here, the first interval would be 'p2+' (the distance from C to D).
+    
+    The subsequent intervals give the distance to the next note relative to the previous note. This list does not include the "top" pitch of the scale.
+    For example, a C ionian scale is commonly played as C D E F G A B C, where that last C is just a pivot point for beginning the descent,
+    or continuing into a second octave. For us, though, a C ionian scale is just the ordered pitch collection C D E F G A B--we don't repeat the C at the end.
+    Instead, we give a continuation offset which says how far to go from B to continue playing the scale. In this case, the continuation
+    offset would be 'd2+', representing the half step from B to C. Then a 2-octave version of this scale would be C D E F G A B C D E F G A B C.
+    Of course, if we used 'p2+', we'd get C D E F G A B C# D# E# F# G# A# B#. So the continuation offset enables us to achieve pan-octave
+    generality in the scales we represent.
+    
+    The intervals in a C ionian scale are commonly given as WWHWWWH, where W is a whole step and H is a half step. For us, the interval list
+    plus the continuation offset is as follows (with the next line showing an example with C ionian):
+    
+                    ['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+'
+        (C root)          C      D       E     F      G      A        B     C
+    
+    Giving scales in terms of relative intervals like this is simple and compact. We can easily calculate the corresponding absolute scale representation.
+    And in the pitch class, we will "render" scales with a given pitch as the root as a list of the corresponding pitches built off of that root.
+    
+    There's also the degree list which tells us what diatonic function each abstract relative pitch in the scale has with respect to the root. This encodes each
+    pitch's functionality and enables us to use it later. Of course, we don't need to specify actual pitches to do this. Let's put a line for the degree
+    list in our example above:
+
+                    ['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+'
+        (C root)          C      D       E     F      G      A        B     C
+                    [     1,     2,      3,    4,     5,     6,       7,    8]
+        
+    This represents things like "E is a diatonic 3 in C ionian" and "when continuing a C scale past the first period, the next note is C, which is a 
+    diatonic 8 (octave) in C ionian".
+    
+    Let's recall what a "diatonic 3" is, because it's important for what we're doing. When moving up steps of scales with degree list [1, 2, 3, 4, 5, 6, 7],
+    the pitches need to be spelled in some mathematical interval of the repeated list of diatonic pitches, [A, B, C, D, E, F, G]*n for some n, with chromatic
+    alterations to match. For example, an E ionian scale is E F# G# A B C# D#, where we wrap around the list of pitches going from G# back to A. We wouldn't
+    write E F# Ab A B C# D#. Ab is not a 3 in the key of E--we've skipped the letter G. Ab is the same pitch, but it represents a "flat 4" in the key of E, which
+    is weird. Unless something very special is going on, we shouldn't spell that pitch this way when writing an E scale.
+    
+    Now consider an E# ionian scale. By the above paragraph, we should spell it E#, Fx, Gx, A#, B#, Cx, Dx. It's exactly the same pitches and keys on the piano as
+    an F ionian scale, F G A Bb C D E. But if we're viewing it as E#, the proper diatonic spelling is the one we just gave. It would be a mistake to "dereference"
+    Gx to A, because A is a 4 in the key of E#.
+        
+    Anyway, the full initialization of the ionian scale, with the intervals, continuation offset, and degree list is:
+        
+        c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+    
+    """
+    
+    
+    __slots__ = ('_step_codes', '_continuation_code', '_degrees', '_rootness', '_hash',
+                 '_absolute_table_cache', '_absolute_scale', '_mode_cache')
+    
+    
+    @instrumentation.timed('scale.build')
+    def __init__(self, list_of_interval_strings, continuation_offset, degree_list):
+        """
+        The list_of_interval_strings is a list of intervals that we initialize using shorthand notation--
+        so instead of initializing with list_of_interval_strings as [interval('p1+'), interval('p2+'), interval('p2+')],
+        we can initialize using list_of_interval_strings = ['p1+', 'p2+', 'p3+']. The list must either
+        start with 'p1+' (rooted) or not contain 'p1+' (rootless)
+        
+        Similarly, continuation_offset is an interval string. This parameter tells us how to add scales together,
+        which enables hyperdiatonic systems and other things.
+        
+        The degree list is just a list of numbers.
+        
+        Scales are immutable, and we keep them small, since we generate a lot of them: the intervals are stored as
+        integer codes (see interval_string_to_step_code) and the codes and degrees live in compact arrays. Everything
+        else, like the list of interval objects, gets worked out from those when we ask for it.
+        """
+        
+        step_codes = compact_int_array(interval_string_to_step_code(interval_string) for interval_string in list_of_interval_strings)
+        continuation_code = interval_string_to_step_code(continuation_offset)
+        
+        self._set_contents(step_codes, continuation_code, compact_int_array(degree_list))
+    
+    
+    @classmethod
+    @instrumentation.timed('scale.build')
+    def _from_codes(cls, step_codes, continuation_code, degrees):
+        """
+        Make a scale straight from step codes and degrees (arrays or lists), skipping the interval strings. We use this
+        whenever we build scales out of other scales, since their codes are already valid. It goes under the same
+        'scale.build' timer as __init__, so the timer counts every scale we make.
+        """
+        
+        new_scale = object.__new__(cls)
+        new_scale._set_contents(compact_int_array(step_codes), continuation_code, compact_int_array(degrees))
+        return new_scale
+    
+    
+    def _set_contents(self, step_codes, continuation_code, degrees):
+        set_attribute = object.__setattr__
+        
+        set_attribute(self, '_step_codes', step_codes)
+        set_attribute(self, '_continuation_code', continuation_code)
+        set_attribute(self, '_degrees', degrees)
+        
+        # mark rooted or rootless
+        set_attribute(self, '_rootness', 'rooted' if root_step_code in step_codes else 'rootless')
+        
+        # We work these out the first time someone asks for them (see __hash__, _absolute_tables, absolute_scale_repr and all_modes)
+        set_attribute(self, '_hash', None)
+        set_attribute(self, '_absolute_table_cache', None)
+        set_attribute(self, '_absolute_scale', None)
+        set_attribute(self, '_mode_cache', None)
+    
+    
+    def __setattr__(self, name, value):
+        raise AttributeError('scales are immutable')
+    
+    def __delattr__(self, name):
+        raise AttributeError('scales are immutable')
+    
+    def __reduce__(self):
+        # Pickle just the codes and degrees, and rebuild through _from_codes
+        return (scale._from_codes, (self._step_codes, self._continuation_code, self._degrees))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    
+    # The parts of a scale in the forms we used to store them in, worked out from the codes
+    
+    @property
+    def _scale_steps(self):
+        return [step_code_to_interval(code) for code in self._step_codes]
+    
+    @property
+    def _str_list_of_interval_strings(self):
+        return [str(step) for step in self._scale_steps]
+    
+    @property
+    def _continuation_offset(self):
+        return step_code_to_interval(self._continuation_code)
+    
+    @property
+    def _str_continuation_offset(self):
+        return str(self._continuation_offset)
+    
+    @property
+    def _degree_list(self):
+        return list(self._degrees)
+    
+    
+    def content_key(self):
+        """
+        Everything that makes this scale what it is, as a tuple of integers: the step codes, the continuation code, and the
+        degrees. Two scales are equal exactly when their content keys are, and since these are plain integers, the key
+        (and the hash) comes out the same in every process.
+        """
+        
+        return (tuple(self._step_codes), self._continuation_code, tuple(self._degrees))
+    
+    
+    def __eq__(self, other):
+        # Sums and repeats of scales are equal to the scales they stand for
+        if isinstance(other, (periodic_scale, scale_rope)):
+            other = other.materialize()
+        if not isinstance(other, scale):
+            return NotImplemented
+        return (self._continuation_code == other._continuation_code and self._step_codes == other._step_codes
+                and self._degrees == other._degrees)
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+    
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(self.content_key()))
+        return self._hash
+    
+    
+    def canonical(self):
+        """
+        The same scale, with every interval spelled the way its degrees say it should be.
+        
+        The degree list is what decides spellings (see absolute_scale_repr), but nothing stops us from writing, say,
+        scale(['p1+', 'a2+'], 'd2+', [1, 3, 4]), where the step from degree 1 to degree 3 is really a third, d3+, and not an
+        a2+. Both of these describe the same structure--the same semitones, with the same degrees--so they have the
+        same canonical form. We respell each interval as the interval number that its degrees call for (the first
+        interval from the root, the rest from the note before), with the same number of semitones. If there's no such
+        interval, we leave it alone.
+        
+        So to dedupe generated scales by structure, put their canonical forms in a set.
+        """
+        
+        def respell(code, degree_change):
+            step = step_code_to_interval(code)
+            try:
+                respelled_step = dereference_semitones(step._interval_sign*len(step), 1 + abs(degree_change))
+            except ValueError:
+                return code
+            return interval_string_to_step_code(str(respelled_step))
+        
+        codes = list(self._step_codes) + [self._continuation_code]
+        degrees = self._degrees
+        
+        # The first interval is measured from the root, which is degree 1
+        canonical_codes = [respell(codes[0], degrees[0] - 1)]
+        canonical_codes.extend(respell(codes[i], degrees[i] - degrees[i - 1]) for i in range(1, len(codes)))
+        
+        canonical_scale = scale._from_codes(canonical_codes[:-1], canonical_codes[-1], degrees)
+        if canonical_scale == self:
+            return self
+        return canonical_scale
+    
+    
+    def __str__(self):
+        """
+        String representation
+        """
+        return '[' + ', '.join(self._str_list_of_interval_strings) + '], ' + self._str_continuation_offset + ', ' + str(self._degree_list)
+
+
+    def __repr__(self):
+        """
+        We have to do a bit of work to return the appropriate string
+        """
+        return 'scale([' + ', '.join(self._str_list_of_interval_strings) + '], ' + self._str_continuation_offset + ', ' + str(self._degree_list) + ')'
+           
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [step_code_to_interval(code) for code in self._step_codes[index]]
+        return step_code_to_interval(self._step_codes[index])
+    
+    
+    def __iter__(self):
+        for code in self._step_codes:
+            yield step_code_to_interval(code)
+    
+    
+    def degree(self, index):
+        """
+        The degree of the note at index. index can also be len(self), which gives the degree of the continuation offset.
+        """
+        return self._degrees[index]
+    
+    
+    def get_mode(self, mode_number):
+        """
+        Return the given mode of the given scale, meaning cyclically permute the list of
+        interval strings and continuation offset and degree list right by one place. We do this 
+        in a very general way to handle non-monotonic scales and non-rooted scales.
+        
+        We usually talk about "the first through seventh" modes of an ionian scale, so "mode 1" of a scale here
+        is just the scale itself (in other words, we don't zero-index the way Python normally would). Mode numbers
+        past the number of notes wrap around, so mode 8 of an ionian scale is mode 1 again.
+        
+        All the work happens in all_modes, which works out every mode at once the first time we ask for one,
+        so after that this is just a lookup.
+        """
+        
+        # mode_number has to be a positive integer
+        if mode_number <= 0:
+            raise ValueError('mode_number must be a positive integer')
+        
+        return self.all_modes()[(mode_number - 1) % len(self)]
+    
+    
+    def all_modes(self):
+        """
+        Return the list of all the modes of the scale, so all_modes()[0] is mode 1 (the scale itself), all_modes()[1] is mode 2
+        and so on. We work them out once per scale and hand back the same list every time after that, so callers shouldn't
+        modify it.
+        
+        Here's how we get a mode:
+        
+        The first interval gives the rootedness of the scale, and we define all modes of a given scale to have
+        the same rootedness as that scale. To compute each mode, we simply do a cyclic permutation of the
+        remaining intervals plus the continuation offset, mode_number - 1 places to the left. The last interval
+        after the permutation is the new continuation offset.
+        
+        For the degree list, look at how much each of those intervals moves the degree (for c_ionian, that's
+        [1, 1, 1, 1, 1, 1, 1]). These steps get permuted exactly like the intervals, and the degree list of the mode
+        is the first degree followed by the running sums of the permuted steps. The first degree is the same by definition
+        across all modes, since all modes of a given scale have the same rootedness as that scale, and the last degree
+        is the same for all modes too, since it's the first degree plus all the steps in some order.
+        
+        So if we write the steps out twice, every mode's steps are a window of that doubled list, and one pass of running
+        sums over it gives us every mode's degree list by subtraction.
+        """
+        
+        if self._mode_cache is None:
+            object.__setattr__(self, '_mode_cache', self._compute_modes())
+        
+        return self._mode_cache
+    
+    
+    def _compute_modes(self):
+        # Work with the codes, since we're just moving them around
+        full_interval_list = list(self._step_codes) + [self._continuation_code]
+        rootedness = full_interval_list[0]
+        intervals_to_permute = full_interval_list[1:]
+        num_notes = len(intervals_to_permute)
+        
+        # How much each interval moves the degree, written out twice, and the running sums over that
+        degrees = self._degrees
+        degree_steps = [degrees[i + 1] - degrees[i] for i in range(num_notes)]
+        running_sums = list(itertools.accumulate(degree_steps*2, initial=0))
+        first_degree = degrees[0]
+        
+        modes = []
+        for shift in range(num_notes):
+            permuted_intervals = intervals_to_permute[shift:] + intervals_to_permute[:shift]
+            new_degree_list = [first_degree + running_sums[shift + i] - running_sums[shift] for i in range(num_notes + 1)]
+            modes.append(scale._from_codes([rootedness] + permuted_intervals[:-1], permuted_intervals[-1], new_degree_list))
+        
+        return modes
+    
+    
+    def __len__(self):
+        """
+        The length of a scale is what we need to loop over when doing stuff,
+        so we'll define it as the length of the interval string list.
+        In other words, the length is how many notes in the scale, not the cumulative interval the scale traverses.
+        So a C ionian scale has length 7, because it is C D E F G A B.
+        """
+
+        return len(self._step_codes)
+    
+    
+    def scale_span(self):
+        """
+        Gives the interval span between the first and last notes of the scale. For monotonic scales, this is just the 
+        distance between the first and last note, regardless of whether there is any non-monotonicity. We compute it 
+        using the scale's constituent intervals. The first interval gives the rootedness of the scale, so we ignore it.
+        We then sum up the second through last intervals to get the span.
+        We don't include the continuation offset, so the span of a C ionian scale is a pure seventh
+        For non-rooted scales, we don't include the root in the computation, so the span of D E G A B 
+        with a C root is just D to B, a major sixth.
+        """
+        
+        # The running sums in _absolute_tables already give us the semitones and degrees of the first and last notes,
+        # and the number of degrees between them tells us how to spell the span
+        note_semitones, period_semitones, note_degrees, period_degrees = self._absolute_tables()
+        
+        return spell_span(note_semitones[-1] - note_semitones[0], note_degrees[-1] - note_degrees[0])
+    
+        
+    def scale_cum_span(self):
+        """
+        Gives the total interval distance spanned by the scale. For monotonically increasing scales,
+        this is equal to scale_span. This is the same logic as scale_span, but with the absolute
+        value of the interval size.
+        """
+        
+        note_semitones, period_semitones, note_degrees, period_degrees = self._absolute_tables()
+        
+        # add up the sizes of the steps, ignoring the root and the continuation offset
+        cum_semitones = sum(abs(note_semitones[i + 1] - note_semitones[i]) for i in range(len(note_semitones) - 1))
+        cum_degrees = sum(abs(note_degrees[i + 1] - note_degrees[i]) for i in range(len(note_degrees) - 1))
+        
+        return spell_span(cum_semitones, cum_degrees)
+        
+    
+    def widest_consec_interval(self):
+        """
+        Return the widest consecutive interval in the scale (the first one, if there's a tie), ignoring the root and the
+        continuation offset. If nothing is wider than a unison, that's p1+.
+        """
+        
+        # _absolute_tables makes sure every step of this scale is in the prototype's semitone table
+        self._absolute_tables()
+        code_semitones = diatonic_prototype_to_use._step_code_semitones
+        
+        # start from an identity interval
+        widest_code = root_step_code
+        widest_semitones = 0
+        
+        for code in self._step_codes[1:]:
+            if code_semitones[code] > widest_semitones:
+                widest_code = code
+                widest_semitones = code_semitones[code]
+        
+        return step_code_to_interval(widest_code)
+    
+    
+    def __add__(self, other):
+        """
+        Adding two scales means sticking the intervals of other after the intervals of self via the continuation offset
+        We also need to combine the two degree lists. The intervals we get when we do this will govern the enharmonic 
+        spellings of the notes when we render the new scale relative to a pitch.
+        
+        We basically want to be able to combine existing scales together to get new scales.
+                
+        Take the lydian tetrachord as an example:
+        
+            lyd_tc = scale(['p1+', 'p2+', 'p2+', 'd2+'], 'p2+', [1, 2, 3, 4, 5])
+            ... so like c d e f
+        
+            lyd_tc + lyd_tc should be scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+', 'd2+'], 'p2+', [1, 2, 3, 4, 5, 6, 7, 8, 9])
+            ... so like c d e f g a b c
+        
+        Compare this to ionian_scale = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7]),
+        which is not the same thing. We can iterate lydian tetrachords to get Jacob Collier's super ultra hyper mega meta lydian
+        scale with a huge period, but we iterate the ionian scale and it has a period of seven--so unlike in casual conversation, 
+        here we have
+        
+            lyd_tc + lyd_tc != ionian_scale
+        
+        because the underlying structure and representation are different.
+        
+        So the procedure for adding scale_1 + scale_2 is
+        
+        -start with scale_1's interval string
+        -append scale_1's continuation offset to the list. This takes us from the last note of scale_1 to the first note of scale_2
+        -delete the first interval from scale_2. For a rooted scale_2 that's the 'p1+'. For a rootless scale_2 it's the distance
+         from scale_2's implicit root to its first note, which we don't need because the continuation offset already put us there
+        -append scale_2's remaining interval string
+        -new continuation offset is scale_2's
+        -shift scale_2's degree list so that its first degree lands on the last degree of scale_1 (the degree of scale_1's
+         continuation offset), and append everything after that first degree to the rest of scale_1's degree list
+        -initialize a new scale with these parameters
+        
+        All of this works exactly the same way for non-monotonic scales and scales with more than 7 notes, and the degree
+        list of the sum always has one more entry than its interval list, just like its parts.
+        
+        To take an example, look at
+        
+        big_scale = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+', 'p2+', 'p2+', 'd3+'], 'p2+', [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12])
+        ... so like         c,     d,     e,     f,     g,     a,     b,     c#,    d#,    f#     (g#)
+        
+        Then big_scale + lyd_tc should give us
+        
+         big_scale + lyd_tc = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+', 'p2+', 'p2+', 'd3+', 'p2+', 'p2+', 'p2+', 'd2+'], 'p2+', [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16])
+         ... so like                  c,     d,     e,     f,     g,     a,     b,     c#,    d#,    f#     g#     a#     b#     c#     (d#)
+    
+        Everything generalizes naturally to rootless scales, non-monotonic scales, and scales that are not an octave long
+        
+        Subtraction isn't really defined--do we ever want to reduce scales somehow?
+        
+        """
+        
+        # We don't do any of that here. Our tetrachord stacking adds up hundreds of scales, and building every intermediate
+        # scale would copy and re-parse everything each time. So we return a scale_rope that remembers the scales we added,
+        # and it follows the procedure above when we ask it for intervals and degrees (or for the whole scale).
+        if not isinstance(other, (scale, periodic_scale, scale_rope)):
+            return NotImplemented
+        
+        return _join_scales(self, other)
+           
+    
+    def __mul__(self, integer):
+        """
+        Define integer multiplication so we can do things like my_scale*4. This means my_scale + my_scale + my_scale + my_scale,
+        but we don't actually add anything up: we hand back a periodic_scale that remembers my_scale and the number 4, and
+        works everything out from those when we ask. See periodic_scale.
+        """
+        
+        # integer has to be a positive integer
+        if not isinstance(integer, int) or integer <= 0:
+            raise ValueError('Scales can only be multiplied by a positive integer')
+        
+        if integer == 1:
+            return self
+        
+        return periodic_scale(self, integer)
+        
+    
+    # def invert(self):
+        """
+        I don't think we need an invert method for scales.
+        """
+    
+    def iter_absolute(self, direction='up', start_period=0):
+        """
+        Play the scale forever: yield (absolute interval, degree) for every note, going up or down from the first note
+        of period number start_period, continuing into the next period with the continuation offset, just like adding
+        the scale to itself over and over. Period 0 is the scale itself, period 1 the copy above it and period -1 the
+        copy below it. For c_ionian,
+        
+            c_ionian.iter_absolute() gives (p1+, 1), (p2+, 2), ..., (p7+, 7), (p8+, 8), (p9+, 9), ...
+            c_ionian.iter_absolute('down') gives (p1+, 1), (d2-, 0), (d3-, -1), ..., (p8-, -6), (d9-, -7), ...
+            c_ionian.iter_absolute(start_period=3) starts at (p22+, 22)
+        
+        This never stops, so take as much of it as we need with itertools.islice or itertools.takewhile,
+        for example to cover the range of an instrument. Every period is the first one shifted by the semitones and
+        degrees of one period, so we jump straight to start_period without going through the periods in between.
+        """
+        
+        if direction not in ('up', 'down'):
+            raise ValueError("direction must be 'up' or 'down'")
+        if type(start_period) != int:
+            raise ValueError('start_period must be an integer')
+        
+        note_semitones, period_semitones, note_degrees, period_degrees = self._absolute_tables()
+        
+        num_notes = len(note_semitones)
+        index_step = 1 if direction == 'up' else -1
+        period = start_period
+        index = 0
+        
+        while True:
+            degree = note_degrees[index] + period*period_degrees
+            num_semitones = note_semitones[index] + period*period_semitones
+            yield dereference_semitones(num_semitones, degree_to_interval_number(degree)), degree
+            
+            index += index_step
+            if index == num_notes:
+                index = 0
+                period += 1
+            elif index < 0:
+                index = num_notes - 1
+                period -= 1
+    
+    
+    def _absolute_tables(self):
+        """
+        The semitones and degree of every note of period 0, measured from the root, along with how many semitones and
+        degrees one period moves us. The semitones are just running sums of the steps. We work these out the first time
+        we need them and keep them in compact arrays, so every absolute position after that is a little arithmetic.
+        """
+        
+        if self._absolute_table_cache is None:
+            # Look up the semitones of each step by its code, which saves building the interval objects
+            code_semitones = diatonic_prototype_to_use._step_code_semitones
+            for code in set(self._step_codes) - code_semitones.keys():
+                step = step_code_to_interval(code)
+                code_semitones[code] = step._interval_sign*len(step)
+            if self._continuation_code not in code_semitones:
+                continuation = self._continuation_offset
+                code_semitones[self._continuation_code] = continuation._interval_sign*len(continuation)
+            
+            note_semitones = array('q', itertools.accumulate(map(code_semitones.__getitem__, self._step_codes)))
+            period_semitones = note_semitones[-1] - note_semitones[0] + code_semitones[self._continuation_code]
+            
+            note_degrees = self._degrees[:-1]
+            period_degrees = self._degrees[-1] - self._degrees[0]
+            
+            object.__setattr__(self, '_absolute_table_cache', (note_semitones, period_semitones, note_degrees, period_degrees))
+        
+        return self._absolute_table_cache
+    
+    
+    def pitch_class_mask(self):
+        """
+        Which pitch classes the notes of the scale land on, measured from the root, as a bit mask: bit k is set when some note
+        is k semitones above the root, give or take whole octaves (blocks of the diatonic prototype). So c_ionian, with notes
+        0, 2, 4, 5, 7, 9 and 11 semitones above C, has mask 0b101010110101. For a rootless scale, the root itself is only in
+        the mask if the scale plays it.
+        """
+        
+        note_semitones = self._absolute_tables()[0]
+        block_size = diatonic_prototype_to_use.compile()._block_size
+        
+        mask = 0
+        for num_semitones in note_semitones:
+            mask |= 1 << (num_semitones % block_size)
+        
+        return mask
+    
+    
+    def absolute_position(self, index, period=0):
+        """
+        Return (number of semitones, degree) of note number index in period number period, measured from the root.
+        Like in iter_absolute, period 0 is the scale itself, period 1 the copy above it and period -1 the copy below it.
+        index can be any integer too: index len(self) is the first note of the next period, and index -1 is the last
+        note of the previous one.
+        """
+        
+        note_semitones, period_semitones, note_degrees, period_degrees = self._absolute_tables()
+        
+        extra_periods, index = divmod(index, len(note_semitones))
+        period += extra_periods
+        
+        return note_semitones[index] + period*period_semitones, note_degrees[index] + period*period_degrees
+    
+    
+    def absolute_interval(self, index, period=0):
+        """
+        The interval from the root to note number index in period number period (see absolute_position), spelled by
+        its degree. For c_ionian, absolute_interval(2) is p3+, absolute_interval(2, 1) is p10+ and absolute_interval(2, -1)
+        is d6- (the E an octave below, a minor sixth under the root).
+        """
+        
+        num_semitones, degree = self.absolute_position(index, period)
+        
+        return dereference_semitones(num_semitones, degree_to_interval_number(degree))
+    
+    
+    def absolute_scale_repr(self):
+        """
+        Take relative scale representation. For example:
+            
+            c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+            
+        Return a list of intervals where each interval gives the relationship of the note to the root, not the previous note:
+            
+            ionian_scale.absolute_scale_repr() = ['p1+', 'p2+', 'p3+', 'p4+', 'p5+', 'p6+', 'p7+']        
+            
+        Here's one payoff for everything we've built so far: the scale's degree list tells which version of the
+        multi-valued interval addition that we need to pick!
+        
+        We only work this out once per scale and hand back the same list every time after that, so callers shouldn't
+        modify it.
+        """
+        
+        if self._absolute_scale is None:
+            object.__setattr__(self, '_absolute_scale', self._compute_absolute_scale())
+        
+        return self._absolute_scale
+    
+    
+    @instrumentation.timed('scale.absolute_scale_repr')
+    def _compute_absolute_scale(self):
+        # The semitones from the root to each note are running sums of the steps (see _absolute_tables),
+        # and we dereference each one against the degree list
+        absolute_scale = []
+        for index in range(len(self)):
+            num_semitones, degree = self.absolute_position(index)
+            if instrumentation.verbose:
+                instrumentation.debug_print(self[index], num_semitones, degree)
+            absolute_scale.append(dereference_semitones(num_semitones, degree_to_interval_number(degree)))
+        
+        return absolute_scale
+    
+    
+    def compute_density(self):
+        """
+        The density of a scale is the number of unique pitches it contains divided by 12, the number of total
+        unique pitches. It doesn't consider the span of the scale.
+        
+        We count the unique pitches as the number of bits set in pitch_class_mask, which comes from the cached semitones
+        of the notes above the root (see _absolute_tables). So c_ionian has density 7/12. For whole lists of scales at once,
+        see pitch_class_densities in catalog.py.
+        """
+        
+        return self.pitch_class_mask().bit_count()/diatonic_prototype_to_use.compile()._block_size
+        
+
+
+#%%
+class periodic_scale:
+    """
+    A scale repeated some number of times, like lyd_tc*200. This is what we get when we multiply a scale by an integer.
+    
+    Adding a scale to itself over and over would build the whole interval list every time, which gets slow for the long
+    hyperdiatonic scales we like (Jacob Collier's hyper-lydian is lydian tetrachords all the way up). But repeating a scale is
+    very regular, so we just keep one period and the number of repeats, and work out anything we need from those. 
+    
+    If the period has n intervals, then interval number i of the repeated scale is interval number i % n of the period,
+    except that the first interval of every period after the first is the period's continuation offset (that's how we get from
+    one period to the next, exactly like in scale.__add__). The degrees work the same way: every period adds
+    (last degree - first degree) of the period to the degrees, so for lyd_tc, with degree list [1, 2, 3, 4, 5], the second
+    period has degrees [5, 6, 7, 8, 9].
+    
+    Indexing, iterating, len, and the degree list all work this way without building the repeated scale. When we do need
+    an actual scale (for example to get a mode of it), materialize() builds it once and keeps it around. Anything else we
+    ask for that a scale has, like scale_span, goes through materialize() too.
+    """
+    
+    
+    def __init__(self, period, repeats):
+        """
+        period is the scale we repeat, and repeats is how many times we repeat it (a positive integer)
+        """
+        
+        self._period = period
+        self._repeats = repeats
+        
+        # The period's continuation offset and rootedness are the repeated scale's too
+        self._continuation_offset = period._continuation_offset
+        self._str_continuation_offset = period._str_continuation_offset
+        self._rootness = period._rootness
+        
+        # How many intervals each period has, and how much each period moves the degrees up
+        self._period_length = len(period)
+        self._degree_increment = period.degree(len(period)) - period.degree(0)
+        
+        # We only fill this in if someone asks for the whole scale
+        self._materialized_scale = None
+    
+    
+    def __len__(self):
+        return self._period_length * self._repeats
+    
+    
+    def __getitem__(self, index):
+        """
+        Return the interval at index, working out which period it's in. Slices give a list of intervals.
+        """
+        
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('scale index out of range')
+        
+        period_number, index_in_period = divmod(index, self._period_length)
+        
+        # Every period after the first starts with the continuation offset instead of the period's first interval
+        if index_in_period == 0 and period_number > 0:
+            return self._continuation_offset
+        
+        return self._period[index_in_period]
+    
+    
+    def __iter__(self):
+        # The first period is just the period, and after that each period starts with the continuation offset
+        period_steps = list(self._period)
+        yield from period_steps
+        for period_number in range(1, self._repeats):
+            yield self._continuation_offset
+            yield from period_steps[1:]
+    
+    
+    def degree(self, index):
+        """
+        The degree of the note at index. Like the degree list of a scale, index can also be len(self), which gives the degree of
+        the continuation offset.
+        """
+        
+        if index < 0:
+            index += len(self) + 1
+        if not 0 <= index <= len(self):
+            raise IndexError('degree index out of range')
+        
+        period_number, index_in_period = divmod(index, self._period_length)
+        
+        return self._period.degree(index_in_period) + period_number*self._degree_increment
+    
+    
+    def degree_list(self):
+        """
+        The full degree list, the same as the materialized scale's _degree_list
+        """
+        
+        period_degrees = self._period._degree_list[:-1]
+        degree_list = []
+        for period_number in range(self._repeats):
+            degree_list.extend(degree + period_number*self._degree_increment for degree in period_degrees)
+        degree_list.append(self.degree(len(self)))
+        
+        return degree_list
+    
+    
+    def iter_absolute(self, direction='up', start_period=0):
+        """
+        Like scale.iter_absolute. One period of the repeated scale is self._repeats periods of the scale we repeat,
+        so we don't need to materialize anything.
+        """
+        
+        if type(start_period) != int:
+            raise ValueError('start_period must be an integer')
+        
+        return self._period.iter_absolute(direction, start_period*self._repeats)
+    
+    
+    def absolute_position(self, index, period=0):
+        """
+        Like scale.absolute_position, worked out from the scale we repeat
+        """
+        return self._period.absolute_position(index + period*len(self))
+    
+    
+    def absolute_interval(self, index, period=0):
+        return self._period.absolute_interval(index + period*len(self))
+    
+    
+    def absolute_scale_repr(self):
+        return [self._period.absolute_interval(index) for index in range(len(self))]
+    
+    
+    def __mul__(self, integer):
+        """
+        Repeating a repeated scale just repeats the period more times
+        """
+        
+        if not isinstance(integer, int) or integer <= 0:
+            raise ValueError('Scales can only be multiplied by a positive integer')
+        
+        return periodic_scale(self._period, self._repeats*integer)
+    
+    
+    def __add__(self, other):
+        if not isinstance(other, (scale, periodic_scale, scale_rope)):
+            return NotImplemented
+        
+        return _join_scales(self, other)
+    
+    
+    def __str__(self):
+        return '(' + str(self._period) + ')*' + str(self._repeats)
+    
+    
+    def __repr__(self):
+        return 'periodic_scale(' + repr(self._period) + ', ' + str(self._repeats) + ')'
+    
+    
+    def __eq__(self, other):
+        """
+        Equal to any scale (or sum or repeat of scales) with the same content, see scale.__eq__
+        """
+        return self.materialize() == other
+    
+    
+    def __ne__(self, other):
+        return self.materialize() != other
+    
+    
+    def __hash__(self):
+        return hash(self.materialize())
+    
+    
+    def materialize(self):
+        """
+        Build the repeated scale as an actual scale. We only do this once.
+        """
+        
+        if self._materialized_scale is None:
+            period_codes = list(self._period._step_codes)
+            continuation_code = self._period._continuation_code
+            step_codes = period_codes + ([continuation_code] + period_codes[1:])*(self._repeats - 1)
+            self._materialized_scale = scale._from_codes(step_codes, continuation_code, self.degree_list())
+        
+        return self._materialized_scale
+    
+    
+    def __getattr__(self, name):
+        """
+        Anything else a scale can do, we do by materializing. We only get here when normal attribute lookup fails,
+        so the attributes we set in __init__ never come through here.
+        """
+        
+        if name.startswith('__') or name == '_materialized_scale':
+            raise AttributeError(name)
+        
+        return getattr(self.materialize(), name)
+
+
+
+#%%
+class scale_rope:
+    """
+    The sum of a bunch of scales, like a + b + c + ..., without actually adding them up. This is what we get when we add scales.
+    
+    A scale_rope is a balanced binary tree. Its leaves are the scales we added (scales or periodic_scales) in order, and each node
+    remembers a few things about everything below it: how many intervals it has, how far it moves the degrees
+    (last degree - first degree), its rootedness and its continuation offset. The height of the two sides of every node differs
+    by at most one, so the tree is never more than about log2(number of scales) deep.
+    
+    That's all we need to follow the procedure in scale.__add__ without building anything:
+    
+    -to find interval i, walk down the tree, going left or right by the lengths. The first interval of every leaf after the first
+     one is the continuation offset of the leaf right before it, which we remember on the way down
+    -to find the degree of note i, add up how far the leaves to its left moved the degrees on the way down
+    
+    so indexing costs O(log n), and adding another scale to the end only touches the nodes down the right side of the tree. When
+    we need an actual scale, materialize() builds it once, in one pass. Anything else we ask for that a scale has goes through
+    materialize() too, just like with periodic_scale.
+    """
+    
+    
+    def __init__(self, left, right):
+        """
+        left and right are scales, periodic_scales or scale_ropes. We don't rebalance anything here--use _join_scales
+        (or just +) to put scales together.
+        """
+        
+        self._left = left
+        self._right = right
+        
+        self._length = len(left) + len(right)
+        self._height = max(_rope_height(left), _rope_height(right)) + 1
+        self._degree_span = _degree_span(left) + _degree_span(right)
+        
+        # The leftmost and rightmost scales under this node
+        self._first_leaf = left._first_leaf if isinstance(left, scale_rope) else left
+        self._last_leaf = right._last_leaf if isinstance(right, scale_rope) else right
+        
+        # Rootedness comes from the first scale, and the continuation offset from the last one
+        self._rootness = self._first_leaf._rootness
+        self._continuation_offset = self._last_leaf._continuation_offset
+        self._str_continuation_offset = self._last_leaf._str_continuation_offset
+        
+        # We only fill this in if someone asks for the whole scale
+        self._materialized_scale = None
+    
+    
+    def __len__(self):
+        return self._length
+    
+    
+    def _locate(self, index):
+        """
+        Walk down to the scale that interval number index is in. Return that scale, the index in it, how far the scales
+        to its left moved the degrees, and the scale right before it (None if it's the first one).
+        """
+        
+        node = self
+        degree_offset = 0
+        previous_leaf = None
+        
+        while isinstance(node, scale_rope):
+            left = node._left
+            if index < len(left):
+                node = left
+            else:
+                index -= len(left)
+                degree_offset += _degree_span(left)
+                previous_leaf = left._last_leaf if isinstance(left, scale_rope) else left
+                node = node._right
+        
+        return node, index, degree_offset, previous_leaf
+    
+    
+    def __getitem__(self, index):
+        """
+        Return the interval at index. Slices give a list of intervals.
+        """
+        
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('scale index out of range')
+        
+        leaf, index_in_leaf, degree_offset, previous_leaf = self._locate(index)
+        
+        # The first interval of every scale after the first one is the continuation offset of the scale before it
+        if index_in_leaf == 0 and previous_leaf is not None:
+            return previous_leaf._continuation_offset
+        
+        return leaf[index_in_leaf]
+    
+    
+    def degree(self, index):
+        """
+        The degree of the note at index. Like the degree list of a scale, index can also be len(self), which gives the degree of
+        the continuation offset.
+        """
+        
+        if index < 0:
+            index += len(self) + 1
+        if not 0 <= index <= len(self):
+            raise IndexError('degree index out of range')
+        
+        first_degree = self._first_leaf.degree(0)
+        if index == len(self):
+            return first_degree + self._degree_span
+        
+        leaf, index_in_leaf, degree_offset, previous_leaf = self._locate(index)
+        
+        return first_degree + degree_offset + leaf.degree(index_in_leaf) - leaf.degree(0)
+    
+    
+    def _leaves(self):
+        """
+        Yield the scales we added, in order
+        """
+        
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, scale_rope):
+                stack.append(node._right)
+                stack.append(node._left)
+            else:
+                yield node
+    
+    
+    def __iter__(self):
+        previous_leaf = None
+        for leaf in self._leaves():
+            steps = iter(leaf)
+            if previous_leaf is not None:
+                # swap the first interval for the continuation offset of the scale before
+                next(steps)
+                yield previous_leaf._continuation_offset
+            yield from steps
+            previous_leaf = leaf
+    
+    
+    def degree_list(self):
+        """
+        The full degree list, the same as the materialized scale's _degree_list
+        """
+        
+        degree = self._first_leaf.degree(0)
+        degree_list = []
+        for leaf in self._leaves():
+            leaf_first_degree = leaf.degree(0)
+            degree_list.extend(degree + leaf.degree(i) - leaf_first_degree for i in range(len(leaf)))
+            degree += _degree_span(leaf)
+        degree_list.append(degree)
+        
+        return degree_list
+    
+    
+    def __add__(self, other):
+        if not isinstance(other, (scale, periodic_scale, scale_rope)):
+            return NotImplemented
+        
+        return _join_scales(self, other)
+    
+    
+    def __mul__(self, integer):
+        return self.materialize()*integer
+    
+    
+    def __str__(self):
+        return ' + '.join('(' + str(leaf) + ')' for leaf in self._leaves())
+    
+    
+    def __repr__(self):
+        return ' + '.join(repr(leaf) for leaf in self._leaves())
+    
+    
+    def __eq__(self, other):
+        """
+        See periodic_scale.__eq__
+        """
+        return self.materialize() == other
+    
+    
+    def __ne__(self, other):
+        return self.materialize() != other
+    
+    
+    def __hash__(self):
+        return hash(self.materialize())
+    
+    
+    def materialize(self):
+        """
+        Build the sum as an actual scale. We only do this once.
+        """
+        
+        if self._materialized_scale is None:
+            step_codes = [interval_string_to_step_code(str(step)) for step in self]
+            continuation_code = interval_string_to_step_code(self._str_continuation_offset)
+            self._materialized_scale = scale._from_codes(step_codes, continuation_code, self.degree_list())
+        
+        return self._materialized_scale
+    
+    
+    def __getattr__(self, name):
+        """
+        Anything else a scale can do, we do by materializing (see periodic_scale.__getattr__)
+        """
+        
+        if name.startswith('__') or name == '_materialized_scale':
+            raise AttributeError(name)
+        
+        return getattr(self.materialize(), name)
+
+
+def _rope_height(scale_or_rope):
+    return scale_or_rope._height if isinstance(scale_or_rope, scale_rope) else 0
+
+
+def _degree_span(scale_or_rope):
+    """
+    How far a scale moves the degrees: the degree of its continuation offset minus its first degree
+    """
+    if isinstance(scale_or_rope, scale_rope):
+        return scale_or_rope._degree_span
+    return scale_or_rope.degree(len(scale_or_rope)) - scale_or_rope.degree(0)
+
+
+def _balanced_rope(left, right):
+    """
+    Make a scale_rope out of left and right, where their heights differ by at most two, rotating so the heights
+    of the two sides of the result differ by at most one (like in an AVL tree). Rotating doesn't change the order
+    of the scales, and adding scales up is associative, so the result means the same thing.
+    """
+    
+    left_height = _rope_height(left)
+    right_height = _rope_height(right)
+    
+    if left_height > right_height + 1:
+        if _rope_height(left._left) >= _rope_height(left._right):
+            return scale_rope(left._left, scale_rope(left._right, right))
+        middle = left._right
+        return scale_rope(scale_rope(left._left, middle._left), scale_rope(middle._right, right))
+    
+    if right_height > left_height + 1:
+        if _rope_height(right._right) >= _rope_height(right._left):
+            return scale_rope(scale_rope(left, right._left), right._right)
+        middle = right._left
+        return scale_rope(scale_rope(left, middle._left), scale_rope(middle._right, right._right))
+    
+    return scale_rope(left, right)
+
+
+def _join_scales(left, right):
+    """
+    left + right for any combination of scales, periodic_scales and scale_ropes. If one side is much taller than the other,
+    we go down the inside edge of the taller one until the heights match, and rebalance on the way back up, so this costs
+    O(difference in heights).
+    """
+    
+    left_height = _rope_height(left)
+    right_height = _rope_height(right)
+    
+    if left_height > right_height + 1:
+        return _balanced_rope(left._left, _join_scales(left._right, right))
+    if right_height > left_height + 1:
+        return _balanced_rope(_join_scales(left, right._left), right._right)
+    
+    return scale_rope(left, right)
+
+#%%
+
+
+
+
+class pitch:
+    
+    """
+    For this system, a pitch corresponds to a key on a theoretically infinite piano. For practical
+    purposes, most of the stuff we do takes place on the 88 actual piano keys.
+    
+    In doing this, we lock ourselves into Western 12-tone equal tempered music system, like on a piano. 
+    Music that doesn't fit into this system is beyond the scope of this package.
+
+    There are several representations for each pitch. 
+    
+    We'll use middle C as an example.
+
+    The underlying unique representation (i.e., no enharmonic or other equivalents) for this note is
+    40, because it's the 40th key from the left on a piano. This representation doesn't care how the pitch
+    is enharmonically spelled.
+    
+    We use lilypond notation to spell pitches. In this notation, we have
+    -is means sharp
+    -isis means double sharp
+    -es means flat
+    -eses means double flat
+    -there are no triple or higher accidentals possible in lilypond
+    
+    Enharmonically, a C could be spelled
+    -c
+    -bis
+    -deses
+    
+    Since we're talking about middle C, we also need to specify the octave. In lilypond, c, d, e, f, g, a, b correspond
+    to the C one octave below middle C, and higher octaves can be specified by c', c'', etc, and 
+    lower octaves can be specified as c, c,, c,,, and so forth. This is absolute pitch entry. 
+    Lilypond also has relative pitch entry, but we don't use it here.
+    
+    So middle C could be enharmonically spelled
+    -c'
+    -bis
+    -deses'
+    
+    But we want to capture general enharmonicism. This is why we initialize a pitch as a pair:
+    (diatonic_pitch, chromatic_alteration). The diatonic_pitch is the letter name of the note and 
+    the chromatic_alteration is an integer that represents how sharp or flat the pitch is. For example,
+    middle C could be
+    -(40, 0), corresponding to c'
+    -(39, 1), corresponding to bis
+    -(42, -2), corresponding to deses
+    -(47, -7), corresponding to g hexuple flat 
+    -but not (46, -6), because 46 is f#/gb... need to test for all of this, maybe for invalid ones like this, 
+    dereference it to the nearest valid one
+    
+    To figure out the correct spelling, we first differentiate between root pitches and functional pitches. These
+    different functions are not inherent to the concept of a pitch, rather, they come up when we're rendering
+    scales and other things.
+    
+    A root pitch gives the tonal center for the current environment. Out of the many possible representations,
+    we have to choose exactly one. This allows us to be in the tonal center of Ab or G# to take one example, or
+    in the key of C, B#, or Dbb, to take another example. At this point, though, we're not locked into the usual "key" 
+    of these, becase our system is much more general than this and allows much more complicated stuff.
+    
+    Functional pitches are pitches that we view as functioning relative to some scale based off of some root pitch.
+    
+    We need to flesh this out a bit, but the basic idea is that Eb is functioning as a 4 in a Bb ionian environment.
+    Conversely, the 4 in Bb ionian is Eb (not D#) because diatonically we have b, c, d, e (up to accidentals), so
+    the 4 in Bb ionian can't be some kind of D.
+
+    Similarly, we have the question of "how do we view C# in an A dorian environment?". To answer this, we consider
+    chords built on thirds, like 
+    
+        A  C  E  G  B  D  F#  A  C#  E  G#  B  D#  F# 
+        1  3  5  7  9  11 13  15 17  19 21  23 25  27
+        
+    So, diatonically, C is the 3, the 10, the 17, the 24, the 31, etc. of A. In A dorian, the 3 is a C natural
+    In stacking thirds, the 10 doesn't come up. The next C that comes around is the 17, so it can be sharp.
+    
+
+    """
+    
+
+            
+    # Letter names of diatonic notes in order
+    diatonic_sequence = ['a', 'b', 'c', 'd', 'e', 'f', 'g']     
+    
+    def __init__(self, diatonic_pitch, chromatic_alteration):
+        """
+        asdf
+        """
+        
+        # Check that root_note_num and root_note_name are consistent
+        count_sharp = root_note_name.count('is')
+        count_flat = root_note_name.count('es')
+        
+        if count_sharp == 0 and count_flat == 0:
+            try:
+                self.find_note_name[root_note_num, 'neutral']
+            except:
+                raise ValueError('Invalid pitch parameters')
+        elif count_sharp == 1 and count_flat == 0:
+            try:
+                self.find_note_name
+            except:
+                pass
+        
+        
+        # Initialize attributes
+        self._root_note_num = root_note_num
+        self._root_note_name = root_note_name
+        self._interval_from_root = interval_from_root
+        self._note_name = self.get_note_name(self)
+        
+        self._dereferenced_pitch = asdf
+        
+        
+    def get_note_name(self):
+        """
+        Returns the name of the pitch in lilypond notation
+        """
+        
+        interval_type = self._interval_from_root[0]
+        interval_distance = self._interval_from_root[1]
+        new_letter_name = letter_names[(int(letter_names.index(self._tonal_center)) + int(interval_distance) - 1)%7]
+        if interval_type == 'p':
+            return new_letter_name
+        elif interval_type == 'a':
+            return new_letter_name + 'is'
+        elif interval_type == 'd':
+            return new_letter_name + 'es'
+        
+    def transpose(note_num, interval, direction):
+        """
+        Transpose note_num by the number of semi-tones indicated by interval
+        Shit, we need to be able to do interval arithmetic
+        """
+   
+    
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+# encode simplest sharp and flat representations of each pitch
+# in terms of cc_pitch_num
+base_lilypond_octaves = {
+    35: ["b", "x", "aisis", "ces'", "x"],
+    34: ["x", "ais", "x", "bes", "ceses"],
+    33: ["a", "x", "gisis", "x", "beses"],
+    32: ["x", "gis", "x", "aes", "x"],
+    31: ["g", "x", "fisis", "x", "aeses"],
+    30: ["x", "fis", "eisis", "ges", "x"],
+    29: ["f", "eis", "x", "x", "geses"],
+    28: ["e", "x", "disis", "fes", "x"],
+    27: ["x", "dis", "x", "ees", "feses"],
+    26: ["d", "x", "cisis", "x", "eeses"],
+    25: ["x", "cis", "bisis", "des", "x"],
+    24: ["c", "bis,", "x", "x", "deses"]}
+
+def get_attrs(pitch_num):
+    """
+    Get attributes of a c-centered pitch number
+    All pitches will be c-centered for this exercise
+    """
+       
+    # get an a-centered pitch number just in case
+    a_centered_pitch_num = pitch_num + 4
+    
+    # do basic computations
+    octave_num = math.floor(pitch_num/12) + 1
+    pitch_freq = 2**((pitch_num - 45)/12)*440 # in terms of A440
+    
+    # get pitch color on piano
+    if pitch_num % 12 in [0, 2, 4, 5, 7, 9, 11]:
+        pitch_color = 'white'
+    elif pitch_num % 12 in [1, 3, 6, 8, 10]:
+        pitch_color = 'black'
+        
+    # get note equivalence classes in the octave below middle c
+    # (where the lilypond octave modifier is null)
+    equiv_pitch_oct_bel_mc = (pitch_num % 12) + 24
+    
+    # Get the simplest representations for a given pitch
+    # Represent it as locations in the base_lilypond_octaves list
+    # simplest natural representation is always 1, so we don't need that
+    # This is essentially lots of data entry to capture the structure of a 
+    # Diatonic octave
+    if equiv_pitch_oct_bel_mc == 24:
+        simplest_flat_rep_oct_bel_mc = 4
+        simplest_sharp_rep_oct_bel_mc = 1
+    elif equiv_pitch_oct_bel_mc == 25:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 1
+    elif equiv_pitch_oct_bel_mc == 26:
+        simplest_flat_rep_oct_bel_mc = 4
+        simplest_sharp_rep_oct_bel_mc = 2
+    elif equiv_pitch_oct_bel_mc == 27:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 1
+    elif equiv_pitch_oct_bel_mc == 28:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 2
+    elif equiv_pitch_oct_bel_mc == 29:
+        simplest_flat_rep_oct_bel_mc = 4
+        simplest_sharp_rep_oct_bel_mc = 2
+    elif equiv_pitch_oct_bel_mc == 30:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 1
+    elif equiv_pitch_oct_bel_mc == 31:
+        simplest_flat_rep_oct_bel_mc = 4
+        simplest_sharp_rep_oct_bel_mc = 2
+    elif equiv_pitch_oct_bel_mc == 32:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 1
+    elif equiv_pitch_oct_bel_mc == 33:
+        simplest_flat_rep_oct_bel_mc = 4
+        simplest_sharp_rep_oct_bel_mc = 2
+    elif equiv_pitch_oct_bel_mc == 34:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 1
+    elif equiv_pitch_oct_bel_mc == 35:
+        simplest_flat_rep_oct_bel_mc = 3
+        simplest_sharp_rep_oct_bel_mc = 2
+    
+    # get lilypond octave modifier
+    if octave_num == 3:
+        lilypond_octive_modifier_type = 'none'
+        lilypond_octive_modifier_quantity = 0
+    elif octave_num >= 4:
+        lilypond_octive_modifier_type = "'"
+        lilypond_octive_modifier_quantity = octave_num - 3
+    elif octave_num <=2:
+        lilypond_octive_modifier_type = ","
+        lilypond_octive_modifier_quantity = -1*octave_num + 3
+    
+    lilypond_octave_modifier = lilypond_octive_modifier_type*lilypond_octive_modifier_quantity
+    
+    # Put it all together to get a list of possible lilypond spellings
+    # Xs represent nulls, so they don't get modified
+    lilypond_spellings = []    
+    for item in base_lilypond_octaves[equiv_pitch_oct_bel_mc]:
+        if item == "x":
+            lilypond_spellings.append(item)
+        elif item != "x":
+            lilypond_spellings.append(item + lilypond_octave_modifier)
+        
+    # Test
+    return lilypond_spellings
+
+    
+    # dereference "," (octave lower) and "'" (octave higher) when they're together (i.e., '', is equal to ')
+    while lilypond_spellings.find("',") > 0:
+        location = lilypond_spellings.find("',") 
+        lilypond_spellings = lilypond_spellings[0:location] + lilypond_spellings[location + 2:]
+    
+    while lilypond_spellings.find(",'") > 0:
+        location = lilypond_spellings.find(",'") 
+        lilypond_spellings = lilypond_spellings[0:location] + lilypond_spellings[location + 2:]
+
+    return lilypond_spellings
+    
+
+# function to derefrence ',',' for a single pitch, apply to all pitches
+# Method to get the hexuple-flat version of the pitch
+
+
+
+
+
+class harmonica_hole:
+    """
+    Implements a harmonica hole. Harmonicas have a given key, and holes relative to that key. An individual
+    harmonica hole has a blow pitch and a draw pitch that are a certain interval relative to each other, and that's
+    all we need to compute its individual properties. Then we can implement a whole harmonica by arranging
+    these holes together, along with the relationship to the individual harmonica pitch.
+    
+    But we don't want to get in to the specifics of the enharmonics at this point--all we need is the number
+    of semitones bewteen the blow pitch and draw pitch (with sign) to do the computation.
+    
+    Richter tuned harmonica example:
+        hole 01: harmonica_hole(2) (C up to D, for example)
+        hole 02: harmonica_hole(3)
+        hole 03: harmonica_hole(4)
+        hole 04: harmonica_hole(2)
+        hole 05: harmonica_hole(2)
+        hole 06: harmonica_hole(2)
+        hole 07: harmonica_hole(-1)
+        hole 08: harmonica_hole(-2)
+        hole 09: harmonica_hole(-2)
+        hole 10: harmonica_hole(-3)
+    
+    So this class just captures the unique playing technique of each hole. We render the exact pitches
+    later when we put these together to construct harmonicas.
+    
+    """
+    
+    def __init__(self, num_semitones):
+        """
+        Pitch numbers for the blow and draw of this hole. Compute note possibilities
+        """
+
+        # A hole is defined by its basic blow note and draw note
+        # Since we're working relatively here, define the basic blow note is 0 semitones, and
+        # the basic draw note is how many semi-tones away
+        self._basic_blow_note = 0 
+        self._basic_draw_note = num_semitones        
+        
+        # Implement basic blow physics
+        # Whether the blow is lower or higher than the draw
+        # For example, holes 1-7 of a Richter-tuned diatonic harmonica are forward, 8-10 are backward
+        # We limit ourselves to standard overblow technique and exclude theoretical possibilities
+        # like quarter-tones and severly bent-up overblows. We'll add bends to this list later in 
+        # the initialization process.
+        self._all_practical_pitches = [self._basic_blow_note] + [self._basic_draw_note]
+        
+        if self._basic_draw_note > 0:
+            self._hole_direction = 'forward'
+            self._draw_bends = [pitch for pitch in range(self._basic_blow_note + 1, self._basic_draw_note)]
+            self._draw_gliss_range = [self._basic_blow_note + 1, self._basic_draw_note]
+            self._overdraw_bend = []
+            self._blow_bends = []
+            self._blow_gliss_range = []
+            self._overblow_bend = num_semitones + 1
+            self._all_practical_pitches += self._draw_bends + [self._overblow_bend]
+            
+        # I'm not actually sure that overbends are null here
+        elif self._basic_draw_note == 0:
+            self._hole_direction = 'neutral'
+            self._draw_bends = []
+            self._draw_gliss_range = []
+            self._overdraw_bend = []
+            self._blow_bends = []
+            self._blow_gliss_range = []
+            self._overblow_bend = []
+            
+        elif self._basic_draw_note < 0:
+            self._hole_direction = 'backward'
+            self._draw_bends = []
+            self._draw_gliss_range = []
+            self._overdraw_bend = num_semitones + 1
+            self._blow_bends = [pitch for pitch in range(self._basic_draw_note + 1, self._basic_blow_note)]
+            self._blow_gliss_range = [self._basic_draw_note + 1, self._basic_blow_note]
+            self._overblow_bend = []
+            self._all_practical_pitches += self._blow_bends + [self._overdraw_bend]
+
+        instrumentation.debug_print(self._all_practical_pitches)
+         
+        self._all_practical_pitches.sort()                                        
+      
+        # Placeholder for theoretical pitches, which could include severly bent-up overbends and glisses
+        # Maybe we'll do quartertones, and near-quartertones later
+        self._all_theoretical_pitches = []
+        
+        # All possible pitches, at least according to our model above
+        self._all_possible_pitches = self._all_practical_pitches + self._all_theoretical_pitches
+        
+        
+
+
+
+class harmonica:
+    """
+    Oooooh, this has to be in terms of intervals
+    How hard is a given tune on a given harmonica?
+    For a given pitch, how easily can it be played (formation, intonation, low overblows are hard, etc.)
+    For any given interval, how easy is it? (breath direction, changing between blowing forms)
+    The 5 of the 1 is the 3 of the 2 thing
+    What's the pitch range, number of holes and ratio of the two?
+    How chromaticly/diatonically oriented is this for arbitrary music? (compare test 12-tone music to diatonic music)
+    How "bluesy" a harmonica is in a given key?
+    Is there some quantitative reason that we can derive why Howard Levy loves Richter tuning?
+    A hypermegametalydian harmonica?
+    
+    The tuning input variable is a dictionary with 
+    hole number: [blow note relative interval, hole structure]
+    
+    We assume that the holes are numbered from 1 on the left to N on the right (physically)
+    In most tunings, the hole 1 blow note corresponds to the "key" of the harmonica
+    Here, for more generality, we merely assume that exactly one of the holes (not necessarily hole 1) 
+    has an interval of 'p1+', and that's the "key" of the harmonica (and root_pitch gets assigned there)
+    
+    """
+    
+    def __init__(self, tuning, root_pitch):
+        
+        # Check assumptions: holes numbered from -M to N, etc.
+        
+        # Initialize tuning        
+        self._tuning = tuning
+        
+        # Loop through keys and find main hole
+        # Loop up and back from that hole assigning absolute pitches
+        # Need to implement pitch class first
+        
+        
+        # Add additional absolute pitch attributes to 
+
+
+
+def richter_tuning():
+    """
+    The standard diatonic harmonica tuning, as {hole number: [blow note relative interval, hole structure]}
+    (see harmonica). We build it when we ask for it rather than at import time.
+    """
+    
+    return {
+        1: ['p1+', harmonica_hole(2)],
+        2: ['p3+', harmonica_hole(3)],
+        3: ['d3+', harmonica_hole(4)],
+        4: ['p4+', harmonica_hole(2)],
+        5: ['p3+', harmonica_hole(2)],
+        6: ['d3+', harmonica_hole(2)],
+        7: ['p4+', harmonica_hole(-1)],
+        8: ['p3+', harmonica_hole(-2)],
+        9: ['d3+', harmonica_hole(-2)],
+        10: ['p4+', harmonica_hole(-3)]}
+
+
+def shephards_flute_tuning():
+    """
+    So like (G B) (C E) (E G) (G C) to get a perfect fourth below your single melody octave
+    """
+    
+    return {
+        1: ['p4-', harmonica_hole(4)],
+        2: ['p1+', harmonica_hole(4)],
+        3: ['p3+', harmonica_hole(3)],
+        4: ['d3+', harmonica_hole(4)]}
@@ -0,0 +1,141 @@
+"""
+The first draft of the interval class, from before tones_and_intervals.interval used the [adp]N[+-] shorthand.
+It spelled intervals like 'P5+', 'm3-' or 'ddddd3+'. Kept here for reference; nothing imports it.
+"""
+
+
+import re
+
+from musical_structure_generator.tones_and_intervals import geninterval, major_scale_prototype
+
+
+class interval():
+    """
+    This is our implementation of a western diatonic interval because it's in terms of 
+    the major_scale_prototype by assumption (we could define more general interval classes also)
+    """
+    
+    prototype = major_scale_prototype
+    
+    def __init__(self, interval):
+        """
+        Class to implement musical intervals. We follow Harmony and Voice Leading
+        
+        The interval parameter is something like p4+, a5+ or d6- to represent
+        a pure fourth up, augmented fifth up, diminished sixth down and such like. We're going 
+        to say there are no double diminished or double augmented intervals (or such like).
+        
+        The key thing we're trying to capture is the function of the note relative to the harmonic
+        context.
+        
+        The last character of the string is either '+' or '-' depending on whether you mean
+        the interval is going up or down. The only thing below that depends on direction is
+        interval addition.
+        
+        Perfect intervals can be diminshed or augmented any number of times.
+        
+        Major intervals can be augmented any number of times. They can become minor,
+        and after that they can be diminished any number of times.
+        
+        We can say things like 'p5+', 'ddddd3+', 'A8-', etc.
+        
+        The numbers here are in terms of diatonic pitches (not semi-tones)
+        """
+        
+        # Make sure interval string is well-formed
+        if not re.match(r'([MmP]|D+|A+)\d+[+-]', interval):
+            raise ValueError('Invalid interval name string: must be ([MmP]|D+|A+)\d+[+-]')
+                
+        # Record this
+        self._interval = interval
+        
+        # Parse the interval string into parts
+        interval_first_number = re.search(r'\d', self._interval).start()
+        interval_direction_index = re.search(r'[+-]', self._interval).start()
+        
+        # The interval without the direction
+        self._interval_name = self._interval[:interval_direction_index]
+        
+        # The interval type (just the letter part)
+        self._interval_type = self._interval[:interval_first_number]
+        
+        # How many letters in the interval type (to capture how many times we diminish/augment)
+        self._interval_type_length = len(self._interval_type)
+        
+        # The interval number (just the number)
+        #print(self._interval[interval_first_number:interval_direction_index])
+        self._interval_number = int(self._interval[interval_first_number:interval_direction_index])
+        
+        # Reduce the interval number with respect to the block size
+        self._interval_number_reduced = self._interval_number % self.prototype._block_size
+        
+        # Map the interval number to Group 1/Group 2
+        if self._interval_number_reduced in self.prototype._perfect_intervals:
+            self._interval_group = 'perfect'
+        elif self._interval_number_reduced not in self.prototype._perfect_intervals:
+            self._interval_group = 'maj/min'
+        else:
+            self._interval_group = 'error'
+        
+        # Need to make sure that Group 1/Group 2 intervals are correctly specified
+        if self._interval_type == 'P' and self._interval_group == 'perfect':
+            pass
+        elif self._interval_type in ['M', 'm'] and self._interval_group == 'maj/min':
+            pass
+        elif self._interval_type[0] in ['d', 'A']:
+            pass
+        else:
+            raise ValueError('Interval type and interval number inconsistent with diatonic prototype')
+            
+        # Compute the chromatic offset. The rules are different for each group
+        if self._interval_group == 'perfect':
+            if self._interval_type == 'P':
+                self._chromatic_offset = 0
+            elif self._interval_type[0] == 'd':
+                self._chromatic_offset = -1*self._interval_type_length
+            elif self._interval_type[0] == 'A':
+                self._chromatic_offset = self._interval_type_length
+            else:
+                self._chromatic_offset = 'error'
+        elif self._interval_group == 'maj/min':
+            if self._interval_type == 'M':
+                self._chromatic_offset = 0
+            elif self._interval_type == 'm':
+                self._chromatic_offset = -1
+            elif self._interval_type[0] == 'd':
+                self._chromatic_offset = -1*(self._interval_type_length + 1)
+            elif self._interval_type[0] == 'A':
+                self._chromatic_offset = self._interval_type_length + 1
+        
+        # The interval direction
+        self._interval_direction = self._interval[-1:]
+        
+        # P1s (unisons) have positive direction by convention
+        if self._interval_direction == '+':
+            self._interval_sign = 1
+        elif self._interval_direction == '-':
+            self._interval_sign = -1
+                      
+        # Reduce diatonically
+        # Normally this is modding by 7, the number of letter names in a diatonic scale
+        self._reduced_diatonic_number = self._interval_number % len(self.prototype._letter_names)
+        self._octave_offset = self._interval_number // len(self.prototype._letter_names)
+        
+        # Compute the underlying non-chromatically adjusted number of semitones
+        # using the octave prototype.
+        self._reduced_semitones = self.prototype._absolute_representation[self._reduced_diatonic_number - 1]
+        self._semitones_unadj = self._reduced_semitones + self.prototype._block_size * self._octave_offset
+
+        # Form the underlying unreduced and reduced generalized intervals
+        if self._interval_direction == '+':
+            self._geninterval = geninterval(self._semitones_unadj, self._chromatic_offset)
+            self._geninterval_reduced = geninterval(self._reduced_semitones, self._chromatic_offset)
+        elif self._interval_direction == '-':
+            self._geninterval = ~geninterval(self._semitones_unadj, self._chromatic_offset)
+            self._geninterval_reduced = ~geninterval(self._reduced_semitones, self._chromatic_offset)
+     
+    def __repr__(self):
+        return "interval(" + self._interval + ")"
+    
+    def reduce(self):
+        return interval(self._interval_type + str(self._reduced_diatonic_number) + self._interval_direction)
@@ -0,0 +1,29 @@
+"""
+Scratch examples for tones_and_intervals.py, moved out of the module so that nothing runs when it's imported
+(or run). Run this from the top of the repository with
+
+    PYTHONPATH=. python old/tones_and_intervals_scratch.py
+"""
+
+
+from musical_structure_generator.tones_and_intervals import *
+
+
+a = geninterval(-13, 5)
+b = geninterval(24, 100)
+print(a > b)
+
+print(semitones_to_diasteps(11))
+print(interval('p2+') + interval('p6+'))
+print(interval('p2+') < interval('p1+'))
+
+c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+print(c_ionian.absolute_scale_repr())
+
+#iss = scale(['p2+', 'p2+', 'd3+', 'p2+', 'p2+'], 'd3+', [2, 3, 5, 6, 7, 9])
+#iss.absolute_scale_repr()
+#iss._degree_list
+
+print(get_attrs(50))
+
+richter_tuned_harmonica = harmonica(richter_tuning(), "c,")
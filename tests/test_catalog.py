@@ -0,0 +1,45 @@
+import pytest
+
+from musical_structure_generator import scale, scale_catalog, pitch_class_densities
+
+
+c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+whole_tone = scale(['p1+', 'p2+', 'p2+', 'p2+', 'p2+', 'p2+'], 'p2+', [1, 2, 3, 4, 6, 7, 8])
+lydian_tetrachord = scale(['p1+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5])
+
+
+def make_catalog():
+    return scale_catalog(c_ionian.all_modes() + [whole_tone, lydian_tetrachord],
+                         names=['mode ' + str(m) for m in range(1, 8)] + ['whole tone', 'lydian tetrachord'])
+
+
+def test_columns():
+    catalog = make_catalog()
+    assert catalog.column('note_count').tolist() == [7]*7 + [6, 4]
+    assert catalog.column('widest_step')[7] == 2
+    assert catalog.column('density')[0] == pytest.approx(7/12)
+
+
+def test_queries_match_brute_force():
+    catalog = make_catalog()
+    assert catalog.query(max_step='p2+').tolist() == list(range(9))
+    assert catalog.query(max_step='d2+').tolist() == []
+    assert catalog.query(max_notes=6).tolist() == [7, 8]
+    tritone = catalog.query(contains=['a4+']).tolist()
+    assert tritone == [i for i, s in enumerate(catalog) if s.pitch_class_mask() >> 6 & 1]
+    assert [catalog.index(s) for s in catalog.select(min_density=0.5, has_intervals=['d2+'])] == list(range(7))
+
+
+def test_index_finds_lazy_views():
+    catalog = make_catalog()
+    assert catalog.index(lydian_tetrachord) == 8
+    catalog.add(lydian_tetrachord + lydian_tetrachord, name='two tetrachords')
+    assert catalog.index((lydian_tetrachord*2).materialize()) == 9
+    assert lydian_tetrachord*2 in catalog
+
+
+def test_pitch_class_densities():
+    scales = [c_ionian, whole_tone, lydian_tetrachord]
+    densities = pitch_class_densities(scales)
+    assert densities['density'].tolist() == [s.compute_density() for s in scales]
+    assert densities['pitch_class_mask'].tolist() == [s.pitch_class_mask() for s in scales]
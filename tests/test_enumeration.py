@@ -0,0 +1,57 @@
+import itertools
+
+from musical_structure_generator import enumerate_scales, enumerate_scales_parallel, dereference_semitones
+
+
+alphabet = ['d2+', 'p2+', 'a2+']
+
+
+def spellable(num_semitones, degree):
+    try:
+        dereference_semitones(num_semitones, degree)
+        return True
+    except ValueError:
+        return False
+
+
+def brute_force_heptatonic():
+    """
+    Every octave-repeating, rooted, spellable 7-note scale of seconds from alphabet, the slow way: 6 steps between
+    the notes and a continuation offset that add up to an octave
+    """
+    
+    semitones = {'d2+': 1, 'p2+': 2, 'a2+': 3}
+    found = set()
+    for steps in itertools.product(alphabet, repeat=7):
+        positions = list(itertools.accumulate(semitones[step] for step in steps))
+        if positions[-1] == 12 and all(spellable(position, degree) for degree, position in enumerate(positions[:-1], 2)):
+            found.add(steps)
+    return found
+
+
+def test_heptatonic_scales_of_seconds_match_brute_force():
+    scales = list(enumerate_scales(alphabet, min_notes=7, max_notes=7, period='p8+'))
+    as_steps = {tuple(str(step) for step in s[1:]) + (str(s._continuation_offset),) for s in scales}
+    assert as_steps == brute_force_heptatonic()
+    assert len(scales) == len(set(scales))
+
+
+def test_parallel_matches_serial():
+    serial = list(enumerate_scales(alphabet, min_notes=5, max_notes=8, period='p8+'))
+    parallel = list(enumerate_scales_parallel(alphabet, min_notes=5, max_notes=8, period='p8+', processes=2, shard_count=7))
+    assert len(parallel) == len(serial) == len(set(parallel))
+    assert set(parallel) == set(serial)
+
+
+def test_shards_partition_the_search():
+    serial = set(enumerate_scales(alphabet, min_notes=5, max_notes=8, period='p8+'))
+    shards = [list(enumerate_scales(alphabet, min_notes=5, max_notes=8, period='p8+', shard=(i, 3))) for i in range(3)]
+    assert sum(len(shard) for shard in shards) == len(serial)
+    assert set().union(*shards) == serial
+
+
+def test_constraints_prune():
+    for s in enumerate_scales(['p2+', 'd3+', 'p3+'], max_notes=5, max_span='p6+', max_step='d3+'):
+        assert len(s) <= 5
+        assert len(s.scale_span()) <= 9
+        assert all(len(step) <= 3 for step in list(s)[1:])
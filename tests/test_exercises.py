@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from musical_structure_generator import scale, make_exercise, exercise_book, exercise_patterns
+
+
+c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+harmonic_minor = scale(['p1+', 'p2+', 'd2+', 'p2+', 'p2+', 'd2+', 'a2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+
+
+def test_scale_goes_up_and_back():
+    assert ' '.join(make_exercise(c_ionian.get_mode(2), "d'", 'scale').notes) == "d' e' f' g' a' b' c'' d'' c'' b' a' g' f' e' d'"
+
+
+def test_thirds():
+    notes = make_exercise(c_ionian, "c'", 'thirds').notes
+    assert notes[:4] == ["c'", "e'", "d'", "f'"]
+    assert notes[-4:] == ["f'", "d'", "e'", "c'"]
+
+
+def test_enclosures_are_spelled_chromatically():
+    notes = make_exercise(c_ionian, "c'", 'enclosures').notes
+    assert notes[3:6] == ["e'", "cis'", "d'"]
+    assert notes[18:21] == ["c''", "ais'", "b'"]
+    assert make_exercise(harmonic_minor, "ees'", 'enclosures').notes[:6] == ["f'", "d'", "ees'", "ges'", "e'", "f'"]
+
+
+def test_numpy_integers_in_patterns():
+    pattern = ((np.int64(0), np.int8(2)), (0, -2))
+    assert make_exercise(c_ionian, "c'", 'thirds', pattern).notes == make_exercise(c_ionian, "c'", 'thirds').notes
+
+
+def test_bad_patterns_raise():
+    with pytest.raises(ValueError):
+        list(exercise_book(c_ionian, patterns={'bad': ((0, 'x'), (0,))}))
+
+
+@pytest.mark.parametrize('pattern', [((0, 8), (0, 8)), ((0, 9), (0, -9))])
+def test_patterns_that_dont_fit_raise(pattern):
+    with pytest.raises(ValueError, match="doesn't fit"):
+        make_exercise(c_ionian, "c'", 'too wide', pattern)
+    assert len(make_exercise(c_ionian, "c'", 'wide enough', pattern, num_octaves=2).notes) > 0
+
+
+def test_book_is_lazy_and_complete():
+    book = exercise_book([c_ionian, harmonic_minor])
+    first = next(book)
+    assert (first.mode_number, first.tonic, first.pattern_name) == (1, "c'", 'scale')
+    assert 1 + sum(1 for exercise in book) == 2*7*12*len(exercise_patterns)
+
+
+def test_book_takes_any_iterable_of_scales():
+    from_generator = exercise_book((s for s in [c_ionian, harmonic_minor]), tonics=["c'"])
+    from_list = exercise_book([c_ionian, harmonic_minor], tonics=["c'"])
+    assert [e.notes for e in from_generator] == [e.notes for e in from_list]
+    assert sum(1 for exercise in exercise_book(c_ionian*2, tonics=["c'"])) == 14*len(exercise_patterns)
+
+
+def test_unnameable_exercises_are_skipped():
+    exercises = list(exercise_book(harmonic_minor, tonics=["gis'"]))
+    assert 0 < len(exercises) < 7*len(exercise_patterns)
+
+
+def test_bars():
+    exercise = make_exercise(c_ionian, "c'", '1-2-3-1')
+    bars = list(exercise.bars(8))
+    assert sum(bars, []) == exercise.notes
+    assert all(len(bar) == 8 for bar in bars[:-1])
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from musical_structure_generator import IntervalArray, GenIntervalArray, interval, geninterval
+
+
+def test_lattice_addition_is_spelled():
+    thirds = IntervalArray.from_intervals(['p2+', 'd2+', 'p2+']) + 'p2+'
+    assert thirds.to_strings().tolist() == ['p3+', 'd3+', 'p3+']
+
+
+def test_round_trip_through_strings():
+    names = ['p1+', 'p4+', 'a5-', 'd8+', 'p9+', 'a1-']
+    assert IntervalArray.from_intervals(names).to_strings().tolist() == names
+
+
+def test_unnameable_points():
+    doubly_diminished = IntervalArray.from_intervals(['d2+']) + 'd2+'
+    assert not doubly_diminished.is_nameable().any()
+    with pytest.raises(ValueError):
+        doubly_diminished.to_strings()
+
+
+def test_matches_scalar_widths():
+    names = ['p1+', 'p4+', 'a5-', 'd8+', 'p9+', 'd3-']
+    assert IntervalArray.from_intervals(names).width().tolist() == [interval(name)._interval_sign*len(interval(name)) for name in names]
+
+
+def test_gen_interval_array_matches_geninterval():
+    array = GenIntervalArray([7, 5, -3], [1, -1, 0])
+    scalars = [geninterval(7, 1), geninterval(5, -1), geninterval(-3, 0)]
+    assert (array + array).to_genintervals() == [a + a for a in scalars]
+    assert array.reduce(12).distance.tolist() == [7, 5, 9]
+
+
+def test_gen_interval_array_rejects_non_integers():
+    array = GenIntervalArray([1, 2], [0, 1])
+    assert array.transpose(np.int8(3)).distance.tolist() == [4, 5]
+    with pytest.raises(ValueError):
+        array.transpose(1.5)
+    with pytest.raises(ValueError):
+        array.adjust([0.5, 1])
+    with pytest.raises(ValueError):
+        GenIntervalArray([1.5], [0])
+    with pytest.raises(TypeError):
+        len(GenIntervalArray(1, 0))
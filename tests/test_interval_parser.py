@@ -0,0 +1,32 @@
+import pytest
+
+from musical_structure_generator import parse_interval_text, parse_interval_json
+
+
+def test_text_library():
+    library = parse_interval_text('p1+ p2+ p2+ d2+\n\np2+ d2+ a4- p3-\n')
+    assert len(library) == 2
+    assert [str(i) for i in library[1]] == ['p2+', 'd2+', 'a4-', 'p3-']
+    assert library.errors == []
+    assert library.interval_array().to_strings().tolist()[:2] == ['p1+', 'p2+']
+
+
+def test_text_errors_are_located():
+    library = parse_interval_text('p1+ p2+\n  d1+ p3+ d1+')
+    assert [(line, column, token) for line, column, token, message in library.errors] == [(2, 3, 'd1+'), (2, 11, 'd1+')]
+    assert [str(i) for i in library[1]] == ['p3+']
+    with pytest.raises(ValueError):
+        parse_interval_text('p1+ a7+', strict=True)
+
+
+def test_json_strings_are_decoded():
+    library = parse_interval_json(r'["p1+\tp2+", "p2+ d1+"]')
+    assert [str(i) for i in library[0]] == ['p1+', 'p2+']
+    assert [(line, column, token) for line, column, token, message in library.errors] == [(1, 19, 'd1+')]
+
+
+def test_json_errors_map_back_through_escapes():
+    library = parse_interval_json('{"a": "p1+ a7+",\n "b": ["x\\"y d2+", "p2+"]}')
+    assert library.names == ['a', 'b']
+    assert [(line, column, token) for line, column, token, message in library.errors] == [(1, 12, 'a7+'), (2, 9, 'x"y')]
+    assert [str(i) for i in library[1]] == ['d2+', 'p2+']
@@ -0,0 +1,94 @@
+import pickle
+
+import pytest
+
+from musical_structure_generator import (interval, geninterval, diatonic_prototype, major_scale_prototype, use_diatonic_prototype,
+                                        sorted_interval_collection, semitones_to_diasteps, dereference_semitones, instrumentation)
+
+
+def test_intervals_are_interned():
+    assert interval('p4+') is interval('p4+')
+    assert pickle.loads(pickle.dumps(interval('a5-'))) is interval('a5-')
+
+
+def test_equal_width_intervals_hash_equal():
+    assert interval('a1+') == interval('d2+')
+    assert hash(interval('a1+')) == hash(interval('d2+'))
+    assert interval('a4+') != interval('a4-')
+    assert len({interval('a4+'), interval('d5+')}) == 1
+
+
+def test_invalid_intervals_are_rejected():
+    for name in ('d1+', 'a7+', 'p3+x', 'q2+', 'p0+'):
+        with pytest.raises(ValueError):
+            interval(name)
+
+
+def test_addition_gives_every_spelling():
+    assert [str(i) for i in interval('p2+') + interval('p2+')] == ['p3+', 'd4+']
+    assert [str(i) for i in interval('p5+') + interval('p4+')] == ['p8+']
+    assert [str(i) for i in interval('p3+') + interval('d3-')] == ['a1+', 'd2+']
+
+
+def test_semitones_to_diasteps_returns_fresh_lists():
+    names = semitones_to_diasteps(4)
+    assert [str(name) for name in names] == ['p3+', 'd4+']
+    names.append(interval('p1+'))
+    names.sort(key=interval.sort_key)
+    assert [str(name) for name in semitones_to_diasteps(4)] == ['p3+', 'd4+']
+
+
+def test_dereference_semitones():
+    assert str(dereference_semitones(4, 3)) == 'p3+'
+    assert str(dereference_semitones(4, 4)) == 'd4+'
+    assert str(dereference_semitones(-5, 4)) == 'p4-'
+    with pytest.raises(ValueError):
+        dereference_semitones(2, 3)
+
+
+def test_sort_key_orders_by_width_then_spelling():
+    names = ['p5+', 'a4+', 'd5+', 'p1+', 'p2-', 'a1+', 'd2+']
+    ordered = sorted((interval(name) for name in names), key=interval.sort_key)
+    widths = [interval._interval_sign*len(interval) for interval in ordered]
+    assert widths == sorted(widths)
+    assert sorted(ordered, key=interval.sort_key) == ordered
+
+
+def test_sorted_interval_collection_range_queries():
+    collection = sorted_interval_collection(interval(name) for name in ['p8+', 'p1+', 'p3+', 'p5+', 'a4+', 'd5+', 'p2-'])
+    assert [str(i) for i in collection.between('p3+', 'p5+')] in (['p3+', 'a4+', 'd5+', 'p5+'], ['p3+', 'd5+', 'a4+', 'p5+'])
+    assert collection.count_between('p1+', 'p8+') == 6
+    assert interval('p2-') in collection
+    assert interval('p4+') not in collection
+
+
+def test_geninterval_group():
+    a = geninterval(7, 1)
+    b = geninterval(5, -1)
+    assert a + b == geninterval(12, 0)
+    assert a + ~a == geninterval(0, 0)
+
+
+def test_prototypes_have_their_own_tables():
+    minor_prototype = diatonic_prototype([0, 2, 1, 2, 2, 2, 2], 1, ['C', 'D', 'Eb', 'F', 'G', 'A', 'B'], [0, 4, 5])
+    try:
+        use_diatonic_prototype(minor_prototype)
+        assert len(interval('p3+')) == 3
+        assert len(interval('a3+')) == 4
+    finally:
+        use_diatonic_prototype(major_scale_prototype)
+    assert len(interval('p3+')) == 4
+
+
+def test_instrumentation_is_opt_in():
+    instrumentation.reset()
+    interval('p2+') + interval('p3+')
+    assert instrumentation.snapshot()['counters'] == {}
+    
+    instrumentation.enable()
+    try:
+        interval('p2+') + interval('p3+')
+        assert instrumentation.snapshot()['counters']
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
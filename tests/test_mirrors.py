@@ -0,0 +1,48 @@
+import itertools
+
+import pytest
+
+from musical_structure_generator import scale, pitch_names, pitches_from_names, reflect, mirror_voices, mirror_scale_voices
+
+
+c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+
+
+def test_pitch_names_round_trip():
+    names = ["c'", 'bes', "fis''", 'c,,', 'eeses', 'bis']
+    assert pitch_names(pitches_from_names(names)) == names
+
+
+def test_c_major_mirrors_to_itself_around_d():
+    pitches = pitches_from_names(["c'", "d'", "e'", "f'", "g'", "a'", "b'"])
+    assert pitch_names(reflect(pitches, "d'")) == ["e'", "d'", "c'", 'b', 'a', 'g', 'f']
+
+
+def test_axis_pair_keeps_spelling():
+    assert list(mirror_voices(['p1+', 'p2+', 'd3+', 'p3+'], "c'", "ees'")) == [
+        ("c'", "ees'"), ("d'", "des'"), ("ees'", "c'"), ("e'", "ces'")]
+
+
+def test_mirror_voices_streams_iter_absolute():
+    # An endless line of (interval, degree) pairs, only pulled as far as we need
+    pairs = list(itertools.islice(mirror_voices(c_ionian.iter_absolute(), "d'", chunk_size=3), 10))
+    assert pairs[:3] == [("c'", "e'"), ("d'", "d'"), ("e'", "c'")]
+    assert pairs[7:] == [("c''", 'e'), ("d''", 'd'), ("e''", 'c')]
+
+
+def test_mirror_scale_voices_matches_streaming_path():
+    for direction in ('up', 'down'):
+        from_tables = list(mirror_scale_voices(c_ionian, 'ees', axis='p5+', num_notes=50, direction=direction, chunk_size=7))
+        streamed = list(itertools.islice(mirror_voices(c_ionian.iter_absolute(direction), pitches_from_names(['ees']) + 'p5+',
+                                                       reference='ees'), 50))
+        assert from_tables == streamed
+
+
+def test_mirror_scale_voices_in_e_flat():
+    assert list(mirror_scale_voices(c_ionian, "ees'", axis='p2+', num_notes=4)) == [
+        ("ees'", "g'"), ("f'", "f'"), ("g'", "ees'"), ("aes'", "d'")]
+
+
+def test_unnameable_pitch_raises():
+    with pytest.raises(ValueError):
+        pitch_names(reflect(pitches_from_names(['eeses']), "gisis'"))
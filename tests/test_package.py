@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import musical_structure_generator
+from musical_structure_generator.import_budget import measure_import_time
+
+
+def test_public_names_resolve():
+    for name in musical_structure_generator.__all__:
+        assert getattr(musical_structure_generator, name) is not None
+
+
+def test_imports_stay_light():
+    for module in ('musical_structure_generator', 'musical_structure_generator.tones_and_intervals'):
+        elapsed, loaded_dependencies = measure_import_time(module, repeats=1)
+        assert loaded_dependencies == []
+
+
+def test_importing_does_nothing():
+    output = subprocess.run([sys.executable, '-c', 'import musical_structure_generator.tones_and_intervals'],
+                            capture_output=True, text=True, check=True)
+    assert output.stdout == '' and output.stderr == ''
@@ -0,0 +1,125 @@
+import copy
+import itertools
+import pickle
+
+import pytest
+
+from musical_structure_generator import scale, periodic_scale, scale_rope, step_statistics, instrumentation
+
+
+c_ionian = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+lydian_tetrachord = scale(['p1+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5])
+
+
+def test_value_semantics():
+    same = scale(['p1+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+'], 'd2+', [1, 2, 3, 4, 5, 6, 7, 8])
+    assert same == c_ionian and hash(same) == hash(c_ionian)
+    assert len({same, c_ionian}) == 1
+    assert pickle.loads(pickle.dumps(c_ionian)) == c_ionian
+    assert copy.deepcopy(c_ionian) is c_ionian
+
+
+def test_scales_are_immutable():
+    with pytest.raises(AttributeError):
+        c_ionian._step_codes = None
+    with pytest.raises(AttributeError):
+        del c_ionian._degrees
+
+
+def test_canonical_respells_by_degree():
+    assert scale(['p1+', 'a2+'], 'd2+', [1, 3, 4]).canonical() == scale(['p1+', 'd3+'], 'd2+', [1, 3, 4])
+
+
+def test_every_build_is_timed():
+    fresh = scale(['p1+', 'p2+', 'd2+', 'p2+', 'p2+', 'd2+', 'p2+'], 'p2+', [1, 2, 3, 4, 5, 6, 7, 8])
+    rope = lydian_tetrachord + lydian_tetrachord
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        # One scale per mode, all made from step codes, and one for the rope
+        fresh.get_mode(2)
+        rope.materialize()
+        assert instrumentation.snapshot()['timers']['scale.build']['calls'] == len(fresh) + 1
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def test_addition_joins_periods():
+    both = lydian_tetrachord + lydian_tetrachord
+    assert isinstance(both, scale_rope)
+    assert [str(step) for step in both] == ['p1+', 'p2+', 'p2+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+']
+    assert both.degree_list() == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert str(both._continuation_offset) == 'd2+'
+
+
+def test_lazy_views_compare_and_hash_like_scales():
+    rope = lydian_tetrachord + lydian_tetrachord
+    repeated = lydian_tetrachord*2
+    assert isinstance(repeated, periodic_scale)
+    assert rope == lydian_tetrachord + lydian_tetrachord
+    assert rope == rope.materialize() and rope.materialize() == rope
+    assert repeated == rope and rope == repeated
+    assert len({rope, lydian_tetrachord + lydian_tetrachord, repeated, rope.materialize()}) == 1
+    assert lydian_tetrachord*3 == lydian_tetrachord*3
+    assert rope != lydian_tetrachord
+
+
+def test_rope_matches_left_to_right_addition():
+    parts = [lydian_tetrachord, c_ionian, lydian_tetrachord*3, c_ionian.get_mode(2)]
+    rope = parts[0]
+    for part in parts[1:]:
+        rope = rope + part
+    other_grouping = parts[0] + (parts[1] + (parts[2] + parts[3]))
+    assert rope == other_grouping
+    assert list(rope) == list(rope.materialize())
+    assert [rope.degree(i) for i in range(len(rope))] == rope.materialize()._degree_list[:-1]
+
+
+def test_multiplication():
+    assert c_ionian*1 is c_ionian
+    assert (c_ionian*3).materialize() == (c_ionian + c_ionian + c_ionian).materialize()
+    assert (c_ionian*2)*3 == c_ionian*6
+    for bad in (0, -1, 1.5):
+        with pytest.raises(ValueError):
+            c_ionian*bad
+
+
+def test_modes():
+    dorian = c_ionian.get_mode(2)
+    assert [str(step) for step in dorian] == ['p1+', 'p2+', 'd2+', 'p2+', 'p2+', 'p2+', 'd2+']
+    assert str(dorian._continuation_offset) == 'p2+'
+    assert c_ionian.get_mode(8) == c_ionian
+    assert c_ionian.all_modes() is c_ionian.all_modes()
+    assert all(mode.get_mode(len(mode) - m + 2) == c_ionian for m, mode in enumerate(c_ionian.all_modes(), 1) if m > 1)
+
+
+def test_absolute_positions():
+    assert [str(i) for i in c_ionian.absolute_scale_repr()] == ['p1+', 'p2+', 'p3+', 'p4+', 'p5+', 'p6+', 'p7+']
+    assert c_ionian.absolute_position(2, 1) == (16, 10)
+    assert str(c_ionian.absolute_interval(2, -1)) == 'd6-'
+    assert c_ionian.absolute_position(7) == c_ionian.absolute_position(0, 1)
+
+
+def test_iter_absolute():
+    up = [(str(i), degree) for i, degree in itertools.islice(c_ionian.iter_absolute(), 9)]
+    assert up[7:] == [('p8+', 8), ('p9+', 9)]
+    down = [(str(i), degree) for i, degree in itertools.islice(c_ionian.iter_absolute('down'), 3)]
+    assert down == [('p1+', 1), ('d2-', 0), ('d3-', -1)]
+    assert str(next(c_ionian.iter_absolute(start_period=3))[0]) == 'p22+'
+
+
+def test_pitch_class_mask_and_density():
+    assert c_ionian.pitch_class_mask() == 0b101010110101
+    assert c_ionian.compute_density() == 7/12
+
+
+def test_spans():
+    assert str(c_ionian.scale_span()) == 'p7+'
+    assert str(c_ionian.widest_consec_interval()) == 'p2+'
+    statistics = step_statistics(c_ionian*4)
+    assert statistics.span() == 11 + 36
+    steps = statistics.steps.tolist()
+    assert statistics.window_spans(3).tolist() == [sum(steps[i:i + 2]) for i in range(len(steps) - 1)]
+    assert statistics.sliding_max(4).tolist() == [max(steps[i:i + 4]) for i in range(len(steps) - 3)]
+    assert statistics.span(2, 5) == 5
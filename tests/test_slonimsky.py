@@ -0,0 +1,45 @@
+import collections
+import itertools
+
+from musical_structure_generator import equal_divisions, division_table, slonimsky_scale, thesaurus
+
+
+def test_equal_divisions():
+    assert equal_divisions(1) == [(1, 2), (1, 3), (1, 4), (1, 6), (1, 12)]
+    assert (2, 3) in equal_divisions(2) and (2, 4) not in equal_divisions(2)
+    assert division_table(5, 12) == tuple(range(0, 60, 5))
+
+
+def test_tritone_interpolation():
+    tritone = slonimsky_scale(1, 2, (1,))
+    assert [str(step) for step in tritone] == ['p1+', 'd2+', 'a3+', 'd2+']
+    assert str(tritone._continuation_offset) == 'p4+'
+    assert [str(i) for i in tritone.absolute_scale_repr()] == ['p1+', 'd2+', 'a4+', 'p5+']
+
+
+def test_infrapolation_goes_below():
+    assert [str(i) for i in slonimsky_scale(1, 2, (-1,)).absolute_scale_repr()] == ['p1+', 'd2-', 'a4+', 'p4+']
+
+
+def test_whole_tone_spans_the_octave():
+    whole_tone = slonimsky_scale(1, 6)
+    up = [str(i) for i, degree in itertools.islice(whole_tone.iter_absolute(), 13)]
+    assert up == ['p1+', 'p2+', 'p3+', 'a4+', 'd6+', 'd7+', 'p8+', 'p9+', 'p10+', 'a11+', 'd13+', 'd14+', 'p15+']
+
+
+def test_scales_are_memoized():
+    assert slonimsky_scale(1, 3, (1, 2)) is slonimsky_scale(1, 3, [1, 2])
+
+
+def test_thesaurus_renders_and_filters():
+    patterns = list(thesaurus(max_octaves=2))
+    categories = collections.Counter(pattern.category for pattern in patterns)
+    assert len(patterns) > 500
+    assert sum(1 for pattern in thesaurus()) > 1000
+    assert categories['principal'] == 6
+    for pattern in patterns[::50]:
+        assert len(pattern.scale.absolute_scale_repr()) == len(pattern.scale)
+    
+    for pattern in thesaurus(max_octaves=2, max_step=3, monotonic=True):
+        assert all(0 < step <= 3 for step in pattern.step_sizes())
+    assert all(pattern.category == 'ultrapolation' for pattern in thesaurus(max_octaves=2, categories=['ultrapolation']))
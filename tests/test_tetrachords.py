@@ -0,0 +1,83 @@
+import itertools
+import os
+
+import pytest
+
+from musical_structure_generator import (major_tetrachord, tetrachord_scale, stack_tetrachords, search_tetrachord_space,
+                                        load_tetrachord_search)
+from musical_structure_generator.tetrachord_search import shard_path
+
+
+def old_stacking(starting_pitch, shape, max_stacks=100):
+    """
+    The stacking in old/harmonica_relationship_calculator.py, done the slow way: how many tetrachords until all
+    12 pitch classes turn up, or None
+    """
+    
+    notes = []
+    position = starting_pitch
+    for stack in range(max_stacks):
+        if stack:
+            position += shape[3]
+        tetrachord = [position, position + shape[0], position + shape[0] + shape[1], position + sum(shape[:3])]
+        position = tetrachord[-1]
+        notes += tetrachord
+        if len({note % 12 for note in notes}) == 12:
+            return stack + 1
+    return None
+
+
+def test_major_tetrachord_is_hyper_lydian():
+    assert [str(step) for step in tetrachord_scale(major_tetrachord)] == ['p1+', 'p2+', 'p2+', 'd2+']
+    stack = stack_tetrachords(major_tetrachord)
+    assert stack.full_coverage and stack.num_stacks == 7 and stack.cycle_length == 12
+    assert stack.density_curve() == [4, 7, 8, 9, 10, 11, 12]
+    assert [str(i) for i in stack.scale.materialize().absolute_scale_repr()[4:8]] == ['p5+', 'p6+', 'p7+', 'p8+']
+
+
+def test_cycles_stop_early():
+    stack = stack_tetrachords([2, 2, 1, 1])
+    assert not stack.full_coverage
+    assert stack.num_stacks == stack.cycle_length == 2
+    assert stack.missing_pitch_classes() == [1, 3, 7, 9]
+
+
+def test_matches_old_stacking_for_every_shape():
+    for shape in itertools.product(range(1, 4), repeat=4):
+        for starting_pitch_class in range(12):
+            stack = stack_tetrachords(shape, starting_pitch_class)
+            expected = old_stacking(starting_pitch_class, shape)
+            assert stack.full_coverage == (expected is not None)
+            if expected is not None:
+                assert stack.num_stacks == expected
+
+
+def test_steps_have_to_go_up():
+    with pytest.raises(ValueError):
+        tetrachord_scale([2, 0, 1, 2])
+    with pytest.raises(ValueError):
+        tetrachord_scale([2, 2, 1])
+
+
+def test_search_matches_engine_and_resumes(tmp_path):
+    directory = str(tmp_path/'search')
+    assert search_tetrachord_space(directory, max_step=3, processes=2, shard_count=5) == 5
+    rows = load_tetrachord_search(directory)
+    assert len(rows) == 3**4*12
+    
+    for row in rows[::37]:
+        stack = stack_tetrachords(tuple(int(step) for step in row['shape']), int(row['starting_pitch_class']))
+        assert (row['num_stacks'], row['full_coverage'], row['cycle_length']) == (stack.num_stacks, stack.full_coverage, stack.cycle_length)
+        assert row['density_curve'][:stack.num_stacks].tolist() == stack.density_curve()
+        assert [k for k in range(12) if row['missing_mask'] >> k & 1] == stack.missing_pitch_classes()
+    
+    # Interrupt it: lose two shards, and only those get searched again
+    os.remove(shard_path(directory, 1))
+    os.remove(shard_path(directory, 3))
+    with pytest.raises(ValueError):
+        load_tetrachord_search(directory)
+    assert search_tetrachord_space(directory, max_step=3, processes=2) == 2
+    assert (load_tetrachord_search(directory) == rows).all()
+    
+    with pytest.raises(ValueError):
+        search_tetrachord_space(directory, max_step=4)